@@ -5,6 +5,16 @@ import json
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut
 
+from common.coverage import coverage_table, requested_radii
+from common.geometry import gemeinde_geometry
+from common.grid import grid_counts, requested_grid
+from common.instrumentation import stage, run_instrumented
+from common.mapping import get_gemeinde_by_schluessel, normalize_gemeinde_name
+from common.output import write_result
+from common.planungsraeume import AREA_COLUMNS, PLANUNGSRAEUME_FILE, assign_areas, read_planungsraeume
+from common.population import add_per_1000, population_index
+from common.spatial import polygon_index
+
 FILENAME = "Altersplanung_Anbieterverzeichnis.xlsx"
 INPUT_DIR = "data"
 OUTPUT_DIR = "result"
@@ -13,6 +23,9 @@ CACHE_FILE = "geocode_cache.json"
 
 INPUT_PATH = os.path.join(INPUT_DIR, FILENAME)
 OUTPUT_PATH = os.path.join(OUTPUT_DIR, "altersplanung.xlsx")
+GEMEINDEN_OUTPUT_PATH = os.path.join(OUTPUT_DIR, "altersplanung_gemeinden.xlsx")
+COVERAGE_OUTPUT_PATH = os.path.join(OUTPUT_DIR, "altersplanung_versorgung.xlsx")
+GRID_OUTPUT_PATH = os.path.join(OUTPUT_DIR, "altersplanung_raster.xlsx")
 
 # Initialize geocoder with custom user-agent to avoid being blocked
 geolocator = Nominatim(user_agent="superset-mapper")
@@ -71,6 +84,51 @@ def save_geocode_cache():
     with open(CACHE_FILE, "w", encoding="utf-8") as f:
         json.dump(updated_cache, f, ensure_ascii=False, indent=2)
 
+def assign_locations(df):
+    """
+    Adds the Gemeindekennziffer of the Gemeinde polygon each provider lies in (point in
+    polygon on latitude/longitude) and, if the Planungsräume file is present, the
+    planning areas of that Gemeinde and PLZ. Providers without coordinates or outside
+    the district get empty values.
+    """
+    df["gemeindekennziffer"] = polygon_index().locate_keys(df["longitude"], df["latitude"])
+    unassigned = df["gemeindekennziffer"].isnull().sum()
+    if unassigned:
+        print(f"(!) {unassigned} provider(s) outside the Gemeinde boundaries or without coordinates")
+
+    if PLANUNGSRAEUME_FILE.exists():
+        areas = assign_areas(df["gemeindekennziffer"], df["PLZ"], read_planungsraeume(PLANUNGSRAEUME_FILE))
+        df = pd.concat([df, areas], axis=1)
+    return df
+
+
+def providers_per_gemeinde(df):
+    """
+    Number of providers per Gemeinde and Branche in the latest year of the population
+    index, per 1,000 inhabitants and per 1,000 inhabitants aged 65+.
+    Returns None while the population index is not available.
+    """
+    index = population_index()
+    if index is None:
+        return None
+
+    counts = df.groupby(["gemeinde", "Branche"]).size().rename("anbieter").reset_index()
+    counts["jahr"] = int(index.index.get_level_values("jahr").max())
+    counts = add_per_1000(counts, ["anbieter"], name="{}_je_1000_ew")
+    counts = add_per_1000(counts, ["anbieter"], name="{}_je_1000_65plus", population_column="einwohner_65plus", min_age=65)
+    return counts
+
+
+def coverage_per_gemeinde(df):
+    """
+    Distance from every Gemeinde centroid to the nearest provider of each Branche and
+    the number of providers within the coverage radii (`--radius-km=5,10`).
+    """
+    targets = gemeinde_geometry()[["longitude", "latitude"]].reset_index()
+    targets.insert(1, "gemeinde", [get_gemeinde_by_schluessel(int(k)) for k in targets["Gemeindekennziffer"]])
+    return coverage_table(df, targets, requested_radii())
+
+
 def parse_adressen():
     """
     Main parsing logic:
@@ -102,7 +160,9 @@ def parse_adressen():
     geocode_cache = {str(k): tuple(v) for k, v in geocode_cache.items()}
 
     # Read data
-    df = pd.read_excel(INPUT_PATH, sheet_name=SHEET_NAME, dtype=str)
+    with stage("extract") as s:
+        df = pd.read_excel(INPUT_PATH, sheet_name=SHEET_NAME, dtype=str)
+        s.rows = len(df)
 
     # Ensure required fields are present and cleaned
     df = df.dropna(subset=["Anschrift", "PLZ", "Ort"])
@@ -121,10 +181,20 @@ def parse_adressen():
 
     # Geocode each address row by row
     length = len(df)
-    for i, row in df.iterrows():
-        coords = geocode_address(row["Address"], i, length)
-        df.at[i, "latitude"] = coords[0]
-        df.at[i, "longitude"] = coords[1]
+    with stage("geocode", rows=length):
+        for i, row in df.iterrows():
+            coords = geocode_address(row["Address"], i, length)
+            df.at[i, "latitude"] = coords[0]
+            df.at[i, "longitude"] = coords[1]
+
+    # Gemeinde of the provider from its Ort
+    df["gemeinde"] = df["Ort"].map({ort: normalize_gemeinde_name(ort) for ort in df["Ort"].unique()})
+    df["latitude"] = pd.to_numeric(df["latitude"])
+    df["longitude"] = pd.to_numeric(df["longitude"])
+
+    # Gemeinde polygon and planning areas the coordinates fall into
+    with stage("assign", rows=len(df)):
+        df = assign_locations(df)
 
     # Keep only relevant columns
     columns_to_keep = [
@@ -132,14 +202,38 @@ def parse_adressen():
         "Anbieter",
         "Anschrift",
         "Address",
+        "gemeinde",
         "latitude",
-        "longitude"
-    ]
+        "longitude",
+        "gemeindekennziffer",
+    ] + [c for c in AREA_COLUMNS if c in df.columns]
     df = df[columns_to_keep]
 
-    df.to_excel(OUTPUT_PATH, index=False)
-    print(f"Result saved to {OUTPUT_PATH}")
+    with stage("write", rows=len(df)):
+        written = write_result(df, OUTPUT_PATH, db_keys=["Address"])
+    print(f"Result saved to {', '.join(written)}")
+
+    with stage("aggregate"):
+        per_gemeinde = providers_per_gemeinde(df)
+    if per_gemeinde is not None:
+        with stage("write", rows=len(per_gemeinde)):
+            written = write_result(per_gemeinde, GEMEINDEN_OUTPUT_PATH, db_keys=["Branche"])
+        print(f"Result saved to {', '.join(written)}")
+
+    with stage("aggregate"):
+        coverage = coverage_per_gemeinde(df)
+    with stage("write", rows=len(coverage)):
+        written = write_result(coverage, COVERAGE_OUTPUT_PATH, db_keys=["Branche"])
+    print(f"Result saved to {', '.join(written)}")
+
+    # Providers per grid cell and Branche for map layers (--grid=square|hex, --grid-km=1,2,5)
+    kind, sizes_km = requested_grid()
+    with stage("aggregate"):
+        grid = grid_counts(df, kind=kind, sizes_km=sizes_km)
+    with stage("write", rows=len(grid)):
+        written = write_result(grid, GRID_OUTPUT_PATH, db_keys=["zelle_km", "Branche"] + list(grid.columns[2:4]))
+    print(f"Result saved to {', '.join(written)}")
 
 # Entrypoint for CLI execution
 if __name__ == "__main__":
-    parse_adressen()
+    run_instrumented(parse_adressen, "altersplanung")
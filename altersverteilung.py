@@ -2,14 +2,22 @@ import pandas as pd
 import os
 import re
 
+from common.age_bands import DEFAULT_BOUNDS, band_totals, requested_bounds
+from common.age_matrix import AgeMatrix
+from common.incremental import process_partitions
+from common.instrumentation import stage, run_instrumented
+from common.mapping import KREIS_SCHLUESSEL
+from common.output import write_result
+from common.schema import apply_schema, concat_tables, report_memory
+
 INPUT_DIR = "data/altersverteilung"
 OUTPUT_DIR = "result"
 OUTPUT_FILENAME = "altersstruktur_wetterau.xlsx"
 
-def extract_summary_by_year(file_path: str) -> dict:
+def extract_ages_by_year(file_path: str) -> pd.DataFrame:
     """
-    Reads a yearly Excel file and extracts total population counts
-    grouped by age category: 0–20, 21–64, and 65+.
+    Reads a yearly Excel file and returns the population per age
+    (columns Jahr, Alter, EW gesamt).
 
     Assumes:
     - File name starts with the year (e.g. "2023 GjS Wetteraukreis mit GKZ.XLSX")
@@ -32,32 +40,25 @@ def extract_summary_by_year(file_path: str) -> dict:
     df["Jahrgang"] = df["Jahrgang"].astype(int)
     df["EW gesamt"] = df["EW gesamt"].astype(int)
     df["Alter"] = year - df["Jahrgang"]
+    df["Jahr"] = year
 
-    # Group population into age buckets
-    count_0_20 = df[df["Alter"] <= 20]["EW gesamt"].sum()
-    count_21_64 = df[(df["Alter"] >= 21) & (df["Alter"] <= 64)]["EW gesamt"].sum()
-    count_65_plus = df[df["Alter"] >= 65]["EW gesamt"].sum()
-
-    return {
-        "Jahr": year,
-        "0 - 20": count_0_20,
-        "21 - 64": count_21_64,
-        "65+": count_65_plus
-    }
+    return apply_schema(df[["Jahr", "Alter", "EW gesamt"]], "altersverteilung")
 
 def main():
     """
     Main execution:
     - Searches for all matching Excel files in the input folder
-    - Extracts demographic summaries from each
-    - Combines and exports as a single Excel summary
+    - Extracts the population per age from each
+      (with --incremental only new or modified year files are read again)
+    - Sums all years into age bands at once (0 - 20, 21 - 64, 65+ or --age-bands=...)
+    - Exports a single Excel summary
     """
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     # Match files like "2023 GjS Wetteraukreis mit GKZ.XLSX"
     all_files = [
         os.path.join(INPUT_DIR, f)
-        for f in os.listdir(INPUT_DIR)
+        for f in sorted(os.listdir(INPUT_DIR))
         if re.match(r"\d{4} GjS Wetteraukreis mit GKZ\.XLSX$", f)
     ]
 
@@ -66,13 +67,26 @@ def main():
         return
 
     # Process each file and combine results
-    summary_data = [extract_summary_by_year(path) for path in all_files]
-    summary_df = pd.DataFrame(summary_data).sort_values(by="Jahr")
+    with stage("extract") as s:
+        ages = concat_tables(process_partitions("altersverteilung", all_files, extract_ages_by_year), "altersverteilung")
+        s.rows = len(ages)
+
+    # District age matrix with one Stichtag per file, used by bevoelkerungsprojektion.py
+    with stage("matrix"):
+        ages["Gemeinde"] = KREIS_SCHLUESSEL
+        ages["Jahrgang"] = ages["Jahr"] - ages["Alter"]
+        AgeMatrix.from_birth_years(ages, sorted(ages["Jahr"].unique().tolist()), year_column="Jahr").save("altersverteilung")
+
+    with stage("aggregate"):
+        bounds = requested_bounds() or DEFAULT_BOUNDS
+        summary_df = band_totals(ages, "Alter", "EW gesamt", bounds, by=["Jahr"])
 
     output_path = os.path.join(OUTPUT_DIR, OUTPUT_FILENAME)
-    summary_df.to_excel(output_path, index=False)
+    report_memory(summary_df, "altersverteilung")
+    with stage("write", rows=len(summary_df)):
+        written = write_result(summary_df, output_path)
 
-    print(f"Result saved to {output_path}")
+    print(f"Result saved to {', '.join(written)}")
 
 if __name__ == "__main__":
-    main()
+    run_instrumented(main, "altersverteilung")
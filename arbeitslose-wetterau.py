@@ -2,10 +2,19 @@ import pandas as pd
 import os
 import re
 
+from common.instrumentation import stage, run_instrumented
+from common.memo import memoize
+from common.output import write_result
+from common.population import add_per_1000
+from common.schema import apply_schema, concat_tables, report_memory
+
 INPUT_DIR = "data/arbeitsortbeschäftigung"
 OUTPUT_DIR = "result"
 OUTPUT_FILENAME = "arbeitslose_wetterau.xlsx"
 
+UNEMPLOYMENT_COLUMNS = ["Insgesamt", "Männer", "Frauen", "SGB III", "SGB II"]
+
+@memoize
 def extract_fixed(file_path: str) -> pd.DataFrame:
     df = pd.read_excel(file_path, sheet_name="Daten", header=None)
 
@@ -40,7 +49,7 @@ def extract_fixed(file_path: str) -> pd.DataFrame:
         }
         rows.append(row)
 
-    return pd.DataFrame(rows)
+    return apply_schema(pd.DataFrame(rows), "arbeitslose_wetterau")
 
 def main():
     os.makedirs(OUTPUT_DIR, exist_ok=True)
@@ -51,25 +60,31 @@ def main():
         if f.endswith(".xlsx") and f.startswith("Arbeitsmarkt-kommunal")
     ]
 
-    result_frames = []
-    for file in all_files:
-        df = extract_fixed(file)
-        result_frames.append(df)
+    with stage("extract") as s:
+        result_frames = []
+        for file in all_files:
+            df = extract_fixed(file)
+            result_frames.append(df)
 
-    final_df = pd.concat(result_frames, ignore_index=True)
+        final_df = concat_tables(result_frames, "arbeitslose_wetterau")
+        s.rows = len(final_df)
 
-    sum_df = final_df.groupby("Jahr").sum(numeric_only=True).reset_index()
-    sum_df["Gemeinde"] = "Wetteraukreis"
+    with stage("aggregate"):
+        sum_df = final_df.groupby("Jahr").sum(numeric_only=True).reset_index()
+        sum_df["Gemeinde"] = "Wetteraukreis"
 
-    columns = ["Gemeinde", "Jahr"] + [col for col in final_df.columns if col not in ["Gemeinde", "Jahr"]]
-    sum_df = sum_df[columns]
+        columns = ["Gemeinde", "Jahr"] + [col for col in final_df.columns if col not in ["Gemeinde", "Jahr"]]
+        sum_df = sum_df[columns]
 
-    final_df = pd.concat([final_df, sum_df], ignore_index=True)
+        final_df = concat_tables([final_df, sum_df], "arbeitslose_wetterau")
+        final_df = add_per_1000(final_df, UNEMPLOYMENT_COLUMNS, name="{} je 1.000 Einwohner", population_column="Einwohner")
 
     output_path = os.path.join(OUTPUT_DIR, OUTPUT_FILENAME)
-    final_df.to_excel(output_path, index=False)
+    report_memory(final_df, "arbeitslose_wetterau")
+    with stage("write", rows=len(final_df)):
+        written = write_result(final_df, output_path)
 
-    print(f"Result saved to {output_path}")
+    print(f"Result saved to {', '.join(written)}")
 
 if __name__ == "__main__":
-    main()
+    run_instrumented(main, "arbeitslose-wetterau")
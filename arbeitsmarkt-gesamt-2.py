@@ -4,11 +4,20 @@ import re
 import logging
 from typing import List
 from common.mapping import normalize_gemeinde_name
+from common.gemband import GEMBAND_DATASET, gemband_files, try_extract_gemband_data
+from common.incremental import process_partitions
+from common.memo import memoize
+from common.merge import merge_tables
+from common.output import write_result
+from common.schema import apply_schema, concat_tables, report_memory
+from common.reshape import melt_frame
+from common.instrumentation import stage, run_instrumented
+from common.timeseries import add_changes, add_rolling_mean, add_shares
 
 INPUT_DIR = "data/arbeitsortbeschäftigung"
-GEMBAND_DIR = "data/gemband"
 OUTPUT_DIR = "result"
 OUTPUT_FILENAME = "arbeitsmarkt_gesamt_2.xlsx"
+KENNZAHLEN_FILENAME = "arbeitsmarkt_gesamt_2_kennzahlen.xlsx"
 
 YEARS = [2020, 2021, 2022, 2023, 2024]
 
@@ -26,12 +35,23 @@ ROW_INDEXES_SEKTOREN = {
     "Sonstige Dienstleistungen ( J - U )": 20,
 }
 
+ROLLING_WINDOW = 3
+
+# Output names of the gemband columns (see common/gemband.py)
+GEMBAND_COLUMNS = {
+    "male-pendler": "Männer (Pendlersaldo)",
+    "female-pendler": "Frauen (Pendlersaldo)",
+    "einpendler": "Einpendler",
+    "auspendler": "Auspendler",
+}
+
 def parse_value(v):
     try:
         return float(v)
     except:
         return 0
 
+@memoize
 def extract_arbeitsmarkt_data(file_path: str) -> pd.DataFrame:
     df = pd.read_excel(file_path, sheet_name="Daten", header=None)
     filename = os.path.basename(file_path)
@@ -48,103 +68,90 @@ def extract_arbeitsmarkt_data(file_path: str) -> pd.DataFrame:
             row[colname] = int(round(parse_value(df.iloc[row_index, 2 + year_idx])))
         rows.append(row)
 
-    return pd.DataFrame(rows)
+    return apply_schema(pd.DataFrame(rows), "arbeitsmarkt_gesamt_2")
 
-def extract_gemband_data(file_path: str) -> pd.DataFrame:
-    import warnings
-    warnings.simplefilter("ignore")
-    _, ext = os.path.splitext(file_path)
-    engine = "pyxlsb" if ext == ".xlsb" else None
-    df = pd.read_excel(file_path, sheet_name="Gemeindedaten", engine=engine, header=None)
+def add_derived_metrics(df: pd.DataFrame) -> pd.DataFrame:
+    # Precomputed series per Gemeinde (Wetteraukreis included), see arbeitsmarkt-gesamt.py
+    keys = ["Gemeinde"]
+    unemployment = list(ROW_INDEXES_ARBEITSLOSIGKEIT)
+    df = add_changes(df, keys, "Jahr", unemployment, delta="{} (Veränderung)", pct="{} (Veränderung %)")
+    df = add_rolling_mean(df, keys, "Jahr", ["Insgesamt"], window=ROLLING_WINDOW, name="{} (Ø {window} Jahre)")
 
-    filename = os.path.basename(file_path)
-    match = re.search(r"0-(\d{4})06", filename)
-    year = int(match.group(1)) if match else None
-    if not year:
-        raise ValueError(f"Cannot extract year from filename: {filename}")
-
-    row_range_by_year = {
-        2020: (2947, 2971),
-        2021: (2947, 2971),
-        2022: (2945, 2969),
-        2023: (2942, 2966),
-        2024: (2942, 2966),
-    }
-    if year not in row_range_by_year:
-        raise ValueError(f"No row mapping for year: {year}")
-
-    row_start, row_end = row_range_by_year[year]
-    result = []
-    for idx in range(row_start, row_end + 1):
-        row = df.iloc[idx]
-        gemeinde_raw = str(row[1]).strip()
-        if not gemeinde_raw or gemeinde_raw.lower() == "nan":
-            continue
-        gemeinde = normalize_gemeinde_name(gemeinde_raw)
-        if gemeinde is None or gemeinde == "Unbekannt":
-            continue
-
-        entry = {
-            "Gemeinde": gemeinde,
-            "Jahr": year,
-            "Männer (Pendlersaldo)": parse_value(row[3]),
-            "Frauen (Pendlersaldo)": parse_value(row[4]),
-            "Einpendler": parse_value(row[12]),
-            "Auspendler": parse_value(row[13]),
-        }
-        result.append(entry)
-
-    return pd.DataFrame(result)
+    df = add_shares(df, list(ROW_INDEXES_SEKTOREN), name="Anteil {}")
+    df = add_changes(df, keys, "Jahr", [f"Anteil {c}" for c in ROW_INDEXES_SEKTOREN], delta="{} (Veränderung)", pct=None)
+
+    if {"Einpendler", "Auspendler"} <= set(df.columns):
+        df["Pendlersaldo"] = df["Einpendler"] - df["Auspendler"]
+        df = add_changes(df, keys, "Jahr", ["Pendlersaldo"], delta="{} (Veränderung)", pct=None)
+        df = add_rolling_mean(df, keys, "Jahr", ["Pendlersaldo"], window=ROLLING_WINDOW, name="{} (Ø {window} Jahre)")
+    return df
 
 def main():
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    arbeitsmarkt_frames: List[pd.DataFrame] = []
-    for file in sorted(os.listdir(INPUT_DIR)):
-        path = os.path.join(INPUT_DIR, file)
-        if file.endswith(".xlsx") and file.startswith("Arbeitsmarkt-kommunal"):
-            try:
-                arbeitsmarkt_frames.append(extract_arbeitsmarkt_data(path))
-            except Exception as e:
-                print(f"Fehler bei {file}: {e}")
-
-    gemband_frames: List[pd.DataFrame] = []
-    for file in sorted(os.listdir(GEMBAND_DIR)):
-        path = os.path.join(GEMBAND_DIR, file)
-        if file.endswith((".xlsx", ".xlsb")):
-            try:
-                gemband_frames.append(extract_gemband_data(path))
-            except Exception as e:
-                print(f"Error. Read file {file}: {e}")
+    with stage("extract_arbeitsmarkt") as s:
+        arbeitsmarkt_frames: List[pd.DataFrame] = []
+        for file in sorted(os.listdir(INPUT_DIR)):
+            path = os.path.join(INPUT_DIR, file)
+            if file.endswith(".xlsx") and file.startswith("Arbeitsmarkt-kommunal"):
+                try:
+                    arbeitsmarkt_frames.append(extract_arbeitsmarkt_data(path))
+                except Exception as e:
+                    print(f"Fehler bei {file}: {e}")
+        s.rows = sum(len(f) for f in arbeitsmarkt_frames)
+
+    with stage("extract_gemband") as s:
+        gemband_frames: List[pd.DataFrame] = process_partitions(
+            GEMBAND_DATASET, gemband_files(), try_extract_gemband_data
+        )
+        s.rows = sum(len(f) for f in gemband_frames)
 
     if not arbeitsmarkt_frames:
         print("No 'arbeitsmarkt' data")
         return
 
-    df_arbeitsmarkt = pd.concat(arbeitsmarkt_frames, ignore_index=True)
-
-    if gemband_frames:
-        df_gemband = pd.concat(gemband_frames, ignore_index=True)
-        if df_gemband.empty:
-            print("No data")
-            return
-        df_merged = pd.merge(df_arbeitsmarkt, df_gemband, how="left", on=["Gemeinde", "Jahr"])
-    else:
-        df_merged = df_arbeitsmarkt
-
-    sum_df = df_merged.groupby("Jahr").sum(numeric_only=True).reset_index()
-    sum_df["Gemeinde"] = "Wetteraukreis"
-    columns = ["Gemeinde", "Jahr"] + [col for col in df_merged.columns if col not in ["Gemeinde", "Jahr"]]
-    sum_df = sum_df[columns]
-    final_df = pd.concat([df_merged, sum_df], ignore_index=True)
-
-    long_df = final_df.melt(id_vars=["Gemeinde", "Jahr"],
-                            var_name="Eigenschaft",
-                            value_name="Anzahl")
+    df_arbeitsmarkt = concat_tables(arbeitsmarkt_frames, "arbeitsmarkt_gesamt_2")
+
+    with stage("aggregate") as s:
+        if gemband_frames:
+            df_gemband = concat_tables(gemband_frames, "gemband").rename(columns=GEMBAND_COLUMNS)
+            if df_gemband.empty:
+                print("No data")
+                return
+            df_merged, _ = merge_tables({"arbeitsmarkt": df_arbeitsmarkt, "gemband": df_gemband})
+        else:
+            df_merged = df_arbeitsmarkt
+
+        sum_df = df_merged.groupby("Jahr").sum(numeric_only=True).reset_index()
+        sum_df["Gemeinde"] = "Wetteraukreis"
+        columns = ["Gemeinde", "Jahr"] + [col for col in df_merged.columns if col not in ["Gemeinde", "Jahr"]]
+        sum_df = sum_df[columns]
+        final_df = concat_tables([df_merged, sum_df], "arbeitsmarkt_gesamt_2")
+        s.rows = len(final_df)
+
+    with stage("derive"):
+        derived_df = add_derived_metrics(final_df)
+        derived_columns = [c for c in derived_df.columns if c not in final_df.columns]
+
+    # Counts and derived series (percentages, shares, changes) go to separate tables,
+    # so "Anzahl" only holds counts
+    with stage("reshape") as s:
+        long_df = melt_frame(final_df, ["Gemeinde", "Jahr"],
+                             var_name="Eigenschaft",
+                             value_name="Anzahl")
+        kennzahlen_df = melt_frame(derived_df, ["Gemeinde", "Jahr"], derived_columns,
+                                   var_name="Kennzahl",
+                                   value_name="Wert")
+        s.rows = len(long_df) + len(kennzahlen_df)
 
     output_path = os.path.join(OUTPUT_DIR, OUTPUT_FILENAME)
-    long_df.to_excel(output_path, index=False)
-    print(f"Result saved to: {output_path}")
+    kennzahlen_path = os.path.join(OUTPUT_DIR, KENNZAHLEN_FILENAME)
+    report_memory(long_df, "arbeitsmarkt_gesamt_2")
+    report_memory(kennzahlen_df, "arbeitsmarkt_gesamt_2_kennzahlen")
+    with stage("write", rows=len(long_df) + len(kennzahlen_df)):
+        written = write_result(long_df, output_path, db_keys=["Eigenschaft"])
+        written += write_result(kennzahlen_df, kennzahlen_path, db_keys=["Kennzahl"])
+    print(f"Result saved to: {', '.join(written)}")
 
 if __name__ == "__main__":
-    main()
+    run_instrumented(main, "arbeitsmarkt-gesamt-2")
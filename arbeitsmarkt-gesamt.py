@@ -5,9 +5,16 @@ import logging
 from typing import List
 
 from common.mapping import normalize_gemeinde_name
+from common.gemband import GEMBAND_DATASET, gemband_files, try_extract_gemband_data
+from common.incremental import process_partitions
+from common.memo import memoize
+from common.merge import merge_tables
+from common.output import write_result
+from common.schema import apply_schema, concat_tables, report_memory
+from common.instrumentation import stage, run_instrumented
+from common.timeseries import add_changes, add_rolling_mean, add_shares
 
 INPUT_DIR = "data/arbeitsortbeschäftigung"
-GEMBAND_DIR = "data/gemband"
 OUTPUT_DIR = "result"
 OUTPUT_FILENAME = "arbeitsmarkt_gesamt.xlsx"
 
@@ -58,12 +65,9 @@ ROW_INDEXES_SEKTOREN = {
     "nace-j-u": 20,  # Sonstige Dienstleistungen ( J - U )
 }
 
-GEMBAND_COL_MAP = {
-    "male-pendler": 3,   # D -> Männer (Pendlersaldo)
-    "female-pendler": 4, # E -> Frauen (Pendlersaldo)
-    "einpendler": 12,      # M -> Einpendler
-    "auspendler": 13,     # N -> Auspendler
-}
+UNEMPLOYMENT_COLUMNS = list(ROW_INDEXES_ARBEITSLOSIGKEIT)
+SECTOR_COLUMNS = list(ROW_INDEXES_SEKTOREN)
+ROLLING_WINDOW = 3
 
 def parse_value(v):
     # Safely convert value to float; fallback to 0 on failure
@@ -72,6 +76,7 @@ def parse_value(v):
     except Exception:
         return 0.0
 
+@memoize
 def extract_arbeitsmarkt_data(file_path: str) -> pd.DataFrame:
     # Parse municipality name from filename
     # Read values for each year and append to result
@@ -100,68 +105,26 @@ def extract_arbeitsmarkt_data(file_path: str) -> pd.DataFrame:
 
         rows.append(row)
 
-    return pd.DataFrame(rows)
-
-
-def extract_gemband_data(file_path: str) -> pd.DataFrame:
-    # Determine engine for .xlsb support
-    # Extract year from filename (used to select row range)
-
-    # Define year-specific row ranges due to inconsistent file structures
-    import warnings
-    warnings.simplefilter("ignore")
-
-    _, ext = os.path.splitext(file_path)
-    engine = "pyxlsb" if ext == ".xlsb" else None
-
-    df = pd.read_excel(file_path, sheet_name="Gemeindedaten", engine=engine, header=None)
-
-    filename = os.path.basename(file_path)
-    match = re.search(r"0-(\d{4})06", filename)
-    year = int(match.group(1)) if match else None
-
-    if not year:
-        raise ValueError(f"Cannot extract year from filename: {filename}")
-
-    row_range_by_year = {
-        2020: (2947, 2971), # (2948–2972)
-        2021: (2947, 2971), # (2948–2972)
-        2022: (2945, 2969), # (2946–2970)
-        2023: (2942, 2966), # (2943–2967)
-        2024: (2942, 2966), # (2943–2967)
-    }
-
-    # Iterate over rows and normalize municipality names
-    # Skip invalid or unknown entries
+    return apply_schema(pd.DataFrame(rows), "arbeitsmarkt_gesamt")
 
-    if year not in row_range_by_year:
-        raise ValueError(f"No row mapping for year: {year}")
 
-    row_start, row_end = row_range_by_year[year]
+def add_derived_metrics(df: pd.DataFrame) -> pd.DataFrame:
+    # Precomputed series for the dashboards (per Gemeinde, against the previous year):
+    # - unemployment: change (-delta), growth in % (-pct), total as 3-year mean
+    # - sectors: share of all four sectors in % (-anteil) and its shift in percentage points
+    # - pendlersaldo (einpendler - auspendler): change and 3-year mean as trend
+    keys = ["gemeinde"]
+    df = add_changes(df, keys, "year", UNEMPLOYMENT_COLUMNS, delta="{}-delta", pct="{}-pct")
+    df = add_rolling_mean(df, keys, "year", ["total"], window=ROLLING_WINDOW, name="{}-avg{window}")
 
-    result = []
-    for idx in range(row_start, row_end + 1):
-        row = df.iloc[idx]
-        gemeinde_raw = str(row[1]).strip()
+    df = add_shares(df, SECTOR_COLUMNS, name="{}-anteil")
+    df = add_changes(df, keys, "year", [f"{c}-anteil" for c in SECTOR_COLUMNS], delta="{}-delta", pct=None)
 
-        if not gemeinde_raw or gemeinde_raw.lower() == "nan":
-            continue
-
-        gemeinde = normalize_gemeinde_name(gemeinde_raw)
-        if not gemeinde or gemeinde == "Unbekannt":
-            continue
-
-        entry = {
-            "gemeinde": gemeinde,
-            "gemeinde_id": int(GEMEINDE_ID_MAP.get(gemeinde, 0)),
-            "year": year
-        }
-        for name, col_idx in GEMBAND_COL_MAP.items():
-            entry[name] = parse_value(row[col_idx])
-
-        result.append(entry)
-
-    return pd.DataFrame(result)
+    if {"einpendler", "auspendler"} <= set(df.columns):
+        df["pendlersaldo"] = df["einpendler"] - df["auspendler"]
+        df = add_changes(df, keys, "year", ["pendlersaldo"], delta="{}-delta", pct=None)
+        df = add_rolling_mean(df, keys, "year", ["pendlersaldo"], window=ROLLING_WINDOW, name="{}-avg{window}")
+    return df
 
 
 def main():
@@ -173,46 +136,44 @@ def main():
     # Save final result to Excel
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    arbeitsmarkt_frames: List[pd.DataFrame] = []
-    for file in sorted(os.listdir(INPUT_DIR)):
-        if not (file.endswith(".xlsx") and file.startswith("Arbeitsmarkt-kommunal")):
-            continue
-        path = os.path.join(INPUT_DIR, file)
-        try:
-            arbeitsmarkt_frames.append(extract_arbeitsmarkt_data(path))
-        except Exception as e:
-            print(f"Fehler bei {file}: {e}")
+    with stage("extract_arbeitsmarkt") as s:
+        arbeitsmarkt_frames: List[pd.DataFrame] = []
+        for file in sorted(os.listdir(INPUT_DIR)):
+            if not (file.endswith(".xlsx") and file.startswith("Arbeitsmarkt-kommunal")):
+                continue
+            path = os.path.join(INPUT_DIR, file)
+            try:
+                arbeitsmarkt_frames.append(extract_arbeitsmarkt_data(path))
+            except Exception as e:
+                print(f"Fehler bei {file}: {e}")
+        s.rows = sum(len(f) for f in arbeitsmarkt_frames)
 
     if not arbeitsmarkt_frames:
         print("No 'arbeitsmarkt' data")
         return
 
-    df_arbeitsmarkt = pd.concat(arbeitsmarkt_frames, ignore_index=True)
-
-    gemband_frames: List[pd.DataFrame] = []
-    for file in sorted(os.listdir(GEMBAND_DIR)):
-        if not file.endswith((".xlsx", ".xlsb")):
-            continue
-        path = os.path.join(GEMBAND_DIR, file)
-        try:
-            gemband_frames.append(extract_gemband_data(path))
-        except Exception as e:
-            print(f"Error. Read file {file}: {e}")
-
-    if gemband_frames:
-        df_gemband = pd.concat(gemband_frames, ignore_index=True)
-        if df_gemband.empty:
-            print("No gemband data")
-            return
-        df_merged = pd.merge(
-            df_arbeitsmarkt,
-            df_gemband,
-            how="left",
-            on=["gemeinde", "gemeinde_id", "year"]
+    df_arbeitsmarkt = concat_tables(arbeitsmarkt_frames, "arbeitsmarkt_gesamt")
+
+    # Gemband years are partitions: with --incremental only new or modified files are read
+    with stage("extract_gemband") as s:
+        gemband_frames: List[pd.DataFrame] = process_partitions(
+            GEMBAND_DATASET, gemband_files(), try_extract_gemband_data
         )
-    else:
-        print("No valid gemband data extracted.")
-        df_merged = df_arbeitsmarkt
+        s.rows = sum(len(f) for f in gemband_frames)
+
+    with stage("aggregate"):
+        if gemband_frames:
+            df_gemband = concat_tables(gemband_frames, "gemband")
+            if df_gemband.empty:
+                print("No gemband data")
+                return
+            df_merged, _ = merge_tables(
+                {"arbeitsmarkt": df_arbeitsmarkt, "gemband": df_gemband},
+                id_columns=["gemeinde_id"]
+            )
+        else:
+            print("No valid gemband data extracted.")
+            df_merged = df_arbeitsmarkt
 
     #     sum_df = df_merged.groupby("year").sum(numeric_only=True).reset_index()
     #     sum_df["gemeinde"] = "Wetteraukreis"
@@ -222,10 +183,15 @@ def main():
     #
     #     final_df = pd.concat([df_merged, sum_df], ignore_index=True)
 
+    with stage("derive"):
+        df_merged = add_derived_metrics(df_merged)
+
     output_path = os.path.join(OUTPUT_DIR, OUTPUT_FILENAME)
-    df_merged.to_excel(output_path, index=False)
-    print(f"Result saved to: {output_path}")
+    report_memory(df_merged, "arbeitsmarkt_gesamt")
+    with stage("write", rows=len(df_merged)):
+        written = write_result(df_merged, output_path)
+    print(f"Result saved to: {', '.join(written)}")
 
 
 if __name__ == "__main__":
-    main()
+    run_instrumented(main, "arbeitsmarkt-gesamt")
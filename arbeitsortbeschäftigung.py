@@ -2,6 +2,9 @@ import pandas as pd
 import os
 
 from common.mapping import normalize_gemeinde_name
+from common.instrumentation import stage, run_instrumented
+from common.output import write_result
+from common.schema import apply_schema, report_memory
 
 FILENAME = "arbeitsortbeschäftigung.xlsx"
 INPUT_DIR = "data/arbeitsortbeschäftigung"
@@ -39,49 +42,53 @@ def parse_arbeitsmarkt():
 
     data_rows = []
 
-    for file in sorted(all_files):
-        full_path = os.path.join(INPUT_PATH, file)
-
-        try:
-            # Read 4 rows from columns B and G; they contain metric names and values
-            df = pd.read_excel(full_path, sheet_name=SHEET_NAME, header=None, usecols="B,G", skiprows=17, nrows=4)
-            category_names = df.iloc[:, 0].tolist()
-            values = [parse_value(v) for v in df.iloc[:, 1].tolist()]
-
-            # Extract and clean the raw Gemeinde name from filename
-            filename_core = os.path.splitext(file)[0]
-            parts = filename_core.split("_")
-            commune_raw = "_".join(parts[2:])
-
-            # Remove suffixes like "_Stadt" and normalize formatting
-            commune_name = (
-                commune_raw.replace("_Stadt", "")
-                           .replace("_Gemeinde", "")
-                           .replace("_Stadtteil", "")
-                           .replace("_Landkreis", "")
-                           .replace("_Kreis", "")
-                           .replace("_", " ")
-                           .strip()
-            )
-
-            # Use standardized/canonical name
-            row = {"gemeinde": normalize_gemeinde_name(commune_name)}
-            for i in range(4):
-                row[category_names[i]] = values[i]
-
-            data_rows.append(row)
-
-        except Exception as e:
-            print(f"Error processing {file}: {e}")
+    with stage("extract") as s:
+        for file in sorted(all_files):
+            full_path = os.path.join(INPUT_PATH, file)
+
+            try:
+                # Read 4 rows from columns B and G; they contain metric names and values
+                df = pd.read_excel(full_path, sheet_name=SHEET_NAME, header=None, usecols="B,G", skiprows=17, nrows=4)
+                category_names = df.iloc[:, 0].tolist()
+                values = [parse_value(v) for v in df.iloc[:, 1].tolist()]
+
+                # Extract and clean the raw Gemeinde name from filename
+                filename_core = os.path.splitext(file)[0]
+                parts = filename_core.split("_")
+                commune_raw = "_".join(parts[2:])
+
+                # Remove suffixes like "_Stadt" and normalize formatting
+                commune_name = (
+                    commune_raw.replace("_Stadt", "")
+                               .replace("_Gemeinde", "")
+                               .replace("_Stadtteil", "")
+                               .replace("_Landkreis", "")
+                               .replace("_Kreis", "")
+                               .replace("_", " ")
+                               .strip()
+                )
+
+                # Use standardized/canonical name
+                row = {"gemeinde": normalize_gemeinde_name(commune_name)}
+                for i in range(4):
+                    row[category_names[i]] = values[i]
+
+                data_rows.append(row)
+
+            except Exception as e:
+                print(f"Error processing {file}: {e}")
+        s.rows = len(data_rows)
 
     if not data_rows:
         print("No valid data extracted.")
         return
 
     # Build final table and export to Excel
-    result_df = pd.DataFrame(data_rows)
-    result_df.to_excel(OUTPUT_PATH, index=False)
-    print(f"Result saved to {OUTPUT_PATH}")
+    result_df = apply_schema(pd.DataFrame(data_rows), "arbeitsortbeschaeftigung")
+    report_memory(result_df, "arbeitsortbeschaeftigung")
+    with stage("write", rows=len(result_df)):
+        written = write_result(result_df, OUTPUT_PATH)
+    print(f"Result saved to {', '.join(written)}")
 
 if __name__ == "__main__":
-    parse_arbeitsmarkt()
+    run_instrumented(parse_arbeitsmarkt, "arbeitsortbeschäftigung")
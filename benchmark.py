@@ -0,0 +1,372 @@
+"""
+Benchmark harness for the processing scripts.
+
+Runs each script's entry point against a synthetic data root (see synthetic_data.py)
+and attributes the wall time to four stages:
+
+- extract:   Excel parsing and the script's extraction functions
+- map:       Gebiet/Gemeinde mapping and geocoding lookups
+- write:     to_excel / to_csv / write_result
+- aggregate: everything else inside the entry point (concat, groupby, merge, ...)
+
+Stage times are exclusive: mapping calls made inside an extraction function count
+as "map", not as "extract". Results are written as JSON so that later runs can be
+compared against them.
+
+`--normalizer MB` instead measures the throughput (MB/s) of normalizer.py on a
+synthetic CSV export of that size: the previous per-character implementation and
+the chunked engine. Both outputs must be identical.
+
+Usage:
+    python3 benchmark.py [--scale N] [--repeat N] [--only script ...] [--compare baseline.json]
+    python3 benchmark.py --normalizer 200
+"""
+
+import argparse
+import contextlib
+import csv
+import filecmp
+import datetime
+import functools
+import importlib
+import importlib.util
+import io
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import pandas as pd
+
+import normalizer
+import synthetic_data
+from common import output
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+BENCH_DIR = os.path.join(REPO_DIR, "result", "benchmark")
+
+# Threshold for flagging a stage as regressed when comparing against a baseline
+REGRESSION_THRESHOLD = 0.20
+
+# Script -> entry point plus the module functions that belong to the extract and map stages;
+# dotted names (common.gemband.normalize_gemeinde_name) patch the function in that module
+BENCHMARKS = {
+    "altersverteilung": {
+        "entry": "main",
+        "extract": ["extract_ages_by_year"],
+        "map": [],
+    },
+    "arbeitslose-wetterau": {
+        "entry": "main",
+        "extract": ["extract_fixed"],
+        "map": [],
+    },
+    "arbeitsmarkt-gesamt": {
+        "entry": "main",
+        "extract": ["extract_arbeitsmarkt_data", "try_extract_gemband_data"],
+        "map": ["normalize_gemeinde_name", "common.gemband.normalize_gemeinde_name"],
+    },
+    "arbeitsmarkt-gesamt-2": {
+        "entry": "main",
+        "extract": ["extract_arbeitsmarkt_data", "try_extract_gemband_data"],
+        "map": ["normalize_gemeinde_name", "common.gemband.normalize_gemeinde_name"],
+    },
+    "arbeitsortbeschäftigung": {
+        "entry": "parse_arbeitsmarkt",
+        "extract": [],
+        "map": ["normalize_gemeinde_name"],
+    },
+    "gender_distribution": {
+        "entry": "main",
+        "extract": ["extract_gender_data"],
+        "map": [],
+    },
+    "geburtsjahrgangsstatistik": {
+        "entry": "parse_excel",
+        "extract": [],
+        "map": ["get_gemeinde_from_gebiet", "track_undetected_gebiete", "log_missing_gebiete", "get_gemeinde_by_schluessel"],
+    },
+    "kriminalstatistik": {
+        "entry": "main",
+        "extract": ["find_header_row"],
+        "map": [],
+    },
+    "planning-areas-matching": {
+        "entry": "main",
+        "extract": ["read_zustaendigkeiten"],
+        "map": ["normalize_columns", "clean_and_format"],
+    },
+    "altersplanung": {
+        "entry": "parse_adressen",
+        "extract": [],
+        "map": ["geocode_address"],
+    },
+}
+
+STAGES = ["extract", "map", "aggregate", "write"]
+
+
+class StageClock:
+    """Accumulates exclusive wall time per stage for nested, wrapped calls."""
+
+    def __init__(self):
+        self.totals = {stage: 0.0 for stage in STAGES}
+        self.stack = []
+        self.mark = None
+
+    def _switch(self):
+        now = time.perf_counter()
+        if self.stack and self.mark is not None:
+            self.totals[self.stack[-1]] += now - self.mark
+        self.mark = now
+
+    def enter(self, stage: str):
+        self._switch()
+        self.stack.append(stage)
+
+    def leave(self):
+        self._switch()
+        self.stack.pop()
+
+    def wrap(self, stage: str, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            self.enter(stage)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.leave()
+        return wrapper
+
+
+def load_script(name: str):
+    """Imports a script file (names may contain '-' or umlauts) as a module."""
+    path = os.path.join(REPO_DIR, f"{name}.py")
+    module_name = "bench_" + "".join(c if c.isalnum() else "_" for c in name)
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@contextlib.contextmanager
+def patched(target, attr: str, replacement):
+    original = getattr(target, attr)
+    setattr(target, attr, replacement)
+    try:
+        yield
+    finally:
+        setattr(target, attr, original)
+
+
+def function_target(module, func_name: str) -> tuple:
+    """(module, attribute) to patch for a name of BENCHMARKS: the script module or a dotted module path."""
+    if "." in func_name:
+        module_name, func_name = func_name.rsplit(".", 1)
+        return importlib.import_module(module_name), func_name
+    return module, func_name
+
+
+def run_script(name: str, config: dict) -> dict:
+    """Runs one script entry point once and returns the stage times in seconds."""
+    module = load_script(name)
+    clock = StageClock()
+
+    with contextlib.ExitStack() as stack:
+        # Excel parsing is extraction wherever it happens
+        stack.enter_context(patched(pd, "read_excel", clock.wrap("extract", pd.read_excel)))
+        stack.enter_context(patched(pd, "ExcelFile", clock.wrap("extract", pd.ExcelFile)))
+        for stage_name in ("extract", "map"):
+            for target, func_name in (function_target(module, f) for f in config[stage_name]):
+                stack.enter_context(patched(target, func_name, clock.wrap(stage_name, getattr(target, func_name))))
+
+        # Output writers
+        stack.enter_context(patched(pd.DataFrame, "to_excel", clock.wrap("write", pd.DataFrame.to_excel)))
+        stack.enter_context(patched(pd.DataFrame, "to_csv", clock.wrap("write", pd.DataFrame.to_csv)))
+        for func_name in ("write_excel", "write_result"):
+            if hasattr(module, func_name):
+                stack.enter_context(patched(module, func_name, clock.wrap("write", getattr(output, func_name))))
+
+        entry = getattr(module, config["entry"])
+        start = time.perf_counter()
+        clock.enter("aggregate")
+        with contextlib.redirect_stdout(io.StringIO()):
+            entry()
+        clock.leave()
+        total = time.perf_counter() - start
+
+    stages = {stage: round(seconds, 4) for stage, seconds in clock.totals.items()}
+    stages["total"] = round(total, 4)
+    return stages
+
+
+def summarize(runs: list[dict]) -> dict:
+    """Median and min per stage over repeated runs."""
+    keys = STAGES + ["total"]
+    return {
+        key: {
+            "median": round(statistics.median(r[key] for r in runs), 4),
+            "min": round(min(r[key] for r in runs), 4),
+        }
+        for key in keys
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR, text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def compare(results: dict, baseline_path: str):
+    """Prints per-stage changes against a previous result file and flags regressions."""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    print(f"\nComparison against {baseline_path} (revision {baseline.get('revision')})")
+    regressions = 0
+    for script, stages in results["scripts"].items():
+        base = baseline.get("scripts", {}).get(script)
+        if not base:
+            continue
+        for key in STAGES + ["total"]:
+            old = base[key]["median"]
+            new = stages[key]["median"]
+            if old <= 0.005:
+                continue
+            change = (new - old) / old
+            flag = "  REGRESSION" if change > REGRESSION_THRESHOLD else ""
+            regressions += bool(flag)
+            print(f"  {script:28s} {key:9s} {old:8.3f}s -> {new:8.3f}s ({change:+.0%}){flag}")
+    print(f"{regressions} regression(s) above {REGRESSION_THRESHOLD:.0%}")
+
+
+def legacy_normalize_file(input_path: str, output_path: str):
+    """normalizer.py before the chunked engine: one Python loop iteration per character."""
+    def normalize_value(value):
+        value = value.strip()
+        if not value:
+            return ""
+        result = []
+        for ch in value:
+            if ch in normalizer.CHAR_MAP:
+                result.append(normalizer.CHAR_MAP[ch])
+            elif ord(ch) < 128:
+                result.append(ch)
+            else:
+                result.append("*")
+        return "".join(result)
+
+    with open(input_path, "r", encoding="utf-8", errors="replace") as infile, \
+         open(output_path, "w", newline="", encoding="utf-8") as outfile:
+        reader = csv.reader(infile, delimiter=";")
+        writer = csv.writer(outfile, delimiter=";")
+        for row in reader:
+            writer.writerow([normalize_value(v) for v in row])
+
+
+def benchmark_normalizer(size_mb: int, repeat: int) -> dict:
+    """MB/s of the legacy normalizer and the chunked engine."""
+    work_dir = os.path.join(BENCH_DIR, "normalizer")
+    input_path = os.path.join(work_dir, f"export_{size_mb}mb.csv")
+    if not os.path.exists(input_path):
+        synthetic_data.write_csv_export(input_path, size_mb)
+    size = os.path.getsize(input_path) / (1024 * 1024)
+
+    variants = {
+        "legacy": lambda out: legacy_normalize_file(input_path, out),
+        "chunked": lambda out: normalizer.normalize_file(input_path, out),
+    }
+    results = {"size_mb": round(size, 1)}
+    reference = None
+    for name, run in variants.items():
+        out = os.path.join(work_dir, f"out_{name}.csv")
+        seconds = []
+        for _ in range(1 if name == "legacy" else repeat):
+            start = time.perf_counter()
+            run(out)
+            seconds.append(time.perf_counter() - start)
+        best = min(seconds)
+        if reference is None:
+            reference = out
+        elif not filecmp.cmp(reference, out, shallow=False):
+            raise AssertionError(f"normalizer output of '{name}' differs from the legacy output")
+        results[name] = {"seconds": round(best, 3), "mb_s": round(size / best, 1)}
+        print(f"{name:20s} {best:8.2f}s  {size / best:8.1f} MB/s")
+
+    speedup = results["chunked"]["mb_s"] / results["legacy"]["mb_s"]
+    print(f"Speedup chunked vs legacy: {speedup:.1f}x (outputs identical)")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the extract/map/aggregate/write stages of every script.")
+    parser.add_argument("--scale", type=int, default=1, help="scale factor for Gemeinden, Gebiete and years")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="*", help="run only these scripts")
+    parser.add_argument("--data-root", help="synthetic data root (default: result/benchmark/data_x<scale>)")
+    parser.add_argument("--regenerate", action="store_true", help="rewrite the synthetic data")
+    parser.add_argument("--output", help="result JSON (default: result/benchmark/<timestamp>.json)")
+    parser.add_argument("--compare", help="baseline result JSON to compare against")
+    parser.add_argument("--normalizer", type=int, metavar="MB", help="benchmark normalizer.py on a CSV of this size instead")
+    args = parser.parse_args()
+
+    timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+    output_path = os.path.abspath(args.output or os.path.join(BENCH_DIR, f"{timestamp}.json"))
+
+    if args.normalizer:
+        results = {
+            "timestamp": timestamp,
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "normalizer": benchmark_normalizer(args.normalizer, args.repeat),
+        }
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"Result saved to {output_path}")
+        return
+
+    data_root = os.path.abspath(args.data_root or os.path.join(BENCH_DIR, f"data_x{args.scale}"))
+    if args.regenerate or not os.path.exists(os.path.join(data_root, "data")):
+        with contextlib.redirect_stdout(io.StringIO()):
+            synthetic_data.generate(data_root, gemeinden=args.scale, years=5 * args.scale, gebiete=args.scale)
+
+    logging.disable(logging.WARNING)
+    sys.path.insert(0, REPO_DIR)
+    os.chdir(data_root)
+
+    results = {
+        "timestamp": timestamp,
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "scale": args.scale,
+        "repeat": args.repeat,
+        "scripts": {},
+    }
+
+    for name, config in BENCHMARKS.items():
+        if args.only and name not in args.only:
+            continue
+        runs = [run_script(name, config) for _ in range(args.repeat)]
+        results["scripts"][name] = summarize(runs)
+        stages = results["scripts"][name]
+        print(f"{name:28s} " + "  ".join(f"{key} {stages[key]['median']:7.3f}s" for key in STAGES + ["total"]))
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"Result saved to {output_path}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
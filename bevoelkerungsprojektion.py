@@ -0,0 +1,159 @@
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from common.age_bands import DEFAULT_BOUNDS, band_labels, requested_bounds
+from common.age_matrix import MATRIX_DIR, AgeMatrix
+from common.instrumentation import stage, run_instrumented
+from common.mapping import KREIS_SCHLUESSEL, get_gemeinde_by_schluessel
+from common.output import write_result
+from common.projection import MAX_AGE, estimate_rates, project
+
+# Projects the population per Gemeinde and age band N years forward (cohort-component
+# method, see common/projection.py). Input is a stored age matrix:
+# - geburtsjahrgangsstatistik (default): per Gemeinde, written by geburtsjahrgangsstatistik.py
+# - altersverteilung: the whole district, one Stichtag file per year, written by altersverteilung.py
+#
+# Rates come from consecutive Stichtage of the matrix. The dadigesamt sheet is one
+# snapshot, so its matrix has a single Stichtag and its cohorts never change: survival
+# is then taken from the district files (altersverteilung, default --survival-from) and
+# net migration is 0. The `raten_basis` column says which rates a projection used.
+#
+# Scenario factors scale the estimated rates; comma-separated values are projected
+# side by side (one `szenario` per value), e.g. --migration 0,0.5,1
+
+OUTPUT_DIR = "result"
+OUTPUT_FILENAME = "bevoelkerungsprojektion.xlsx"
+DEFAULT_STEPS = 10
+DEFAULT_SURVIVAL_FROM = "altersverteilung"
+
+
+def factors(value: str) -> np.ndarray:
+    return np.array([float(v) for v in value.split(",") if v.strip()])
+
+
+def gemeinde_name(schluessel) -> str | None:
+    if schluessel == KREIS_SCHLUESSEL:
+        return "Wetteraukreis"
+    return get_gemeinde_by_schluessel(schluessel)
+
+
+def stichtag_counts(matrix: AgeMatrix) -> np.ndarray:
+    """Single-age counts (Gemeinde x Stichtag x age) at the Stichtage of `matrix` only."""
+    if matrix.stichtage is None:
+        raise ValueError("Age matrix was stored without its Stichtage, run its script again")
+    return matrix.age_counts(MAX_AGE)[:, [matrix.years.index(y) for y in matrix.stichtage], :]
+
+
+def year_span(years: list[int]) -> str:
+    return f"{years[0]}-{years[-1]}" if len(years) > 1 else str(years[0])
+
+
+def projection_table(matrix: AgeMatrix, steps: int, bounds, survival, migration, fertility,
+                     survival_matrix: AgeMatrix | None = None) -> pd.DataFrame:
+    """
+    One row per scenario, Gemeinde and year (last observed year + 0..steps) with the
+    population per age band and in total. With `survival_matrix` the survival rates
+    are taken from that matrix (e.g. the district files with one Stichtag per year).
+    A matrix with a single Stichtag needs `survival_matrix` and is projected without
+    migration (see module comment).
+    """
+    if bounds[-1] > MAX_AGE:
+        raise ValueError(f"Age bands above {MAX_AGE} are not projected: {bounds}")
+
+    counts = matrix.age_counts(MAX_AGE)
+    schedule = None
+    if survival_matrix is not None:
+        if survival_matrix.stichtage is not None and len(survival_matrix.stichtage) < 2:
+            raise ValueError(f"Survival rates need a matrix with at least two Stichtage, "
+                             f"got {survival_matrix.stichtage}")
+        schedule = estimate_rates(stichtag_counts(survival_matrix), survival_matrix.stichtage)["survival"]
+        survival_basis = f"Überleben Kreis {year_span(survival_matrix.stichtage)}"
+    observed = stichtag_counts(matrix)
+    if observed.shape[1] >= 2:
+        rates = estimate_rates(observed, matrix.stichtage, survival=schedule)
+        basis = f"Stichtage {year_span(matrix.stichtage)}"
+        if schedule is not None:
+            basis += f", {survival_basis}"
+    elif schedule is not None:
+        # Cohorts of a snapshot do not change: only fertility comes from the matrix
+        rates = estimate_rates(counts, matrix.years, survival=schedule, migration=False)
+        basis = f"Stichtag {year_span(matrix.stichtage)}, {survival_basis}, Migration 0"
+    else:
+        raise ValueError(f"The age matrix has one Stichtag ({year_span(matrix.stichtage)}): survival and "
+                         f"migration cannot be estimated from it, survival rates from another matrix are needed")
+    projected = project(counts[:, -1, :], rates, steps, survival, migration, fertility)
+
+    # Scenario x Gemeinde x year x band
+    bands = np.add.reduceat(projected, np.asarray(bounds), axis=3)
+    bands[..., 0] += projected[..., :bounds[0]].sum(axis=3)
+    bands = np.rint(bands).astype(np.int64)
+
+    s, g, t = (index.ravel() for index in np.indices(bands.shape[:3]))
+    scenario_factors = np.broadcast_arrays(np.atleast_1d(survival), np.atleast_1d(migration), np.atleast_1d(fertility))
+    gemeinden = np.asarray(matrix.gemeinden)
+    labels = band_labels(bounds)
+
+    table = pd.DataFrame({
+        "szenario": s,
+        "ueberleben_faktor": scenario_factors[0][s],
+        "migration_faktor": scenario_factors[1][s],
+        "fertilitaet_faktor": scenario_factors[2][s],
+        "gemeinde_schluessel": gemeinden[g],
+        "jahr": matrix.years[-1] + t,
+        **{label: bands[..., i].ravel() for i, label in enumerate(labels)},
+    })
+    table["gesamt"] = table[labels].sum(axis=1)
+    table["raten_basis"] = basis
+    names = {key: gemeinde_name(key) for key in matrix.gemeinden}
+    table.insert(4, "gemeinde", table["gemeinde_schluessel"].map(names))
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cohort-component population projection per Gemeinde.")
+    parser.add_argument("--matrix", default="geburtsjahrgangsstatistik", help="stored age matrix in result/.age_matrix/")
+    parser.add_argument("--survival-from", help="take survival rates from this stored matrix, e.g. altersverteilung "
+                        f"(default for a single-Stichtag matrix: {DEFAULT_SURVIVAL_FROM})")
+    parser.add_argument("--steps", type=int, default=DEFAULT_STEPS, help=f"years to project (default: {DEFAULT_STEPS})")
+    parser.add_argument("--survival", type=factors, default=np.array([1.0]), help="survival rate factor(s), e.g. 1 or 0.98,1")
+    parser.add_argument("--migration", type=factors, default=np.array([1.0]), help="net migration factor(s), e.g. 0,0.5,1")
+    parser.add_argument("--fertility", type=factors, default=np.array([1.0]), help="fertility factor(s)")
+    # --formats=, --age-bands= etc. are read by the shared helpers
+    args, _ = parser.parse_known_args()
+
+    base = os.path.join(MATRIX_DIR, args.matrix)
+    if not os.path.exists(base + ".npy"):
+        print(f"Age matrix '{base}.npy' not found, run {args.matrix}.py first")
+        return
+
+    with stage("extract"):
+        matrix = AgeMatrix.load(base)
+        survival_from = args.survival_from
+        if survival_from is None and matrix.stichtage is not None and len(matrix.stichtage) < 2:
+            if not os.path.exists(os.path.join(MATRIX_DIR, DEFAULT_SURVIVAL_FROM) + ".npy"):
+                print(f"Age matrix '{args.matrix}' has a single Stichtag, survival rates need "
+                      f"'{DEFAULT_SURVIVAL_FROM}': run {DEFAULT_SURVIVAL_FROM}.py first")
+                return
+            survival_from = DEFAULT_SURVIVAL_FROM
+            print(f"Age matrix '{args.matrix}' has a single Stichtag ({matrix.stichtage[0]}): "
+                  f"survival from '{survival_from}', no net migration")
+        survival_matrix = AgeMatrix.load(os.path.join(MATRIX_DIR, survival_from)) if survival_from else None
+
+    with stage("aggregate") as s:
+        table = projection_table(matrix, args.steps, requested_bounds() or DEFAULT_BOUNDS,
+                                 args.survival, args.migration, args.fertility, survival_matrix)
+        s.rows = len(table)
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    output_path = os.path.join(OUTPUT_DIR, OUTPUT_FILENAME)
+    with stage("write", rows=len(table)):
+        written = write_result(table, output_path, db_keys=["szenario"])
+
+    print(f"Result saved to {', '.join(written)}")
+
+
+if __name__ == "__main__":
+    run_instrumented(main, "bevoelkerungsprojektion")
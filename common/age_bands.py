@@ -0,0 +1,81 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Shared age-band engine.
+#
+# A banding is given by the lower bounds of its bands, e.g. (0, 21, 65) stands for
+# "0 - 20", "21 - 64" and "65+". Ages are assigned with np.digitize on the bounds, so
+# the first band also takes ages below its bound and the last band is open-ended.
+# Totals are computed with one groupby over (*keys, band) for all Gemeinden and years.
+#
+# Scripts that support other bandings read them from `--age-bands=` or AGE_BANDS:
+# - "0,21,65"  explicit lower bounds
+# - "5"        5-year bands 0 - 4, 5 - 9, ..., 85+ (see FIVE_YEAR_LAST)
+
+DEFAULT_BOUNDS = (0, 21, 65)
+FIVE_YEAR_LAST = 85
+
+
+def step_bounds(step: int, last: int = FIVE_YEAR_LAST) -> tuple[int, ...]:
+    """Bands of `step` years up to an open-ended band starting at `last`."""
+    return tuple(range(0, last + 1, step))
+
+
+def parse_bounds(value: str) -> tuple[int, ...]:
+    """Parses "0,21,65" (lower bounds) or "5" (band width in years)."""
+    parts = [p.strip() for p in value.split(",") if p.strip()]
+    try:
+        numbers = [int(p) for p in parts]
+    except ValueError:
+        raise ValueError(f"Invalid age bands '{value}': expected lower bounds like '0,21,65' or a width like '5'")
+
+    if len(numbers) == 1:
+        if numbers[0] <= 0:
+            raise ValueError(f"Invalid age band width: {numbers[0]}")
+        return step_bounds(numbers[0])
+    if any(b >= a for a, b in zip(numbers[1:], numbers)):
+        raise ValueError(f"Age band bounds must be increasing: {value}")
+    return tuple(numbers)
+
+
+def requested_bounds() -> tuple[int, ...] | None:
+    """Banding selected for this run via `--age-bands=` or AGE_BANDS, None if not set."""
+    value = os.environ.get("AGE_BANDS", "")
+    for arg in sys.argv[1:]:
+        if arg.startswith("--age-bands="):
+            value = arg.split("=", 1)[1]
+    return parse_bounds(value) if value.strip() else None
+
+
+def band_labels(bounds) -> list[str]:
+    """Column labels of the bands: "0 - 20", "21 - 64", "65+"."""
+    labels = [f"{lower} - {upper - 1}" for lower, upper in zip(bounds, bounds[1:])]
+    return labels + [f"{bounds[-1]}+"]
+
+
+def assign_bands(ages, bounds) -> np.ndarray:
+    """Band index (0 .. len(bounds) - 1) of every age."""
+    return np.digitize(np.asarray(ages), np.asarray(bounds[1:]))
+
+
+def band_totals(df: pd.DataFrame, age_column: str, value_column: str, bounds,
+                by: list[str], labels: list[str] | None = None) -> pd.DataFrame:
+    """
+    Sums `value_column` per `by` keys and age band in one grouped reduction.
+
+    Returns one row per key combination (sorted) with the `by` columns followed by one
+    column per band; bands without rows are 0. `labels` default to `band_labels(bounds)`.
+    """
+    labels = labels or band_labels(bounds)
+    if len(labels) != len(bounds):
+        raise ValueError(f"{len(labels)} labels for {len(bounds)} age bands")
+
+    bands = pd.Series(assign_bands(df[age_column], bounds), index=df.index, name="_band")
+    totals = df[value_column].groupby([df[c] for c in by] + [bands], sort=True).sum()
+
+    wide = totals.unstack("_band", fill_value=0).reindex(columns=range(len(bounds)), fill_value=0)
+    wide.columns = labels
+    return wide.reset_index()
@@ -0,0 +1,209 @@
+import inspect
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from common.age_bands import band_labels
+from common.incremental import code_version, file_sha256
+
+# Prefix-sum matrix of the population per Gemeinde, Stichtag year and Jahrgang.
+#
+# `cumulative[g, y, k]` is the population of Gemeinde g at year y born in the first k
+# Jahrgänge (first_jahrgang .. first_jahrgang + k - 1). An age range [min_age, max_age]
+# at year y is the Jahrgang range [y - max_age, y - min_age], so every count is one
+# subtraction of two matrix cells, whatever the range:
+#
+#     matrix = AgeMatrix.load("result/.age_matrix/geburtsjahrgangsstatistik")
+#     matrix.count(6440008, 2023, 3, 6)                    # 3-6 year olds in Friedberg
+#     matrix.range_counts(3, 6)                            # all Gemeinden x years
+#
+# The matrix is stored as <name>.npy (int64, memory-mapped on load) plus <name>.json
+# with the axis labels, the hash of the source file and the code version it was built
+# with (the building script and everything in common/, as for common/incremental.py),
+# as its Gemeinden are already mapped.
+#
+# `stichtage` are the years that were actually counted. A snapshot (dadigesamt) has one,
+# its last year; the earlier years are derived from the Jahrgänge of that snapshot, so
+# they carry no information about deaths or migration.
+
+MATRIX_DIR = os.path.join("result", ".age_matrix")
+
+
+def _gemeinde_order(gemeinde) -> tuple:
+    # Schlüssel (int) first, then names (str); the two types do not compare with each other
+    return isinstance(gemeinde, str), gemeinde
+
+
+class AgeMatrix:
+    def __init__(self, cumulative: np.ndarray, gemeinden: list, years: list[int],
+                 first_jahrgang: int, present: np.ndarray, source_sha256: str | None = None,
+                 stichtage: list[int] | None = None, code_version: str | None = None):
+        self.cumulative = cumulative
+        self.gemeinden = list(gemeinden)
+        self.years = [int(y) for y in years]
+        # None for matrices stored before the Stichtage were recorded
+        self.stichtage = [int(y) for y in stichtage] if stichtage is not None else None
+        self.code_version = code_version
+        self.first_jahrgang = int(first_jahrgang)
+        # Gemeinde x year: True where the source has rows (only those are part of reports)
+        self.present = np.asarray(present, dtype=bool).reshape(len(self.gemeinden), len(self.years))
+        self.source_sha256 = source_sha256
+        self._gemeinde_index = {g: i for i, g in enumerate(self.gemeinden)}
+        self._year_index = {y: i for i, y in enumerate(self.years)}
+
+    @classmethod
+    def from_birth_years(cls, df: pd.DataFrame, years: list[int], gemeinde_column: str = "Gemeinde",
+                         jahrgang_column: str = "Jahrgang", value_column: str = "EW gesamt",
+                         year_column: str | None = None, source_sha256: str | None = None) -> "AgeMatrix":
+        """
+        Builds the matrix from (Gemeinde, Jahrgang) counts.
+
+        Without `year_column` the rows are one snapshot, as in the dadigesamt sheet: for every
+        Stichtag year the Jahrgänge born up to that year are counted. With `year_column` every
+        row is the count at its own Stichtag (one file per year, e.g. altersverteilung).
+        """
+        df = df[df[gemeinde_column].notnull() & (df[gemeinde_column] != "")]
+        if year_column is not None:
+            df = df[df[year_column].isin(years)]
+        gemeinden = sorted(df[gemeinde_column].unique().tolist(), key=_gemeinde_order)
+        first = int(df[jahrgang_column].min()) if len(df) else 0
+        width = int(df[jahrgang_column].max()) - first + 1 if len(df) else 0
+
+        g = pd.Categorical(df[gemeinde_column], categories=gemeinden).codes.astype(np.int64)
+        j = df[jahrgang_column].to_numpy(dtype=np.int64) - first
+        values = df[value_column].to_numpy(dtype=np.float64)
+        jahrgaenge = first + np.arange(width)
+        born = jahrgaenge[None, :] <= np.asarray(years)[:, None]           # year x Jahrgang
+
+        if year_column is None:
+            counts = np.bincount(g * width + j, weights=values, minlength=len(gemeinden) * width)
+            counts = counts.reshape(len(gemeinden), 1, width) * born[None, :, :]
+            present = df.groupby(gemeinde_column, observed=True)[jahrgang_column].min().reindex(gemeinden).to_numpy()[:, None] \
+                <= np.asarray(years)[None, :]
+            stichtage = [max(years)] if len(years) else []
+        else:
+            y = pd.Categorical(df[year_column], categories=list(years)).codes.astype(np.int64)
+            cells = (g * len(years) + y) * width + j
+            counts = np.bincount(cells, weights=values, minlength=len(gemeinden) * len(years) * width)
+            counts = counts.reshape(len(gemeinden), len(years), width) * born[None, :, :]
+            present = np.bincount(g * len(years) + y, minlength=len(gemeinden) * len(years)) > 0
+            stichtage = [year for year, rows in zip(years, present.reshape(-1, len(years)).any(axis=0)) if rows]
+
+        cumulative = np.zeros((len(gemeinden), len(years), width + 1), dtype=np.int64)
+        np.cumsum(np.rint(counts).astype(np.int64), axis=2, out=cumulative[:, :, 1:])
+        return cls(cumulative, gemeinden, years, first, present, source_sha256, stichtage)
+
+    # Queries
+
+    def _jahrgang_slice(self, year: int, min_age: int, max_age: int | None) -> tuple[int, int]:
+        """Prefix positions [start, stop) of the Jahrgänge aged min_age..max_age in `year`."""
+        width = self.cumulative.shape[2] - 1
+        oldest = 0 if max_age is None else year - max_age - self.first_jahrgang
+        youngest = year - min_age - self.first_jahrgang
+        start = min(max(oldest, 0), width)
+        stop = min(max(youngest + 1, start), width)
+        return start, stop
+
+    def count(self, gemeinde, year: int, min_age: int, max_age: int | None = None) -> int:
+        """Population of `gemeinde` aged min_age..max_age (inclusive, None = open) in `year`."""
+        g = self._gemeinde_index[gemeinde]
+        y = self._year_index[year]
+        start, stop = self._jahrgang_slice(year, min_age, max_age)
+        return int(self.cumulative[g, y, stop] - self.cumulative[g, y, start])
+
+    def _range_array(self, min_age: int, max_age: int | None) -> np.ndarray:
+        """Counts of one age range for all Gemeinden and years (Gemeinde x year)."""
+        slices = np.array([self._jahrgang_slice(year, min_age, max_age) for year in self.years], dtype=np.int64)
+        y = np.arange(len(self.years))
+        if not len(slices):
+            return np.zeros((len(self.gemeinden), 0), dtype=np.int64)
+        return self.cumulative[:, y, slices[:, 1]] - self.cumulative[:, y, slices[:, 0]]
+
+    def age_counts(self, max_age: int) -> np.ndarray:
+        """Population per single age 0..max_age (Gemeinde x year x age); the last age is open-ended."""
+        ages = [self._range_array(age, age) for age in range(max_age)] + [self._range_array(max_age, None)]
+        return np.stack(ages, axis=2)
+
+    def range_counts(self, min_age: int, max_age: int | None = None) -> pd.DataFrame:
+        """Population aged min_age..max_age per Gemeinde (rows) and year (columns)."""
+        return pd.DataFrame(self._range_array(min_age, max_age), index=pd.Index(self.gemeinden, name="Gemeinde"),
+                            columns=pd.Index(self.years, name="jahr"))
+
+    def band_table(self, bounds, labels: list[str] | None = None) -> pd.DataFrame:
+        """
+        Age-band totals like `common.age_bands.band_totals(..., by=["jahr", "Gemeinde"])`:
+        one row per year and Gemeinde (sorted), one column per band.
+        """
+        labels = labels or band_labels(bounds)
+        if len(labels) != len(bounds):
+            raise ValueError(f"{len(labels)} labels for {len(bounds)} age bands")
+
+        # The first band also takes younger ages and the last one is open-ended
+        ranges = [(0 if i == 0 else lower, None if i == len(bounds) - 1 else bounds[i + 1] - 1)
+                  for i, lower in enumerate(bounds)]
+        bands = [self._range_array(lower, upper) for lower, upper in ranges]
+
+        g, y = np.meshgrid(np.arange(len(self.gemeinden)), np.arange(len(self.years)))
+        g, y = g.ravel(), y.ravel()
+        present = self.present[g, y]
+        table = pd.DataFrame({
+            "jahr": np.asarray(self.years, dtype=np.int64)[y],
+            "Gemeinde": np.asarray(self.gemeinden)[g],
+            **{label: band[g, y] for label, band in zip(labels, bands)},
+        })
+        return table[present].reset_index(drop=True)
+
+    # Persistence
+
+    def save(self, name: str, directory: str = MATRIX_DIR) -> str:
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, name)
+        np.save(base + ".npy", self.cumulative)
+        index = {
+            "gemeinden": self.gemeinden,
+            "years": self.years,
+            "first_jahrgang": self.first_jahrgang,
+            "present": self.present.astype(int).tolist(),
+            "source_sha256": self.source_sha256,
+            "stichtage": self.stichtage,
+            "code_version": self.code_version,
+        }
+        with open(base + ".json.tmp", "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False, indent=2)
+        os.replace(base + ".json.tmp", base + ".json")
+        return base
+
+    @classmethod
+    def load(cls, base: str, mmap: bool = True) -> "AgeMatrix":
+        """Loads `<base>.npy`/`<base>.json`; the matrix is memory-mapped unless `mmap` is False."""
+        with open(base + ".json", "r", encoding="utf-8") as f:
+            index = json.load(f)
+        cumulative = np.load(base + ".npy", mmap_mode="r" if mmap else None)
+        return cls(cumulative, index["gemeinden"], index["years"], index["first_jahrgang"],
+                   np.array(index["present"], dtype=bool), index.get("source_sha256"), index.get("stichtage"),
+                   index.get("code_version"))
+
+
+def load_or_build(source_path: str, name: str, years: list[int], build, reuse: bool,
+                  directory: str = MATRIX_DIR) -> AgeMatrix:
+    """
+    Returns the stored matrix `name` if `reuse` is set and it was built from the current
+    content of `source_path` for the same years by the same code (the file defining
+    `build` and common/); otherwise calls `build(source_sha256)` and stores the new matrix.
+    """
+    digest = file_sha256(source_path)
+    version = code_version(inspect.getsourcefile(inspect.unwrap(build)))
+    base = os.path.join(directory, name)
+    if reuse and os.path.exists(base + ".npy") and os.path.exists(base + ".json"):
+        matrix = AgeMatrix.load(base)
+        if (matrix.source_sha256 == digest and matrix.years == [int(y) for y in years]
+                and matrix.stichtage is not None and matrix.code_version == version):
+            print(f"Age matrix reused: {base}.npy")
+            return matrix
+
+    matrix = build(digest)
+    matrix.code_version = version
+    matrix.save(name, directory)
+    return matrix
@@ -0,0 +1,164 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Nearest-provider distance and provider counts within a radius.
+#
+# Points are placed on the unit sphere (x, y, z), where the straight-line (chord)
+# distance grows monotonically with the great-circle distance, so nearest neighbours
+# and radius queries on the chord are exact for haversine distances.
+#
+# The KD-tree splits the points at the median of their widest axis down to leaves of
+# at most LEAF_SIZE points and keeps the bounding box of every leaf. Queries run for
+# all query points at once: leaves are visited in the order of their box distance, one
+# leaf per round for every query that can still improve, and a query stops as soon
+# as its next box is farther than its best distance. Radius counts only look at the
+# leaves whose box lies within the radius.
+#
+#     tree = KDTree(providers["longitude"], providers["latitude"])
+#     distance_km, index = tree.nearest(lon, lat)
+#     counts = tree.count_within(lon, lat, 5.0)
+
+EARTH_RADIUS_KM = 6371.0088
+LEAF_SIZE = 16
+DEFAULT_RADII_KM = (5.0, 10.0)
+
+
+def requested_radii() -> tuple[float, ...]:
+    """Coverage radii (km) selected via `--radius-km=5,10` or COVERAGE_RADII_KM (default: 5 and 10 km)."""
+    value = os.environ.get("COVERAGE_RADII_KM", "")
+    for arg in sys.argv[1:]:
+        if arg.startswith("--radius-km="):
+            value = arg.split("=", 1)[1]
+    if not value.strip():
+        return DEFAULT_RADII_KM
+    try:
+        radii = tuple(float(v) for v in value.split(",") if v.strip())
+    except ValueError:
+        raise ValueError(f"Invalid coverage radii '{value}': expected kilometres like '5,10'")
+    if any(r <= 0 for r in radii):
+        raise ValueError(f"Coverage radii must be positive: {value}")
+    return radii
+
+
+def unit_vectors(lon, lat) -> np.ndarray:
+    """Points on the unit sphere (n x 3) for lon/lat in degrees."""
+    lon = np.radians(np.asarray(lon, dtype=np.float64))
+    lat = np.radians(np.asarray(lat, dtype=np.float64))
+    return np.column_stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+
+
+def chord_to_km(chord) -> np.ndarray:
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(np.asarray(chord) / 2, 1.0))
+
+
+def km_to_chord(km) -> np.ndarray:
+    return 2 * np.sin(np.minimum(np.asarray(km, dtype=np.float64) / (2 * EARTH_RADIUS_KM), np.pi / 2))
+
+
+class KDTree:
+    def __init__(self, lon, lat, leaf_size: int = LEAF_SIZE):
+        points = unit_vectors(lon, lat)
+        if np.isnan(points).any():
+            raise ValueError("KDTree: points without coordinates")
+        self.size = len(points)
+
+        # Leaves as ranges of `order`, split at the median of the widest axis
+        order = np.arange(self.size)
+        leaves, pending = [], [order] if self.size else []
+        while pending:
+            part = pending.pop()
+            if len(part) <= leaf_size:
+                leaves.append(part)
+                continue
+            axis = np.argmax(np.ptp(points[part], axis=0))
+            part = part[np.argsort(points[part, axis], kind="stable")]
+            middle = len(part) // 2
+            pending += [part[middle:], part[:middle]]
+
+        # Leaf points padded to leaf_size (index -1, coordinates inf) and leaf boxes
+        self.leaf_index = np.full((len(leaves), leaf_size), -1, dtype=np.int64)
+        for i, leaf in enumerate(leaves):
+            self.leaf_index[i, :len(leaf)] = leaf
+        padded = np.vstack([points, np.full((1, 3), np.inf)])
+        self.leaf_points = padded[self.leaf_index]
+        self.low = np.array([points[leaf].min(axis=0) for leaf in leaves]).reshape(-1, 3)
+        self.high = np.array([points[leaf].max(axis=0) for leaf in leaves]).reshape(-1, 3)
+
+    def _box_distances(self, queries: np.ndarray) -> np.ndarray:
+        """Chord distance of every query to every leaf box (queries x leaves)."""
+        gap = np.maximum(self.low[None, :, :] - queries[:, None, :], 0) + np.maximum(queries[:, None, :] - self.high[None, :, :], 0)
+        return np.sqrt((gap ** 2).sum(axis=2))
+
+    def nearest(self, lon, lat) -> tuple[np.ndarray, np.ndarray]:
+        """Great-circle distance (km) to and index of the nearest point; NaN / -1 without coordinates or points."""
+        queries = unit_vectors(lon, lat)
+        best = np.full(len(queries), np.inf)
+        index = np.full(len(queries), -1, dtype=np.int64)
+        valid = np.flatnonzero(~np.isnan(queries).any(axis=1))
+        if not self.size or not len(valid):
+            return np.full(len(queries), np.nan), index
+
+        boxes = self._box_distances(queries[valid])
+        visit = np.argsort(boxes, axis=1)
+        box_sorted = np.take_along_axis(boxes, visit, axis=1)
+        for step in range(visit.shape[1]):
+            active = np.flatnonzero(box_sorted[:, step] < best[valid])
+            if not len(active):
+                break
+            q = valid[active]
+            leaf = visit[active, step]
+            distance = np.sqrt(((self.leaf_points[leaf] - queries[q][:, None, :]) ** 2).sum(axis=2))
+            closest = np.argmin(distance, axis=1)
+            closest_distance = distance[np.arange(len(q)), closest]
+            better = closest_distance < best[q]
+            best[q[better]] = closest_distance[better]
+            index[q[better]] = self.leaf_index[leaf[better], closest[better]]
+
+        return np.where(index >= 0, chord_to_km(np.where(index >= 0, best, 0.0)), np.nan), index
+
+    def count_within(self, lon, lat, radius_km: float) -> np.ndarray:
+        """Number of points within `radius_km` (great-circle) of every query; 0 without coordinates."""
+        queries = unit_vectors(lon, lat)
+        counts = np.zeros(len(queries), dtype=np.int64)
+        valid = np.flatnonzero(~np.isnan(queries).any(axis=1))
+        if not self.size or not len(valid):
+            return counts
+
+        radius = km_to_chord(radius_km)
+        query, leaf = np.nonzero(self._box_distances(queries[valid]) <= radius)
+        query = valid[query]
+        distance = np.sqrt(((self.leaf_points[leaf] - queries[query][:, None, :]) ** 2).sum(axis=2))
+        np.add.at(counts, query, (distance <= radius).sum(axis=1))
+        return counts
+
+
+def coverage_table(providers: pd.DataFrame, targets: pd.DataFrame, radii_km=DEFAULT_RADII_KM,
+                   group_column: str = "Branche", name_column: str = "Anbieter") -> pd.DataFrame:
+    """
+    One row per target (e.g. Gemeinde centroid, columns longitude/latitude plus any key
+    columns) and provider group: distance to the nearest provider of the group
+    (`naechster_anbieter_km`, its name in `naechster_anbieter`) and the number of its
+    providers within each radius (`anbieter_<r>km`). Providers without coordinates are
+    left out.
+    """
+    providers = providers.dropna(subset=["longitude", "latitude"])
+    key_columns = [c for c in targets.columns if c not in ("longitude", "latitude")]
+    tables = []
+    for group, members in providers.groupby(group_column, sort=True):
+        tree = KDTree(members["longitude"], members["latitude"])
+        distance, index = tree.nearest(targets["longitude"], targets["latitude"])
+        names = np.append(members[name_column].to_numpy(dtype=object), None)
+        table = targets[key_columns].reset_index(drop=True)
+        table.insert(len(key_columns), group_column, group)
+        table["naechster_anbieter"] = names[index]
+        table["naechster_anbieter_km"] = np.round(distance, 2)
+        for radius in radii_km:
+            table[f"anbieter_{radius:g}km"] = tree.count_within(targets["longitude"], targets["latitude"], radius)
+        tables.append(table)
+    if not tables:
+        return pd.DataFrame(columns=key_columns + [group_column, "naechster_anbieter", "naechster_anbieter_km"]
+                            + [f"anbieter_{radius:g}km" for radius in radii_km])
+    return pd.concat(tables, ignore_index=True)
@@ -0,0 +1,205 @@
+import datetime
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+
+import pandas as pd
+
+from common.mapping import KREIS_SCHLUESSEL, get_schluessel_by_gemeinde
+
+# Loads result tables into a SQL database (SQLite as local stand-in for the Superset database).
+#
+# Every table gets the canonical key columns `gemeinde_schluessel` and `jahr`:
+# - gemeinde_schluessel is taken from the table or resolved from its Gemeinde name column;
+#   tables without a Gemeinde column are district-level and get the Kreisschlüssel 6440
+# - jahr is taken from jahr/Jahr/year; tables without a year are stored with jahr = 0
+#
+# Rows are upserted on (gemeinde_schluessel, jahr, *extra keys) in batches inside one
+# transaction per year partition. A content hash per (table, jahr) is kept in `_partitions`,
+# so a refresh only touches partitions whose data actually changed.
+
+DATABASE_PATH = os.environ.get("DATABASE_PATH", os.path.join("result", "wetterau.sqlite"))
+BATCH_SIZE = 5000
+
+KEY_COLUMNS = ["gemeinde_schluessel", "jahr"]
+GEMEINDE_COLUMNS = ("gemeinde", "Gemeinde")
+YEAR_COLUMNS = ("jahr", "Jahr", "year")
+UNKNOWN_SCHLUESSEL = 0
+NO_YEAR = 0
+
+LOAD_ID_COLUMN = "_load_id"
+
+
+def table_name_for(path: str) -> str:
+    """SQL table name derived from an output file name (result/Arbeitslose_X.xlsx -> arbeitslose_x)."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return re.sub(r"[^0-9a-z]+", "_", stem.lower().replace("ä", "ae").replace("ö", "oe").replace("ü", "ue").replace("ß", "ss")).strip("_")
+
+
+def quote(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def sql_type(dtype) -> str:
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(dtype):
+        return "REAL"
+    return "TEXT"
+
+
+def schluessel_values(df: pd.DataFrame) -> pd.Series:
+    """
+    Gemeindeschlüssel per row: the `gemeinde_schluessel` column, else resolved from the
+    Gemeinde name column, else the Kreisschlüssel (district-level table). NaN where unknown.
+    """
+    if "gemeinde_schluessel" in df.columns:
+        return pd.to_numeric(df["gemeinde_schluessel"], errors="coerce")
+    name_col = next((c for c in GEMEINDE_COLUMNS if c in df.columns), None)
+    if name_col is None:
+        return pd.Series(KREIS_SCHLUESSEL, index=df.index, dtype="int64")
+    names = df[name_col].astype(str)
+    lookup = {name: get_schluessel_by_gemeinde(name) for name in names.unique()}
+    return pd.to_numeric(names.map(lookup), errors="coerce")
+
+
+def year_column(df: pd.DataFrame) -> str | None:
+    """The year column of `df` (jahr, Jahr or year), None for tables without a year."""
+    return next((c for c in YEAR_COLUMNS if c in df.columns), None)
+
+
+def with_canonical_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns a copy of `df` with integer `gemeinde_schluessel` and `jahr` columns; rows
+    without a resolvable Gemeinde get UNKNOWN_SCHLUESSEL, rows without a year NO_YEAR.
+    """
+    df = df.copy()
+
+    df["gemeinde_schluessel"] = schluessel_values(df).fillna(UNKNOWN_SCHLUESSEL).astype("int64")
+
+    year_col = year_column(df)
+    if year_col is None:
+        df["jahr"] = NO_YEAR
+    elif year_col.lower() == "jahr":
+        # SQL column names are case-insensitive, "Jahr" and "jahr" cannot coexist
+        df = df.rename(columns={year_col: "jahr"})
+    else:
+        df["jahr"] = df[year_col]
+    df["jahr"] = pd.to_numeric(df["jahr"], errors="coerce").fillna(NO_YEAR).astype("int64")
+    return df
+
+
+def partition_hash(part: pd.DataFrame) -> str:
+    """Content hash of one partition, independent of row order."""
+    row_hashes = pd.util.hash_pandas_object(part.reset_index(drop=True), index=False).sort_values()
+    digest = hashlib.sha256(row_hashes.to_numpy().tobytes())
+    digest.update("|".join(f"{c}:{t}" for c, t in part.dtypes.items()).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def ensure_schema(conn: sqlite3.Connection, table: str, df: pd.DataFrame, keys: list[str]):
+    """Creates the table and its indexes or adds columns that are new in `df`."""
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS _partitions ("
+        "table_name TEXT NOT NULL, jahr INTEGER NOT NULL, hash TEXT NOT NULL, loaded_at TEXT NOT NULL, "
+        "PRIMARY KEY (table_name, jahr))"
+    )
+
+    existing = [row[1] for row in conn.execute(f"PRAGMA table_info({quote(table)})")]
+    if not existing:
+        columns = [
+            f"{quote(c)} {sql_type(t)}" + (" NOT NULL" if c in keys else "")
+            for c, t in df.dtypes.items()
+        ]
+        columns.append(f"{quote(LOAD_ID_COLUMN)} TEXT")
+        conn.execute(f"CREATE TABLE {quote(table)} ({', '.join(columns)})")
+    else:
+        for c, t in df.dtypes.items():
+            if c not in existing:
+                conn.execute(f"ALTER TABLE {quote(table)} ADD COLUMN {quote(c)} {sql_type(t)}")
+
+    key_list = ", ".join(quote(k) for k in keys)
+    conn.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {quote('ux_' + table + '_key')} ON {quote(table)} ({key_list})")
+    conn.execute(f"CREATE INDEX IF NOT EXISTS {quote('ix_' + table + '_jahr')} ON {quote(table)} (jahr)")
+    conn.execute(f"CREATE INDEX IF NOT EXISTS {quote('ix_' + table + '_gemeinde')} ON {quote(table)} (gemeinde_schluessel, jahr)")
+
+
+def upsert_partition(conn: sqlite3.Connection, table: str, part: pd.DataFrame, keys: list[str], jahr: int, load_id: str):
+    """Upserts one year partition in batches and removes rows of that year that are no longer present."""
+    columns = list(part.columns) + [LOAD_ID_COLUMN]
+    column_list = ", ".join(quote(c) for c in columns)
+    placeholders = ", ".join("?" for _ in columns)
+    updates = ", ".join(f"{quote(c)} = excluded.{quote(c)}" for c in columns if c not in keys)
+    sql = (
+        f"INSERT INTO {quote(table)} ({column_list}) VALUES ({placeholders}) "
+        f"ON CONFLICT ({', '.join(quote(k) for k in keys)}) DO UPDATE SET {updates}"
+    )
+
+    values = part.astype(object).where(part.notna(), None)
+    rows = [tuple(row) + (load_id,) for row in values.itertuples(index=False, name=None)]
+    for start in range(0, len(rows), BATCH_SIZE):
+        conn.executemany(sql, rows[start:start + BATCH_SIZE])
+
+    conn.execute(
+        f"DELETE FROM {quote(table)} WHERE jahr = ? AND {quote(LOAD_ID_COLUMN)} != ?",
+        (jahr, load_id),
+    )
+
+
+def load_table(df: pd.DataFrame, table: str, key_columns: list[str] | None = None,
+               db_path: str | None = None) -> dict:
+    """
+    Loads a result table into the database.
+
+    `key_columns` are extra key columns (e.g. ["Geschlecht"]) that together with
+    (gemeinde_schluessel, jahr) identify a row. Returns {"loaded": [...], "unchanged": [...]} years.
+    """
+    db_path = db_path or DATABASE_PATH
+    keys = KEY_COLUMNS + [c for c in (key_columns or []) if c not in KEY_COLUMNS]
+
+    df = with_canonical_keys(df).drop_duplicates()
+    unknown = int((df["gemeinde_schluessel"] == UNKNOWN_SCHLUESSEL).sum())
+    if unknown:
+        logging.warning(f"DB loader: table '{table}' has {unknown} row(s) without Gemeindeschlüssel, "
+                        f"stored as {UNKNOWN_SCHLUESSEL}")
+    duplicated = df.duplicated(subset=keys)
+    if duplicated.any():
+        raise ValueError(f"Table '{table}': key {keys} is not unique ({duplicated.sum()} duplicate rows)")
+
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    result = {"loaded": [], "unchanged": []}
+    try:
+        with conn:
+            ensure_schema(conn, table, df, keys)
+            stored = dict(conn.execute("SELECT jahr, hash FROM _partitions WHERE table_name = ?", (table,)))
+
+        load_id = datetime.datetime.now().isoformat(timespec="microseconds")
+        for jahr, part in df.groupby("jahr", sort=True):
+            jahr = int(jahr)
+            digest = partition_hash(part)
+            if stored.get(jahr) == digest:
+                result["unchanged"].append(jahr)
+                continue
+            with conn:  # one transaction per partition
+                upsert_partition(conn, table, part, keys, jahr, load_id)
+                conn.execute(
+                    "INSERT OR REPLACE INTO _partitions (table_name, jahr, hash, loaded_at) VALUES (?, ?, ?, ?)",
+                    (table, jahr, digest, load_id),
+                )
+            result["loaded"].append(jahr)
+
+        # Years that disappeared from the result
+        removed = set(stored) - set(int(j) for j in df["jahr"].unique())
+        if removed:
+            with conn:
+                for jahr in sorted(removed):
+                    conn.execute(f"DELETE FROM {quote(table)} WHERE jahr = ?", (jahr,))
+                    conn.execute("DELETE FROM _partitions WHERE table_name = ? AND jahr = ?", (table, jahr))
+    finally:
+        conn.close()
+
+    print(f"DB {db_path}: {table} loaded {result['loaded'] or '-'}, unchanged {result['unchanged'] or '-'}")
+    return result
@@ -0,0 +1,101 @@
+import os
+import re
+import warnings
+
+import pandas as pd
+
+from common.mapping import normalize_gemeinde_name
+from common.memo import memoize
+from common.schema import apply_schema
+
+# Pendler figures per Gemeinde from the gemband workbooks (sheet "Gemeindedaten"),
+# shared by arbeitsmarkt-gesamt.py and arbeitsmarkt-gesamt-2.py:
+#
+#     frames = process_partitions(GEMBAND_DATASET, gemband_files(), try_extract_gemband_data)
+#
+# `extract_gemband_data` returns the columns gemeinde, year and GEMBAND_COL_MAP; the
+# scripts rename them to their own output columns. As both scripts call the same
+# function and use the same partition store, a workbook is read once for both.
+
+GEMBAND_DIR = "data/gemband"
+GEMBAND_DATASET = "gemband"
+
+GEMBAND_COL_MAP = {
+    "male-pendler": 3,   # D -> Männer (Pendlersaldo)
+    "female-pendler": 4, # E -> Frauen (Pendlersaldo)
+    "einpendler": 12,      # M -> Einpendler
+    "auspendler": 13,     # N -> Auspendler
+}
+
+# Rows of the Wetterau block per year (0-based), the sheet layout shifts between years
+ROW_RANGE_BY_YEAR = {
+    2020: (2947, 2971), # (2948–2972)
+    2021: (2947, 2971), # (2948–2972)
+    2022: (2945, 2969), # (2946–2970)
+    2023: (2942, 2966), # (2943–2967)
+    2024: (2942, 2966), # (2943–2967)
+}
+
+
+def gemband_files(directory: str = GEMBAND_DIR) -> list[str]:
+    """The gemband workbooks (.xlsx/.xlsb) in `directory`, sorted by name."""
+    return [
+        os.path.join(directory, file)
+        for file in sorted(os.listdir(directory))
+        if file.endswith((".xlsx", ".xlsb"))
+    ]
+
+
+def parse_value(v):
+    # Safely convert value to float; fallback to 0 on failure
+    try:
+        return float(v)
+    except Exception:
+        return 0.0
+
+
+@memoize
+def extract_gemband_data(file_path: str) -> pd.DataFrame:
+    """Pendler columns per Gemeinde of one gemband workbook; the year comes from the file name."""
+    filename = os.path.basename(file_path)
+    match = re.search(r"0-(\d{4})06", filename)
+    year = int(match.group(1)) if match else None
+    if not year:
+        raise ValueError(f"Cannot extract year from filename: {filename}")
+    if year not in ROW_RANGE_BY_YEAR:
+        raise ValueError(f"No row mapping for year: {year}")
+
+    # .xlsb needs pyxlsb; the workbooks trigger openpyxl style warnings
+    _, ext = os.path.splitext(file_path)
+    engine = "pyxlsb" if ext == ".xlsb" else None
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        df = pd.read_excel(file_path, sheet_name="Gemeindedaten", engine=engine, header=None)
+
+    row_start, row_end = ROW_RANGE_BY_YEAR[year]
+    result = []
+    for idx in range(row_start, row_end + 1):
+        row = df.iloc[idx]
+        gemeinde_raw = str(row[1]).strip()
+        if not gemeinde_raw or gemeinde_raw.lower() == "nan":
+            continue
+
+        gemeinde = normalize_gemeinde_name(gemeinde_raw)
+        if not gemeinde or gemeinde == "Unbekannt":
+            continue
+
+        entry = {"gemeinde": gemeinde, "year": year}
+        for name, col_idx in GEMBAND_COL_MAP.items():
+            entry[name] = parse_value(row[col_idx])
+        result.append(entry)
+
+    return apply_schema(pd.DataFrame(result), "gemband")
+
+
+def try_extract_gemband_data(file_path: str) -> pd.DataFrame | None:
+    # Extract one gemband file; report and skip files that cannot be read
+    try:
+        return extract_gemband_data(file_path)
+    except Exception as e:
+        print(f"Error. Read file {os.path.basename(file_path)}: {e}")
+        return None
@@ -52,6 +52,7 @@ gemeinde_aliases = {
         "Rosbach v d Höhe",
         "Rosbach v d Höhe Stadt",
         "Rosbach v. d. Höhe, Stadt",
+        "Rosbach",
     ],
     "Wölfersheim": ["Wölfersheim"],
     "Wöllstadt": ["Wöllstadt"],
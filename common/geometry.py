@@ -0,0 +1,208 @@
+import functools
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from common.incremental import file_sha256
+from common.mapping import KREIS_SCHLUESSEL
+from common.polygons import POLYGON_STORE, PolygonStore, polygon_store
+
+# Geometry of the Gemeinde boundaries on the ETRS89 Lambert azimuthal equal-area
+# projection (EPSG:3035, metres), so that areas are true areas and centroids are not
+# distorted by the longitude/latitude grid.
+#
+# Projection formulas: Snyder, "Map Projections - A Working Manual" (1987), p. 187 ff.
+# (ellipsoidal, oblique aspect); the inverse uses the series for the authalic latitude.
+#
+# `gemeinde_geometry()` holds area, centroid and bounding box per Gemeinde. It is computed
+# once per version of the polygon store and cached in result/.geometry/, so scripts
+# join the attributes (e.g. population density with `add_density`) instead of
+# recomputing them or taking hand-made values.
+#
+# `dissolve` merges Gemeinden into one area (e.g. a planning area): borders shared by two
+# members cancel out, the remaining edges are chained into the outer rings (and holes).
+
+# GRS80 ellipsoid and EPSG:3035 parameters
+SEMI_MAJOR_AXIS = 6378137.0
+FLATTENING = 1 / 298.257222101
+CENTER_LAT = 52.0
+CENTER_LON = 10.0
+FALSE_EASTING = 4321000.0
+FALSE_NORTHING = 3210000.0
+
+GEOMETRY_CACHE = os.path.join("result", ".geometry", "gemeinde_geometry.json")
+
+_E2 = FLATTENING * (2 - FLATTENING)
+_E = np.sqrt(_E2)
+
+
+def _q(sin_lat):
+    return (1 - _E2) * (sin_lat / (1 - _E2 * sin_lat ** 2)
+                        - np.log((1 - _E * sin_lat) / (1 + _E * sin_lat)) / (2 * _E))
+
+
+_QP = _q(1.0)
+_RQ = SEMI_MAJOR_AXIS * np.sqrt(_QP / 2)
+_BETA0 = np.arcsin(_q(np.sin(np.radians(CENTER_LAT))) / _QP)
+_D = (SEMI_MAJOR_AXIS * np.cos(np.radians(CENTER_LAT))
+      / (np.sqrt(1 - _E2 * np.sin(np.radians(CENTER_LAT)) ** 2) * _RQ * np.cos(_BETA0)))
+
+
+def to_laea(lon, lat) -> tuple[np.ndarray, np.ndarray]:
+    """Projects lon/lat (degrees) to EPSG:3035 x/y (metres)."""
+    lam = np.radians(np.asarray(lon, dtype=np.float64)) - np.radians(CENTER_LON)
+    beta = np.arcsin(_q(np.sin(np.radians(np.asarray(lat, dtype=np.float64)))) / _QP)
+    b = _RQ * np.sqrt(2 / (1 + np.sin(_BETA0) * np.sin(beta) + np.cos(_BETA0) * np.cos(beta) * np.cos(lam)))
+    x = FALSE_EASTING + b * _D * np.cos(beta) * np.sin(lam)
+    y = FALSE_NORTHING + (b / _D) * (np.cos(_BETA0) * np.sin(beta) - np.sin(_BETA0) * np.cos(beta) * np.cos(lam))
+    return x, y
+
+
+def from_laea(x, y) -> tuple[np.ndarray, np.ndarray]:
+    """Inverse of `to_laea`: EPSG:3035 x/y (metres) to lon/lat (degrees)."""
+    dx = np.asarray(x, dtype=np.float64) - FALSE_EASTING
+    dy = np.asarray(y, dtype=np.float64) - FALSE_NORTHING
+    rho = np.hypot(dx / _D, _D * dy)
+    c = 2 * np.arcsin(rho / (2 * _RQ))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        beta = np.where(rho > 0, np.arcsin(np.cos(c) * np.sin(_BETA0) + _D * dy * np.sin(c) * np.cos(_BETA0) / rho), _BETA0)
+    lam = np.arctan2(dx * np.sin(c), _D * rho * np.cos(_BETA0) * np.cos(c) - _D ** 2 * dy * np.sin(_BETA0) * np.sin(c))
+    lat = (beta
+           + (_E2 / 3 + 31 * _E2 ** 2 / 180 + 517 * _E2 ** 3 / 5040) * np.sin(2 * beta)
+           + (23 * _E2 ** 2 / 360 + 251 * _E2 ** 3 / 3780) * np.sin(4 * beta)
+           + (761 * _E2 ** 3 / 45360) * np.sin(6 * beta))
+    return np.degrees(lam) + CENTER_LON, np.degrees(lat)
+
+
+def _ring_moments(store: PolygonStore) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Signed area (m²) and centroid x/y (EPSG:3035) of every ring (shoelace formula)."""
+    lonlat = np.asarray(store.coordinates, dtype=np.float64) / store.scale
+    x, y = to_laea(lonlat[:, 0], lonlat[:, 1])
+    ring_of = np.repeat(np.arange(len(store)), np.diff(store.offsets))
+    same_ring = ring_of[1:] == ring_of[:-1]
+    x0, y0, x1, y1 = x[:-1][same_ring], y[:-1][same_ring], x[1:][same_ring], y[1:][same_ring]
+    ring = ring_of[1:][same_ring]
+
+    # Relative to the first vertex of the ring, for numerical stability
+    ox, oy = x[store.offsets[:-1]][ring], y[store.offsets[:-1]][ring]
+    x0, x1, y0, y1 = x0 - ox, x1 - ox, y0 - oy, y1 - oy
+    cross = x0 * y1 - x1 * y0
+    area = np.bincount(ring, weights=cross, minlength=len(store)) / 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cx = np.bincount(ring, weights=(x0 + x1) * cross, minlength=len(store)) / (6 * area)
+        cy = np.bincount(ring, weights=(y0 + y1) * cross, minlength=len(store)) / (6 * area)
+    return area, cx + x[store.offsets[:-1]], cy + y[store.offsets[:-1]]
+
+
+def geometry_table(store: PolygonStore) -> pd.DataFrame:
+    """
+    Area (km², equal-area), area centroid and bounding box (longitude/latitude) of every
+    ring, indexed by key, plus the Gemeindeschlüssel.
+    """
+    area, cx, cy = _ring_moments(store)
+    lon, lat = from_laea(cx, cy)
+    lonlat = np.asarray(store.coordinates, dtype=np.float64) / store.scale
+    starts = store.offsets[:-1]
+    low = np.minimum.reduceat(lonlat, starts, axis=0)
+    high = np.maximum.reduceat(lonlat, starts, axis=0)
+    return pd.DataFrame({
+        "gemeinde_schluessel": [int(k) for k in store.keys],
+        "flaeche_km2": np.round(np.abs(area) / 1e6, 3),
+        "longitude": lon,
+        "latitude": lat,
+        "lon_min": low[:, 0],
+        "lat_min": low[:, 1],
+        "lon_max": high[:, 0],
+        "lat_max": high[:, 1],
+    }, index=pd.Index(store.keys, name="Gemeindekennziffer"))
+
+
+@functools.lru_cache(maxsize=None)
+def gemeinde_geometry(base: str = POLYGON_STORE, cache_path: str = GEOMETRY_CACHE) -> pd.DataFrame:
+    """Geometry attributes of the Gemeinden (`geometry_table`), cached per polygon store content."""
+    digest = file_sha256(base + ".npy")
+    if os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("source_sha256") == digest:
+            return pd.DataFrame.from_records(cached["rows"], index="Gemeindekennziffer")
+
+    table = geometry_table(polygon_store(base))
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    with open(cache_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"source_sha256": digest, "rows": table.reset_index().to_dict(orient="records")}, f, indent=1)
+    os.replace(cache_path + ".tmp", cache_path)
+    return table
+
+
+def add_density(df: pd.DataFrame, population_columns: list[str], area_column: str = "flaeche_km2",
+                name: str = "einwohner_je_km2") -> pd.DataFrame:
+    """
+    Adds the area of the row's Gemeinde (by `gemeinde_schluessel`; the Kreisschlüssel gets
+    the whole district) and the population (sum of `population_columns`) per km².
+    """
+    geometry = gemeinde_geometry()
+    areas = geometry.set_index("gemeinde_schluessel")["flaeche_km2"]
+    areas.loc[KREIS_SCHLUESSEL] = round(areas.sum(), 3)
+
+    area = pd.to_numeric(df["gemeinde_schluessel"], errors="coerce").map(areas)
+    population = df[population_columns].apply(pd.to_numeric, errors="coerce").sum(axis=1, min_count=1)
+    df = df.copy()
+    df[area_column] = area
+    df[name] = (population / area).round(1)
+    return df
+
+
+def signed_area(ring: np.ndarray) -> float:
+    """Shoelace area of a closed ring in its own units; positive if counter-clockwise."""
+    x, y = ring[:, 0].astype(np.float64), ring[:, 1].astype(np.float64)
+    return float((x[:-1] * y[1:] - x[1:] * y[:-1]).sum() / 2)
+
+
+def dissolve(store: PolygonStore, keys) -> list[np.ndarray]:
+    """
+    Rings (fixed-point like the store, closed) of the union of the rings `keys`: outer
+    rings counter-clockwise, holes clockwise. Only borders with identical vertices on
+    both sides cancel out, as in the Gemeinde boundaries and their simplified levels.
+    """
+    edges = []
+    for key in dict.fromkeys(keys):
+        ring = np.asarray(store.fixed(key), dtype=np.int64)
+        if signed_area(ring) < 0:
+            ring = ring[::-1]
+        edges.append(np.column_stack([ring[:-1], ring[1:]]))
+    if not edges:
+        return []
+    edges = np.concatenate(edges)
+    start = edges[:, 0] << 32 | (edges[:, 1] & 0xFFFFFFFF)
+    end = edges[:, 2] << 32 | (edges[:, 3] & 0xFFFFFFFF)
+    start, end = start[start != end], end[start != end]
+
+    # Net use of every undirected edge: +1 from the lower to the higher vertex, -1 back
+    forward = start < end
+    pairs, pair = np.unique(np.column_stack([np.minimum(start, end), np.maximum(start, end)]), axis=0, return_inverse=True)
+    net = np.bincount(pair.reshape(-1), weights=np.where(forward, 1, -1), minlength=len(pairs)).astype(np.int64)
+    directed = np.where((net > 0)[:, None], pairs, pairs[:, ::-1])
+    directed = np.repeat(directed, np.abs(net), axis=0)
+    directed = directed[np.lexsort((directed[:, 1], directed[:, 0]))]
+
+    # Chain the remaining edges into closed rings
+    outgoing = {}
+    for i, s in enumerate(directed[:, 0].tolist()):
+        outgoing.setdefault(s, []).append(i)
+    used = np.zeros(len(directed), dtype=bool)
+    rings = []
+    for i in range(len(directed)):
+        if used[i]:
+            continue
+        ring = [int(directed[i, 0])]
+        current = i
+        while current is not None:
+            used[current] = True
+            ring.append(int(directed[current, 1]))
+            current = next((j for j in outgoing.get(ring[-1], []) if not used[j]), None)
+        packed = np.array(ring, dtype=np.int64)
+        rings.append(np.column_stack([packed >> 32, (packed & 0xFFFFFFFF).astype(np.uint32).view(np.int32)]).astype(np.int32))
+    return rings
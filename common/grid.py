@@ -0,0 +1,119 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from common.geometry import from_laea, to_laea
+from common.polygons import polygon_store
+
+# Point counts on a regular grid for map layers (heatmaps / deck.gl grid and hexagon layers).
+#
+# Points are binned on the equal-area projection EPSG:3035, so every cell of one
+# resolution covers the same area. The grid starts at the lower left corner of the
+# district's bounding box; points outside it are left out. Square cells are
+# floor((x - x0) / size); hexagons (pointy top, `size` = distance between neighbouring
+# centres) use axial coordinates with cube rounding. All points and resolutions are
+# binned with array operations and counted with one groupby per resolution.
+#
+# Cell kind and resolutions are selected with `--grid=hex` (GRID_KIND) and
+# `--grid-km=1,2,5` (GRID_KM).
+
+GRID_KINDS = ("square", "hex")
+DEFAULT_GRID_KIND = "square"
+DEFAULT_GRID_KM = (1.0, 2.0, 5.0)
+
+
+def requested_grid() -> tuple[str, tuple[float, ...]]:
+    """Cell kind and sizes (km) selected via `--grid=`/GRID_KIND and `--grid-km=`/GRID_KM."""
+    kind = os.environ.get("GRID_KIND", "")
+    sizes = os.environ.get("GRID_KM", "")
+    for arg in sys.argv[1:]:
+        if arg.startswith("--grid="):
+            kind = arg.split("=", 1)[1]
+        elif arg.startswith("--grid-km="):
+            sizes = arg.split("=", 1)[1]
+
+    kind = kind.strip().lower() or DEFAULT_GRID_KIND
+    if kind not in GRID_KINDS:
+        raise ValueError(f"Unknown grid kind '{kind}', expected one of {', '.join(GRID_KINDS)}")
+    if not sizes.strip():
+        return kind, DEFAULT_GRID_KM
+    try:
+        resolutions = tuple(float(v) for v in sizes.split(",") if v.strip())
+    except ValueError:
+        raise ValueError(f"Invalid grid sizes '{sizes}': expected kilometres like '1,2,5'")
+    if not resolutions or any(r <= 0 for r in resolutions):
+        raise ValueError(f"Grid sizes must be positive: {sizes}")
+    return kind, resolutions
+
+
+def district_extent() -> tuple[float, float, float, float]:
+    """Bounding box (x_min, y_min, x_max, y_max, EPSG:3035) of all Gemeinde boundaries."""
+    store = polygon_store()
+    lonlat = np.asarray(store.coordinates, dtype=np.float64) / store.scale
+    x, y = to_laea(lonlat[:, 0], lonlat[:, 1])
+    return x.min(), y.min(), x.max(), y.max()
+
+
+def square_cells(x: np.ndarray, y: np.ndarray, size: float) -> tuple[np.ndarray, np.ndarray]:
+    """Column and row of the square cell of every point (relative coordinates, metres)."""
+    return np.floor(x / size).astype(np.int64), np.floor(y / size).astype(np.int64)
+
+
+def square_centres(column: np.ndarray, row: np.ndarray, size: float) -> tuple[np.ndarray, np.ndarray]:
+    return (column + 0.5) * size, (row + 0.5) * size
+
+
+def hex_cells(x: np.ndarray, y: np.ndarray, size: float) -> tuple[np.ndarray, np.ndarray]:
+    """Axial coordinates (q, r) of the pointy-top hexagon of every point (relative coordinates, metres)."""
+    radius = size / np.sqrt(3)
+    q = (np.sqrt(3) / 3 * x - y / 3) / radius
+    r = (2 / 3 * y) / radius
+    s = -q - r
+    rq, rr, rs = np.rint(q), np.rint(r), np.rint(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+    # The component with the largest rounding error follows from the other two
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    rq = np.where(fix_q, -rr - rs, rq)
+    rr = np.where(fix_r, -rq - rs, rr)
+    return rq.astype(np.int64), rr.astype(np.int64)
+
+
+def hex_centres(q: np.ndarray, r: np.ndarray, size: float) -> tuple[np.ndarray, np.ndarray]:
+    radius = size / np.sqrt(3)
+    return radius * np.sqrt(3) * (q + r / 2), radius * 1.5 * r
+
+
+def grid_counts(df: pd.DataFrame, group_column: str = "Branche", kind: str = DEFAULT_GRID_KIND,
+                sizes_km=DEFAULT_GRID_KM, count_name: str = "anbieter") -> pd.DataFrame:
+    """
+    Number of points (rows with longitude/latitude) per cell and group for every cell
+    size: one row per non-empty cell with the size, cell coordinates (column/row or q/r)
+    and the cell centre as longitude/latitude.
+    """
+    cells, centres = (square_cells, square_centres) if kind == "square" else (hex_cells, hex_centres)
+    x0, y0, x1, y1 = district_extent()
+    points = df.dropna(subset=["longitude", "latitude"])
+    x, y = to_laea(points["longitude"].to_numpy(dtype=np.float64), points["latitude"].to_numpy(dtype=np.float64))
+    inside = (x >= x0) & (x <= x1) & (y >= y0) & (y <= y1)
+    points, x, y = points[inside], x[inside] - x0, y[inside] - y0
+
+    tables = []
+    for size_km in sizes_km:
+        size = size_km * 1000
+        a, b = cells(x, y, size)
+        counts = (pd.DataFrame({group_column: points[group_column].to_numpy(), "a": a, "b": b})
+                  .groupby([group_column, "a", "b"], sort=True).size().rename(count_name).reset_index())
+        cx, cy = centres(counts["a"].to_numpy(), counts["b"].to_numpy(), size)
+        lon, lat = from_laea(cx + x0, cy + y0)
+        counts.insert(0, "zelle_km", size_km)
+        counts["longitude"] = np.round(lon, 6)
+        counts["latitude"] = np.round(lat, 6)
+        tables.append(counts)
+
+    names = {"a": "spalte", "b": "zeile"} if kind == "square" else {"a": "q", "b": "r"}
+    if not tables:
+        return pd.DataFrame(columns=["zelle_km", group_column, *names.values(), count_name, "longitude", "latitude"])
+    return pd.concat(tables, ignore_index=True).rename(columns=names)
@@ -0,0 +1,181 @@
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pickle
+import sys
+
+# Incremental processing of yearly input files.
+# Every input file (one file = one year) is treated as a partition: its extracted
+# result is stored next to a fingerprint of the file. On an incremental run only
+# new or modified files are processed again, unchanged years are taken from the
+# partition store and deleted files drop out. The caller receives the partitions in
+# the same order as a full run would produce them, so the written output is identical.
+# A partition also records the code version it was built with (the extracting script
+# and everything in common/, as for common/memo.py), so changed extraction code
+# rebuilds all years instead of mixing old and new partitions.
+
+STATE_DIR = os.path.join("result", ".incremental")
+MANIFEST_NAME = "manifest.json"
+COMMON_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def incremental_requested() -> bool:
+    """
+    Returns True if the current run should reuse unchanged year partitions.
+    Enabled with the command line flag `--incremental` or the env var INCREMENTAL=1.
+    """
+    return "--incremental" in sys.argv[1:] or os.environ.get("INCREMENTAL") == "1"
+
+
+def file_sha256(path: str) -> str:
+    """Returns the SHA-256 of a file's content, read in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def code_version(source_file: str) -> str:
+    """Hash of `source_file` and all files in common/."""
+    paths = [source_file]
+    for root, dirs, files in os.walk(COMMON_DIR):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        paths += [os.path.join(root, f) for f in sorted(files) if not f.endswith((".pyc", ".tmp"))]
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.relpath(path, COMMON_DIR).encode("utf-8"))
+        digest.update(file_sha256(path).encode("ascii"))
+    return digest.hexdigest()
+
+
+class PartitionStore:
+    """
+    On-disk store of per-file (= per-year) extraction results for one dataset.
+
+    Layout: <state_dir>/<dataset>/manifest.json plus one pickle per partition.
+    The manifest keeps size, mtime and content hash of the source file and the
+    `version` of the code that built the partition; the hash is only recomputed when
+    size or mtime differ, so untouched files cost one stat().
+    """
+
+    def __init__(self, dataset: str, state_dir: str = STATE_DIR, version: str | None = None):
+        self.directory = os.path.join(state_dir, dataset)
+        self.version = version
+        self.manifest_path = os.path.join(self.directory, MANIFEST_NAME)
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> dict:
+        if not os.path.exists(self.manifest_path):
+            return {}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            logging.warning(f"Incremental manifest corrupted, full rebuild: {self.manifest_path}")
+            return {}
+
+    def save_manifest(self):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _partition_path(self, key: str) -> str:
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.directory, f"{name}.pkl")
+
+    def is_current(self, path: str) -> bool:
+        """True if the stored partition of `path` was built from the file as it is now."""
+        key = os.path.basename(path)
+        entry = self.manifest.get(key)
+        if entry is None or entry.get("code_version") != self.version or not os.path.exists(self._partition_path(key)):
+            return False
+
+        stat = os.stat(path)
+        if entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return True
+        if entry["size"] != stat.st_size:
+            return False
+
+        # Same size but touched: compare content and remember the new mtime
+        if file_sha256(path) != entry["sha256"]:
+            return False
+        entry["mtime_ns"] = stat.st_mtime_ns
+        return True
+
+    def load(self, path: str):
+        with open(self._partition_path(os.path.basename(path)), "rb") as f:
+            return pickle.load(f)
+
+    def store(self, path: str, result):
+        key = os.path.basename(path)
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._partition_path(key), "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        stat = os.stat(path)
+        self.manifest[key] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": file_sha256(path),
+            "code_version": self.version,
+        }
+
+    def prune(self, paths: list):
+        """Removes partitions whose source file is no longer part of the input."""
+        keep = {os.path.basename(p) for p in paths}
+        for key in list(self.manifest):
+            if key in keep:
+                continue
+            partition_path = self._partition_path(key)
+            if os.path.exists(partition_path):
+                os.remove(partition_path)
+            del self.manifest[key]
+            print(f"Partition removed: {key}")
+
+
+def process_partitions(dataset: str, paths: list, process, incremental: bool | None = None) -> list:
+    """
+    Applies `process(path)` to every input file and returns the results in the order of `paths`.
+
+    - incremental=True: unchanged files are loaded from the partition store,
+      only new or modified files are processed
+    - incremental=False: every file is processed (full rebuild); the store is refreshed
+      so that the next incremental run can start from it
+    - incremental=None: decided by `incremental_requested()`
+
+    Results must be picklable (DataFrames, dicts, ...). A result of None marks a failed
+    file: it is left out of the returned list and not stored. Partitions are rebuilt
+    when the file defining `process` or anything in common/ changed.
+    """
+    if incremental is None:
+        incremental = incremental_requested()
+
+    store = PartitionStore(dataset, version=code_version(inspect.getsourcefile(inspect.unwrap(process))))
+    results = []
+    processed = 0
+
+    for path in paths:
+        if incremental and store.is_current(path):
+            results.append(store.load(path))
+            continue
+        result = process(path)
+        processed += 1
+        if result is None:
+            # Failed files are not stored, they are retried on the next run
+            continue
+        store.store(path, result)
+        results.append(result)
+
+    store.prune(paths)
+    store.save_manifest()
+
+    if incremental:
+        print(f"[{dataset}] incremental: {processed} of {len(paths)} file(s) processed")
+    return results
@@ -0,0 +1,201 @@
+import cProfile
+import datetime
+import functools
+import json
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+# Lightweight per-stage instrumentation for the processing scripts.
+#
+# Usage in a script:
+#     with stage("extract") as s:
+#         df = ...
+#         s.rows = len(df)
+#
+#     if __name__ == "__main__":
+#         run_instrumented(main, "altersverteilung")
+#
+# Switches (environment variables):
+# - DATEN_METRICS=1   record wall time, CPU time, peak RSS and row counts per stage and
+#                     write a JSON report to result/metrics/<script>.json (plus the memory
+#                     of the result tables, see common/schema.py, and the unmatched keys
+#                     of merged tables, see common/merge.py)
+# - DATEN_CPROFILE=1  run the whole script under cProfile and write result/metrics/<script>.prof
+#
+# With both switches off, `stage()` returns a shared no-op object, so instrumented code
+# pays one function call and one `if` per stage.
+#
+# The OS only reports the peak RSS of the whole process so far, so a stage records that
+# (`process_peak_rss_mb`) and how far the stage raised it (`peak_growth_mb`; 0 means the
+# stage stayed below the peak of earlier stages or runs). In a warm process (watch.py)
+# the process peak includes earlier runs, the growth does not.
+
+METRICS_DIR = os.path.join("result", "metrics")
+
+ENABLED = os.environ.get("DATEN_METRICS", "") not in ("", "0")
+PROFILE = os.environ.get("DATEN_CPROFILE", "") not in ("", "0")
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+class _NullStage:
+    """Returned by `stage()` when instrumentation is disabled."""
+    rows = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Stage:
+    """One measured stage; set `rows` inside the block to record the row count."""
+
+    def __init__(self, recorder: "Recorder", name: str, rows: int | None):
+        self.recorder = recorder
+        self.name = name
+        self.rows = rows
+        self.parent = None
+
+    def __enter__(self):
+        self.parent = self.recorder.stack[-1].name if self.recorder.stack else None
+        self.recorder.stack.append(self)
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        self._peak = peak_rss_mb()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall = time.perf_counter() - self._wall
+        cpu = time.process_time() - self._cpu
+        peak = peak_rss_mb()
+        self.recorder.stack.pop()
+        self.recorder.stages.append({
+            "stage": self.name,
+            "parent": self.parent,
+            "wall_s": round(wall, 4),
+            "cpu_s": round(cpu, 4),
+            "process_peak_rss_mb": peak,
+            "peak_growth_mb": round(peak - self._peak, 1) if peak is not None else None,
+            "rows": self.rows,
+            "error": exc_type.__name__ if exc_type else None,
+        })
+        return False
+
+
+class Recorder:
+    """Collects the stages of one script run."""
+
+    def __init__(self):
+        self.stages = []
+        self.stack = []
+        self.tables = []
+
+    def report(self, script: str, wall: float, cpu: float) -> dict:
+        return {
+            "script": script,
+            "finished": datetime.datetime.now().isoformat(timespec="seconds"),
+            "argv": sys.argv[1:],
+            "wall_s": round(wall, 4),
+            "cpu_s": round(cpu, 4),
+            "process_peak_rss_mb": peak_rss_mb(),
+            "stages": self.stages,
+            "tables": self.tables,
+        }
+
+
+_recorder = Recorder()
+
+
+def reset():
+    """Starts a new report, e.g. for every run of a script in a warm process (watch.py)."""
+    global _recorder
+    _recorder = Recorder()
+
+
+def stage(name: str, rows: int | None = None):
+    """Context manager measuring one stage (no-op unless DATEN_METRICS is set)."""
+    if not ENABLED:
+        return _NULL_STAGE
+    return Stage(_recorder, name, rows)
+
+
+def record_table(report: dict):
+    """Adds a table report (e.g. memory usage) to the metrics report (no-op unless DATEN_METRICS is set)."""
+    if ENABLED:
+        _recorder.tables.append(report)
+
+
+def timed(name: str | None = None):
+    """Decorator measuring every call of a function as a stage; rows = len(result) if available."""
+    def decorator(func):
+        if not ENABLED:
+            return func
+        stage_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(stage_name) as s:
+                result = func(*args, **kwargs)
+                if hasattr(result, "__len__"):
+                    s.rows = len(result)
+                return result
+        return wrapper
+    return decorator
+
+
+def write_report(script: str, wall: float, cpu: float) -> str:
+    os.makedirs(METRICS_DIR, exist_ok=True)
+    path = os.path.join(METRICS_DIR, f"{script}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(_recorder.report(script, wall, cpu), f, ensure_ascii=False, indent=2)
+    return path
+
+
+def run_instrumented(main, script: str):
+    """
+    Entry point wrapper for scripts. Calls `main()` and, depending on the switches,
+    profiles it with cProfile and/or writes the per-stage JSON report.
+    """
+    if not ENABLED and not PROFILE:
+        return main()
+
+    reset()
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    profiler = cProfile.Profile() if PROFILE else None
+    try:
+        if profiler:
+            return profiler.runcall(main)
+        return main()
+    finally:
+        wall = time.perf_counter() - wall
+        cpu = time.process_time() - cpu
+        if profiler:
+            os.makedirs(METRICS_DIR, exist_ok=True)
+            profile_path = os.path.join(METRICS_DIR, f"{script}.prof")
+            profiler.dump_stats(profile_path)
+            print(f"Profile saved to {profile_path}")
+        if ENABLED:
+            print(f"Metrics saved to {write_report(script, wall, cpu)}")
@@ -0,0 +1,255 @@
+import json
+import os
+import socketserver
+import stat
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from common.geometry import gemeinde_geometry
+from common.mapping import (KREIS_SCHLUESSEL, gemeinde_aliases, gemeinde_by_name, lookup_gebiet,
+                            lookup_gemeinde_name, schluessel_map)
+
+# Local lookup service for tools that cannot import common/mapping.py (see lookup_service.py).
+#
+# `LookupIndex` answers batched lookups from the in-memory indexes of common/mapping.py,
+# the geometry table of common/geometry.py and the geocode cache:
+#
+#     GET  /resolve?name=Friedberg&name=Bad Nauheim, Stadt   Gebiet/alias -> Gemeinde, Schlüssel
+#     POST /resolve     {"names": [...]}  (or a bare JSON list)
+#     GET  /gemeinden?schluessel=6440008   Schlüssel/Gemeindekennziffer -> name, aliases, area, centroid, bbox
+#     POST /geocode     {"addresses": [...]}   address -> cached latitude/longitude
+#     GET  /health
+#
+# Every endpoint returns {"results": [...]} in the order of the request; unknown values
+# give null fields instead of an error, so one bad entry does not fail a batch. The
+# geocode cache is only read (nothing is geocoded online) and reloaded when the file
+# changes. `LookupIndex.handle(method, target, body)` is the whole request logic without
+# sockets, so tools and checks can call it offline.
+#
+# The HTTP layer speaks HTTP/1.1 with Content-Length on every response, so clients keep
+# their connection open between requests; each connection is served by its own thread.
+
+GEOCODE_CACHE = "geocode_cache.json"
+KREIS_NAME = "Wetteraukreis"
+MAX_BATCH = 10_000
+KEEP_ALIVE_TIMEOUT = 60
+
+# endpoint -> (query parameter / JSON key of the batch, LookupIndex method)
+ENDPOINTS = {
+    "/resolve": ("names", "resolve"),
+    "/gemeinden": ("schluessel", "gemeinde"),
+    "/geocode": ("addresses", "geocode"),
+}
+_QUERY_PARAMETERS = {"names": "name", "schluessel": "schluessel", "addresses": "address"}
+
+
+def _address_key(address: str) -> str:
+    return " ".join(address.split()).casefold()
+
+
+class GeocodeCache:
+    """The geocode cache file (address -> [latitude, longitude]), reloaded when its size or mtime changes."""
+
+    def __init__(self, path: str = GEOCODE_CACHE):
+        self.path = path
+        self.state = None
+        self.exact, self.normalized = {}, {}
+        self.lock = threading.Lock()
+
+    def refresh(self):
+        try:
+            info = os.stat(self.path)
+            state = (info.st_size, info.st_mtime_ns)
+        except FileNotFoundError:
+            state = None
+        if state == self.state:
+            return
+        with self.lock:
+            if state == self.state:
+                return
+            exact = {}
+            if state is not None:
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        exact = {str(k): tuple(v) for k, v in json.load(f).items()}
+                except (json.JSONDecodeError, ValueError, TypeError, AttributeError):
+                    # Written at the moment by altersplanung.py; keep the last good state
+                    return
+            normalized = {}
+            for address, coords in exact.items():
+                normalized.setdefault(_address_key(address), coords)
+            self.exact, self.normalized, self.state = exact, normalized, state
+
+    def get(self, address: str) -> tuple[float, float] | None:
+        coords = self.exact.get(address)
+        return coords if coords is not None else self.normalized.get(_address_key(address))
+
+    def __len__(self):
+        return len(self.exact)
+
+
+class LookupIndex:
+    """Gemeinde resolution, Gemeinde metadata and cached coordinates (see module comment)."""
+
+    def __init__(self, geocode_path: str = GEOCODE_CACHE):
+        geometry = gemeinde_geometry().reset_index()
+        rows = {int(r.pop("gemeinde_schluessel")): r for r in geometry.to_dict(orient="records")}
+        self.metadata = {}
+        for schluessel, name in schluessel_map.items():
+            self.metadata[schluessel] = {
+                "gemeinde_schluessel": schluessel,
+                "gemeinde": name,
+                "aliases": list(gemeinde_aliases.get(name, [])),
+                **rows.get(schluessel, {"Gemeindekennziffer": f"0{schluessel}"}),
+            }
+        self.metadata[KREIS_SCHLUESSEL] = {
+            "gemeinde_schluessel": KREIS_SCHLUESSEL,
+            "gemeinde": KREIS_NAME,
+            "aliases": list(gemeinde_aliases.get(KREIS_NAME, [])),
+            "Gemeindekennziffer": f"0{KREIS_SCHLUESSEL}",
+            "flaeche_km2": round(float(geometry["flaeche_km2"].sum()), 3),
+        }
+        self.geocodes = GeocodeCache(geocode_path)
+        self.geocodes.refresh()
+
+    @staticmethod
+    def _schluessel(value) -> int | None:
+        try:
+            return int(str(value).strip())
+        except ValueError:
+            return None
+
+    def resolve(self, name) -> dict:
+        """Gemeinde and Schlüssel of a Gemeinde name, alias, Gebiet or Schlüssel; `match` says how it was found."""
+        text = str(name).strip() if name is not None else ""
+        schluessel, match = None, None
+        if text.isdigit() and self._schluessel(text) in self.metadata:
+            schluessel, match = self._schluessel(text), "schluessel"
+        elif (canonical := lookup_gemeinde_name(text)) is not None and (
+                canonical == KREIS_NAME or canonical in gemeinde_by_name):
+            schluessel, match = (KREIS_SCHLUESSEL if canonical == KREIS_NAME else gemeinde_by_name[canonical]), "alias"
+        elif (gemeinde := lookup_gebiet(text)) == "":
+            match = "ignored"
+        elif gemeinde is not None and gemeinde in schluessel_map:
+            schluessel, match = gemeinde, "gebiet"
+
+        return {
+            "input": name,
+            "gemeinde": self.metadata[schluessel]["gemeinde"] if schluessel is not None else None,
+            "gemeinde_schluessel": schluessel,
+            "match": match,
+        }
+
+    def gemeinde(self, schluessel) -> dict:
+        """Metadata of a Gemeindeschlüssel (6440008) or Gemeindekennziffer ("06440008")."""
+        metadata = self.metadata.get(self._schluessel(schluessel))
+        return {"input": schluessel, "found": metadata is not None, **(metadata or {})}
+
+    def geocode(self, address) -> dict:
+        """Cached coordinates of an address (exact, then ignoring case and whitespace)."""
+        coords = self.geocodes.get(str(address)) if address is not None else None
+        return {
+            "input": address,
+            "latitude": coords[0] if coords else None,
+            "longitude": coords[1] if coords else None,
+        }
+
+    def handle(self, method: str, target: str, body: bytes = b"") -> tuple[int, dict]:
+        """(HTTP status, JSON payload) of one request, without any socket."""
+        url = urlsplit(target)
+        if url.path == "/health":
+            return 200, {"status": "ok", "gemeinden": len(self.metadata), "geocoded": len(self.geocodes)}
+        if url.path not in ENDPOINTS:
+            return 404, {"error": f"unknown endpoint '{url.path}'", "endpoints": sorted([*ENDPOINTS, "/health"])}
+        key, method_name = ENDPOINTS[url.path]
+
+        if method == "GET":
+            values = parse_qs(url.query, keep_blank_values=True).get(_QUERY_PARAMETERS[key], [])
+        elif method == "POST":
+            try:
+                payload = json.loads(body or b"null")
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                return 400, {"error": f"invalid JSON: {e}"}
+            values = payload.get(key) if isinstance(payload, dict) else payload
+            if not isinstance(values, list):
+                return 400, {"error": f"expected a JSON list or {{\"{key}\": [...]}}"}
+        else:
+            return 405, {"error": f"method {method} not allowed"}
+
+        if len(values) > MAX_BATCH:
+            return 413, {"error": f"batch of {len(values)} exceeds {MAX_BATCH} entries"}
+        if method_name == "geocode":
+            self.geocodes.refresh()
+        lookup = getattr(self, method_name)
+        return 200, {"results": [lookup(v) for v in values]}
+
+
+class LookupRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "GemeindeLookup/1.0"
+    timeout = KEEP_ALIVE_TIMEOUT
+
+    def setup(self):
+        # Small responses on kept-alive TCP connections would otherwise wait for delayed ACKs
+        self.disable_nagle_algorithm = isinstance(self.client_address, tuple)
+        super().setup()
+
+    def _respond(self):
+        header = self.headers.get("Content-Length") or "0"
+        try:
+            length = int(header)
+            if length < 0:
+                raise ValueError(header)
+        except ValueError:
+            # The body cannot be skipped without its length, so the connection is not reused
+            status, payload = 400, {"error": f"invalid Content-Length '{header}'"}
+            self.close_connection = True
+        else:
+            body = self.rfile.read(length) if length else b""
+            status, payload = self.server.index.handle(self.command, self.path, body)
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def address_string(self) -> str:
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class LookupHTTPServer(ThreadingHTTPServer):
+    request_queue_size = 128
+
+    def __init__(self, address: tuple[str, int], index: LookupIndex, verbose: bool = False):
+        self.index = index
+        self.verbose = verbose
+        super().__init__(address, LookupRequestHandler)
+
+
+class LookupUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, path: str, index: LookupIndex, verbose: bool = False):
+        self.index = index
+        self.verbose = verbose
+        if os.path.exists(path) and stat.S_ISSOCK(os.stat(path).st_mode):
+            os.remove(path)   # stale socket of an earlier run
+        super().__init__(path, LookupRequestHandler)
+
+
+def make_server(index: LookupIndex, host: str = "127.0.0.1", port: int = 8765,
+                socket_path: str | None = None, verbose: bool = False):
+    """HTTP server for `index` on host/port, or on the Unix socket `socket_path` if given."""
+    if socket_path:
+        return LookupUnixServer(socket_path, index, verbose)
+    return LookupHTTPServer((host, port), index, verbose)
@@ -2,6 +2,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(__file__))
 
+import functools
 import logging
 
 from gemeinden.altenstadt import mapping as altenstadt_mapping
@@ -141,6 +142,37 @@ def normalize(text: str) -> str:
         .strip()
     )
 
+@functools.lru_cache(maxsize=None)
+def _gebiet_index() -> tuple[dict, dict]:
+    """
+    Exact Gemeinde names (`mapping_gemeinde`) and normalized Gebiet names (`mapping`) ->
+    Gemeinde, built once. The first occurrence wins, as in a scan of the mappings.
+    """
+    exact = {}
+    for gemeinde_var, gemeinde_names in mapping_gemeinde.items():
+        for name in gemeinde_names:
+            exact.setdefault(name, gemeinde_var)
+    normalized = {}
+    for gemeinde, gebieten in mapping.items():
+        for teil_list in gebieten:
+            for name in teil_list:
+                normalized.setdefault(normalize(name), gemeinde)
+    return exact, normalized
+
+
+def lookup_gebiet(gebiet: str):
+    """
+    Gemeinde of a Gebiet name like `get_gemeinde_from_gebiet`, but None (and no warning)
+    if there is no match. Ignored Gebiete give an empty string.
+    """
+    if gebiet in ignore_list:
+        return ''
+    exact, normalized = _gebiet_index()
+    if gebiet in exact:
+        return exact[gebiet]
+    return normalized.get(normalize(gebiet))
+
+
 def get_gemeinde_from_gebiet(gebiet: str) -> str:
     """
     Maps a given Gebiet name to its corresponding Gemeinde.
@@ -151,19 +183,9 @@ def get_gemeinde_from_gebiet(gebiet: str) -> str:
 
     Returns the Gemeinde object (class instance), or an empty string if ignored.
     """
-    if gebiet in ignore_list:
-        return ''
-
-    for gemeinde_var, gemeinde_names in mapping_gemeinde.items():
-        if gebiet in gemeinde_names:
-            return gemeinde_var
-
-    norm_gebiet = normalize(gebiet)
-
-    for gemeinde, gebieten in mapping.items():
-        for teil_list in gebieten:
-            if any(normalize(name) == norm_gebiet for name in teil_list):
-                return gemeinde
+    gemeinde = lookup_gebiet(gebiet)
+    if gemeinde is not None:
+        return gemeinde
 
     logging.warning(f"No Mapping found for: '{gebiet}'")
     return gebiet
@@ -218,21 +240,54 @@ def get_gemeinde_by_schluessel(schluessel: str) -> str | None:
     logging.warning(f"Gemeinde not found for schluessel: '{schluessel}'")
     return None
 
+def _alias_key(name: str) -> str:
+    return name.strip().lower().replace("-", " ").replace("ß", "ss")
+
+
+@functools.lru_cache(maxsize=None)
+def _alias_index() -> dict:
+    """Normalized alias -> canonical Gemeinde name, built once (first occurrence wins)."""
+    index = {}
+    for canonical, alternatives in gemeinde_aliases.items():
+        for alt in alternatives:
+            index.setdefault(_alias_key(alt), canonical)
+    return index
+
+
+def lookup_gemeinde_name(raw_name: str) -> str | None:
+    """Canonical name of a Gemeinde name or alias like `normalize_gemeinde_name`, None if unknown."""
+    return _alias_index().get(_alias_key(raw_name))
+
+
 def normalize_gemeinde_name(raw_name: str) -> str:
     """
     Normalizes a raw Gemeinde name (from filename or data entry) to its canonical version.
     Uses `gemeinde_aliases` to map known variants.
     Logs a warning for any unmatched name.
     """
-    norm = raw_name.strip().lower().replace("-", " ").replace("ß", "ss")
-
-    for canonical, alternatives in gemeinde_aliases.items():
-        for alt in alternatives:
-            alt_norm = alt.strip().lower().replace("-", " ").replace("ß", "ss")
-            if norm == alt_norm:
-                return canonical
+    canonical = lookup_gemeinde_name(raw_name)
+    if canonical is not None:
+        return canonical
 
     logging.warning(
         f"Gemeinde mapping: unknown name '{raw_name}' — not mapped to canonical."
     )
-    return raw_name
\ No newline at end of file
+    return raw_name
+
+# Kreisschlüssel of the Wetteraukreis, used for district-level rows and sums
+KREIS_SCHLUESSEL = 6440
+
+gemeinde_by_name = {name: schluessel for schluessel, name in schluessel_map.items()}
+
+
+def get_schluessel_by_gemeinde(name: str) -> int | None:
+    """
+    Maps a Gemeinde name (canonical or any alias from `gemeinde_aliases`) to its Gemeindeschlüssel.
+    "Wetteraukreis" maps to the Kreisschlüssel. Returns None for unknown names.
+    """
+    if name is None:
+        return None
+    canonical = normalize_gemeinde_name(str(name))
+    if canonical == "Wetteraukreis":
+        return KREIS_SCHLUESSEL
+    return gemeinde_by_name.get(canonical)
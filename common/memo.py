@@ -0,0 +1,224 @@
+import atexit
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pickle
+import sys
+import time
+
+from common.incremental import code_version, file_sha256
+
+# Content-addressed memoization of expensive pipeline steps (Excel extraction, Gebiet
+# mapping), shared by all scripts and runs.
+#
+#     @memoize
+#     def extract_gemband_data(file_path: str) -> pd.DataFrame: ...
+#
+# A result is stored under the hash of
+# - the function (script file and qualified name),
+# - the code version: content of the function's script and of everything in common/
+#   (mappings, aliases, helpers), so any code change invalidates the results,
+# - the arguments; arguments naming an existing file also contribute its content hash,
+#   `files=` adds input files the function reads on its own.
+#
+# Results are pickled into result/.memo/ and evicted least recently used first once the
+# store exceeds MEMO_MAX_MB (default 512 MB). File hashes are remembered with size and
+# mtime, so unchanged inputs cost one stat(). Enabled with `--memo` or MEMO=1; the
+# hits and misses per function are printed at exit and returned by `memo_stats()`.
+# Results of None (failed files) and exceptions are not stored.
+#
+# Long-running processes (watch.py) set KEEP_IN_MEMORY: results then also stay in memory
+# and a hit returns a copy without reading the pickle again.
+
+MEMO_DIR = os.path.join("result", ".memo")
+INDEX_NAME = "index.json"
+DEFAULT_MAX_MB = 512
+KEEP_IN_MEMORY = False
+
+_stats: dict[str, dict[str, int]] = {}
+
+
+def memo_requested() -> bool:
+    """True if memoization is enabled via `--memo` or MEMO=1."""
+    return "--memo" in sys.argv[1:] or os.environ.get("MEMO", "") not in ("", "0")
+
+
+def max_store_bytes() -> int:
+    """Size limit of the store from MEMO_MAX_MB."""
+    value = os.environ.get("MEMO_MAX_MB", "")
+    try:
+        return int(float(value) * 2 ** 20) if value.strip() else DEFAULT_MAX_MB * 2 ** 20
+    except ValueError:
+        raise ValueError(f"Invalid MEMO_MAX_MB '{value}': expected megabytes")
+
+
+class MemoStore:
+    """
+    Pickled results in `directory` with the index `index.json`: per entry the function,
+    size and last use, plus the content hashes of input files by size and mtime.
+    """
+
+    def __init__(self, directory: str = MEMO_DIR, max_bytes: int | None = None, keep_in_memory: bool = False):
+        self.directory = directory
+        self.index_path = os.path.join(directory, INDEX_NAME)
+        self.max_bytes = max_store_bytes() if max_bytes is None else max_bytes
+        self.entries, self.file_hashes = self._load_index()
+        self.dirty = False
+        self.warm = {} if keep_in_memory else None
+
+    def _load_index(self) -> tuple[dict, dict]:
+        if not os.path.exists(self.index_path):
+            return {}, {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            return index["entries"], index["files"]
+        except (json.JSONDecodeError, KeyError):
+            logging.warning(f"Memo index corrupted, starting empty: {self.index_path}")
+            return {}, {}
+
+    def save_index(self):
+        if not self.dirty:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"entries": self.entries, "files": self.file_hashes}, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+        self.dirty = False
+
+    def file_hash(self, path: str) -> str:
+        """Content hash of `path`, recomputed only when its size or mtime changed."""
+        key = os.path.abspath(path)
+        stat = os.stat(path)
+        entry = self.file_hashes.get(key)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["sha256"]
+        self.file_hashes[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": file_sha256(path)}
+        self.dirty = True
+        return self.file_hashes[key]["sha256"]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key: str) -> tuple[bool, object]:
+        """(True, result) for a stored key, (False, None) otherwise."""
+        if key not in self.entries:
+            return False, None
+        if self.warm is not None and key in self.warm:
+            self.entries[key]["used"] = time.time()
+            self.dirty = True
+            return True, copy.deepcopy(self.warm[key])
+        if not os.path.exists(self._path(key)):
+            return False, None
+        try:
+            with open(self._path(key), "rb") as f:
+                result = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            logging.warning(f"Memo entry unreadable, recomputing: {self._path(key)}")
+            return False, None
+        self.entries[key]["used"] = time.time()
+        self.dirty = True
+        if self.warm is not None:
+            self.warm[key] = copy.deepcopy(result)
+        return True, result
+
+    def put(self, key: str, result, function: str) -> int:
+        """Stores `result` and returns the number of evicted entries."""
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_bytes:
+            return 0
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path(key) + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(self._path(key) + ".tmp", self._path(key))
+        self.entries[key] = {"function": function, "bytes": len(data), "used": time.time()}
+        self.dirty = True
+        if self.warm is not None:
+            self.warm[key] = copy.deepcopy(result)
+        evicted = self.evict()
+        self.save_index()
+        return evicted
+
+    def evict(self) -> int:
+        """Removes the least recently used entries until the store fits `max_bytes`."""
+        total = sum(e["bytes"] for e in self.entries.values())
+        evicted = 0
+        for key in sorted(self.entries, key=lambda k: self.entries[k]["used"]):
+            if total <= self.max_bytes:
+                break
+            total -= self.entries.pop(key)["bytes"]
+            if self.warm is not None:
+                self.warm.pop(key, None)
+            if os.path.exists(self._path(key)):
+                os.remove(self._path(key))
+            evicted += 1
+            self.dirty = True
+        return evicted
+
+
+@functools.lru_cache(maxsize=None)
+def memo_store() -> MemoStore:
+    """The store of this process (trimmed to the current size limit); its index is written at exit."""
+    store = MemoStore(keep_in_memory=KEEP_IN_MEMORY)
+    store.evict()
+    atexit.register(store.save_index)
+    atexit.register(_print_stats)
+    return store
+
+
+def _argument_key(store: MemoStore, value):
+    if isinstance(value, (str, os.PathLike)) and os.path.isfile(value):
+        return ("file", os.fspath(value), store.file_hash(value))
+    if isinstance(value, (list, tuple)):
+        return tuple(_argument_key(store, v) for v in value)
+    return value
+
+
+def memoize(func=None, *, files=()):
+    """
+    Decorator storing the results of `func` in the memo store (see module comment).
+    `files`: input files read by `func` that are not among its arguments.
+    """
+    def decorator(func):
+        source = os.path.abspath(inspect.getsourcefile(func))
+        name = f"{os.path.splitext(os.path.basename(source))[0]}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not memo_requested():
+                return func(*args, **kwargs)
+            store = memo_store()
+            stats = _stats.setdefault(name, {"hits": 0, "misses": 0, "evictions": 0})
+            key_parts = (name, code_version(source),
+                         [_argument_key(store, a) for a in args],
+                         sorted((k, _argument_key(store, v)) for k, v in kwargs.items()),
+                         [(f, store.file_hash(f)) for f in files if os.path.isfile(f)])
+            key = hashlib.sha256(pickle.dumps(key_parts, protocol=4)).hexdigest()
+
+            hit, result = store.get(key)
+            if hit:
+                stats["hits"] += 1
+                return result
+            stats["misses"] += 1
+            result = func(*args, **kwargs)
+            if result is not None:
+                stats["evictions"] += store.put(key, result, name)
+            return result
+        return wrapper
+
+    return decorator(func) if func is not None else decorator
+
+
+def memo_stats() -> dict[str, dict[str, int]]:
+    """Hits, misses and evictions per memoized function in this process."""
+    return {name: dict(counts) for name, counts in _stats.items()}
+
+
+def _print_stats():
+    for name, counts in sorted(_stats.items()):
+        print(f"[memo] {name}: {counts['hits']} hit(s), {counts['misses']} miss(es), {counts['evictions']} evicted")
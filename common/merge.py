@@ -0,0 +1,204 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from common import instrumentation
+from common.db_loader import GEMEINDE_COLUMNS, KEY_COLUMNS, NO_YEAR, YEAR_COLUMNS, schluessel_values, year_column
+
+# Joins any number of result tables on the canonical (gemeinde_schluessel, jahr) key.
+#
+#     merged, report = merge_tables({"arbeitsmarkt": df_arbeitsmarkt, "gemband": df_gemband})
+#
+# The keys are derived as in the DB loader (common/db_loader.py): the Gemeindeschlüssel
+# from `gemeinde_schluessel` or the Gemeinde name column (any alias), the year from
+# jahr/Jahr/year. So "Friedberg" in one table and "Friedberg (Hessen)" with "year" in
+# another join, where a `pd.merge` on the name columns would silently miss. Names that
+# are not in the Gemeinde mapping (e.g. "Frankfurt am Main") join on the name itself,
+# ignoring case and whitespace; the report counts these rows as `name_keys`.
+#
+# Both parts of the key are packed into one int64 (Schlüssel * 10000 + Jahr); a name
+# without Schlüssel gets a negative code shared by all tables of one merge. Every
+# table is sorted once by key (skipped if it already is, as most result tables are); the
+# sorted keys of each joined table are matched against the sorted keys of the first
+# table in one pass, which also yields the unmatched keys for the report. The first
+# table keeps its rows and their order, with how="inner" only the rows found in all
+# tables. The Gemeinde and year columns of the joined tables, and `id_columns` (e.g.
+# gemeinde_id), are taken from the first table.
+#
+# The report lists per table the rows without a resolvable key, duplicate keys (the
+# first row is used), keys of the first table it lacks and keys only it has. Unmatched
+# keys are logged as warnings and, with DATEN_METRICS=1, added to the metrics report.
+
+YEAR_FACTOR = 10_000
+MISSING_KEY = -1
+REPORT_EXAMPLES = 5
+
+
+def name_key(name) -> str | None:
+    """Gemeinde name compared without case and surplus whitespace; None for empty names."""
+    if pd.isna(name):
+        return None
+    return " ".join(str(name).split()).casefold() or None
+
+
+def canonical_key(df: pd.DataFrame, names: dict | None = None) -> np.ndarray:
+    """
+    (gemeinde_schluessel, jahr) of every row packed into one int64; MISSING_KEY where either
+    is unknown. With `names` (name_key -> code, shared by the tables of one merge), rows
+    whose Gemeinde name has no Schlüssel are keyed by their name: -(code + 2) as Schlüssel.
+    """
+    schluessel = schluessel_values(df).to_numpy(dtype=np.float64, na_value=np.nan)
+    name_col = next((c for c in GEMEINDE_COLUMNS if c in df.columns), None)
+    unresolved = np.isnan(schluessel)
+    if names is not None and name_col is not None and unresolved.any():
+        column = df[name_col].iloc[np.flatnonzero(unresolved)]
+        codes = {}
+        for name in column.unique():
+            key = name_key(name)
+            codes[name] = np.nan if key is None else -(names.setdefault(key, len(names)) + 2)
+        schluessel[unresolved] = column.map(codes).to_numpy(dtype=np.float64, na_value=np.nan)
+    year_col = year_column(df)
+    if year_col is None:
+        jahr = np.full(len(df), NO_YEAR, dtype=np.float64)
+    else:
+        jahr = pd.to_numeric(df[year_col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+    valid = ~np.isnan(schluessel) & ~np.isnan(jahr) & (jahr >= 0) & (jahr < YEAR_FACTOR)
+    keys = np.full(len(df), MISSING_KEY, dtype=np.int64)
+    keys[valid] = schluessel[valid].astype(np.int64) * YEAR_FACTOR + jahr[valid].astype(np.int64)
+    return keys
+
+
+def unpack_keys(keys, names=()) -> list[tuple]:
+    """Packed keys back to (gemeinde_schluessel, jahr) pairs; (name, jahr) for keys from `names` (in code order)."""
+    pairs = []
+    for k in keys:
+        schluessel, jahr = int(k) // YEAR_FACTOR, int(k) % YEAR_FACTOR
+        pairs.append((names[-schluessel - 2] if schluessel < 0 else schluessel, jahr))
+    return pairs
+
+
+def _key_summary(keys: np.ndarray, names=()) -> dict:
+    return {"count": len(keys), "examples": unpack_keys(keys[:REPORT_EXAMPLES], names)}
+
+
+def sorted_keys(keys: np.ndarray) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Resolved keys in ascending order without duplicates, the row of each (the first row
+    with that key) and the number of duplicate rows. Inputs already in key order are not sorted.
+    """
+    rows = np.flatnonzero(keys != MISSING_KEY)
+    keys = keys[rows]
+    if len(keys) > 1 and not (keys[1:] >= keys[:-1]).all():
+        order = np.argsort(keys)   # not stable; the first row per key is taken below
+        keys, rows = keys[order], rows[order]
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    duplicates = int(len(keys) - first.sum())
+    if duplicates:
+        rows = np.minimum.reduceat(rows, np.flatnonzero(first))
+    return keys[first], rows, duplicates
+
+
+def key_codes(keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Sorted unique resolved keys and per row the position of its key among them (len(unique) if unresolved)."""
+    rows = np.flatnonzero(keys != MISSING_KEY)
+    ordered = keys[rows]
+    if len(ordered) > 1 and not (ordered[1:] >= ordered[:-1]).all():
+        order = np.argsort(ordered)
+        ordered, rows = ordered[order], rows[order]
+    first = np.ones(len(ordered), dtype=bool)
+    first[1:] = ordered[1:] != ordered[:-1]
+    unique = ordered[first]
+    codes = np.full(len(keys), len(unique), dtype=np.int64)
+    codes[rows] = np.cumsum(first) - 1
+    return unique, codes
+
+
+def merge_tables(tables: dict[str, pd.DataFrame], how: str = "left",
+                 id_columns=()) -> tuple[pd.DataFrame, dict]:
+    """
+    Joins `tables` (name -> frame, the first is the base) on the canonical key, see the
+    module comment. Returns the merged frame and the report per table.
+    """
+    if how not in ("left", "inner"):
+        raise ValueError(f"Unknown merge mode '{how}': expected 'left' or 'inner'")
+    if not tables:
+        raise ValueError("No tables to merge")
+
+    names = list(tables)
+    base_name, base = names[0], tables[names[0]]
+    name_codes = {}
+    base_keys = canonical_key(base, name_codes)
+    base_unique, base_codes = key_codes(base_keys)
+    base_resolved = base_codes < len(base_unique)
+    skipped = set(GEMEINDE_COLUMNS) | set(YEAR_COLUMNS) | set(KEY_COLUMNS) | set(id_columns)
+
+    report = {base_name: {"rows": len(base), "unresolved_rows": int((~base_resolved).sum()),
+                          "name_keys": int((base_keys < MISSING_KEY).sum())}}
+    if report[base_name]["unresolved_rows"]:
+        logging.warning(f"Merge: '{base_name}' has {report[base_name]['unresolved_rows']} row(s) without key")
+    columns = set(base.columns)
+    joined = []
+    for name in names[1:]:
+        table = tables[name]
+        values = table[[c for c in table.columns if c not in skipped]]
+        clash = columns & set(values.columns)
+        if clash:
+            raise ValueError(f"Merge: columns of '{name}' are already in the result: {sorted(clash)}")
+        columns |= set(values.columns)
+
+        # Both key lists are sorted: one pass of binary searches over ascending needles,
+        # then the row of every base key is a lookup by its code
+        table_keys = canonical_key(table, name_codes)
+        keys, rows, duplicates = sorted_keys(table_keys)
+        position = np.searchsorted(base_unique, keys)
+        hit = position < len(base_unique)
+        hit[hit] = base_unique[position[hit]] == keys[hit]
+        row_of_code = np.full(len(base_unique) + 1, -1, dtype=np.int64)
+        row_of_code[position[hit]] = rows[hit]
+        indexer = row_of_code[base_codes]
+        joined.append((values, indexer))
+
+        missing = base_unique[row_of_code[:-1] < 0]
+        key_names = list(name_codes)
+        extra = keys[~hit]
+        unresolved = len(table) - len(keys) - duplicates
+        report[name] = {
+            "rows": len(table),
+            "unresolved_rows": unresolved,
+            "name_keys": int((table_keys < MISSING_KEY).sum()),
+            "duplicate_keys": duplicates,
+            "missing_keys": _key_summary(missing, key_names),
+            "extra_keys": _key_summary(extra, key_names),
+        }
+        if len(missing):
+            logging.warning(f"Merge: {len(missing)} key(s) of '{base_name}' not in '{name}', "
+                            f"e.g. {report[name]['missing_keys']['examples']}")
+        if len(extra):
+            logging.warning(f"Merge: {len(extra)} key(s) of '{name}' not in '{base_name}', "
+                            f"e.g. {report[name]['extra_keys']['examples']}")
+        if unresolved or duplicates:
+            logging.warning(f"Merge: '{name}' has {unresolved} row(s) without key "
+                            f"and {duplicates} duplicate key(s) (first row used)")
+
+    rows = None
+    if how == "inner":
+        found = base_resolved.copy()
+        for _, indexer in joined:
+            found &= indexer >= 0
+        rows = np.flatnonzero(found)
+
+    parts = [base.reset_index(drop=True) if rows is None else base.take(rows).reset_index(drop=True)]
+    for values, indexer in joined:
+        indexer = indexer if rows is None else indexer[rows]
+        if (indexer >= 0).all():
+            parts.append(values.take(indexer).reset_index(drop=True))
+        else:
+            # Labels are positions; -1 is not a label, so unmatched rows become NaN
+            parts.append(values.reset_index(drop=True).reindex(indexer).reset_index(drop=True))
+    merged = pd.concat(parts, axis=1)
+
+    instrumentation.record_table({"merge": names, "how": how, "rows": len(merged), "inputs": report})
+    return merged, report
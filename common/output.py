@@ -0,0 +1,135 @@
+import io
+import os
+import re
+import shutil
+import sys
+import zipfile
+
+import pandas as pd
+
+# Shared writers for result files.
+
+# Fixed timestamp for xlsx container entries and document properties.
+# openpyxl stamps every save with the current time, which makes two runs over the
+# same data produce different files; pinning it keeps outputs byte-identical.
+FIXED_ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+FIXED_DOC_DATE = "1980-01-01T00:00:00Z"
+
+_CORE_DATE_RE = re.compile(rb"(<dcterms:(?:created|modified)[^>]*>)[^<]*(</dcterms:(?:created|modified)>)")
+
+
+def write_excel(df: pd.DataFrame, path: str, **kwargs):
+    """
+    Writes a DataFrame to xlsx like `DataFrame.to_excel`, but deterministically:
+    zip entry dates and the created/modified document properties are fixed,
+    so identical data always results in an identical file.
+    """
+    buffer = io.BytesIO()
+    df.to_excel(buffer, **kwargs)
+    buffer.seek(0)
+
+    with zipfile.ZipFile(buffer) as src, zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            data = src.read(info.filename)
+            if info.filename == "docProps/core.xml":
+                data = _CORE_DATE_RE.sub(rb"\g<1>" + FIXED_DOC_DATE.encode() + rb"\g<2>", data)
+            entry = zipfile.ZipInfo(info.filename, date_time=FIXED_ZIP_DATE)
+            entry.compress_type = zipfile.ZIP_DEFLATED
+            entry.external_attr = info.external_attr
+            dst.writestr(entry, data)
+
+
+# Output formats selectable per run, e.g. `--formats=parquet,xlsx` or OUTPUT_FORMATS=parquet.
+# Without a selection every script writes its native format (the extension of its output path).
+FORMATS = ("xlsx", "csv", "parquet", "arrow", "sqlite")
+PARQUET_COMPRESSION = "zstd"
+YEAR_COLUMNS = ("jahr", "Jahr", "year")
+
+
+def requested_formats() -> list[str] | None:
+    """Formats selected for this run via `--formats=` or OUTPUT_FORMATS, None if not set."""
+    value = os.environ.get("OUTPUT_FORMATS", "")
+    for arg in sys.argv[1:]:
+        if arg.startswith("--formats="):
+            value = arg.split("=", 1)[1]
+
+    formats = [f.strip().lower() for f in value.split(",") if f.strip()]
+    unknown = [f for f in formats if f not in FORMATS]
+    if unknown:
+        raise ValueError(f"Unknown output format(s): {unknown}. Allowed: {', '.join(FORMATS)}")
+    return formats or None
+
+
+def partition_requested() -> bool:
+    """Hive-style partitioning of Parquet output by year (`--partition-by-jahr` or OUTPUT_PARTITION_BY_JAHR=1)."""
+    return "--partition-by-jahr" in sys.argv[1:] or os.environ.get("OUTPUT_PARTITION_BY_JAHR") == "1"
+
+
+def year_column(df: pd.DataFrame) -> str | None:
+    return next((c for c in YEAR_COLUMNS if c in df.columns), None)
+
+
+def write_parquet(df: pd.DataFrame, path: str, partition: bool = False):
+    """
+    Writes a typed Parquet file (zstd compressed). With `partition`, a hive-style
+    dataset directory `<path>/jahr=<year>/...` is written instead; an existing
+    dataset is replaced so that no stale year files remain.
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise RuntimeError("Parquet output requires 'pyarrow' (pip install pyarrow)")
+
+    column = year_column(df) if partition else None
+    if column is None:
+        df.to_parquet(path, index=False, compression=PARQUET_COMPRESSION)
+        return
+
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
+    df.to_parquet(path, index=False, compression=PARQUET_COMPRESSION, partition_cols=[column])
+
+
+def write_arrow(df: pd.DataFrame, path: str):
+    """Writes an Arrow IPC (Feather v2) file, zstd compressed."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise RuntimeError("Arrow output requires 'pyarrow' (pip install pyarrow)")
+    df.reset_index(drop=True).to_feather(path, compression=PARQUET_COMPRESSION)
+
+
+def write_result(df: pd.DataFrame, path: str, csv_options: dict | None = None,
+                 db_keys: list[str] | None = None) -> list[str]:
+    """
+    Writes a result table in every format selected for this run.
+
+    `path` is the script's native output (e.g. result/x.xlsx); other formats are written
+    next to it with their own extension. `csv_options` are passed to `to_csv` (sep, encoding).
+    "sqlite" loads the table into the result database (see common/db_loader.py); `db_keys`
+    are the columns that identify a row besides (gemeinde_schluessel, jahr).
+    Returns the written paths.
+    """
+    stem, ext = os.path.splitext(path)
+    formats = requested_formats() or [ext.lstrip(".").lower()]
+
+    written = []
+    for fmt in formats:
+        target = f"{stem}.{fmt}"
+        if fmt == "xlsx":
+            write_excel(df, target, index=False)
+        elif fmt == "csv":
+            df.to_csv(target, index=False, **(csv_options or {}))
+        elif fmt == "parquet":
+            write_parquet(df, target, partition=partition_requested())
+        elif fmt == "arrow":
+            write_arrow(df, target)
+        elif fmt == "sqlite":
+            from common.db_loader import DATABASE_PATH, load_table, table_name_for
+            table = table_name_for(path)
+            load_table(df, table, key_columns=db_keys)
+            target = f"{DATABASE_PATH}:{table}"
+        written.append(target)
+    return written
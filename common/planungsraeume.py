@@ -0,0 +1,109 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Zuständigkeiten der Planungsräume (data/WK_Planungsraeume.xlsx, Tabellenblatt
+# "Zuständigkeiten"): ASD-Region, ASD-Bezirk, Soziale Hilfe and Pflegestützpunkt per
+# Gemeinde and PLZ. Read by planning-areas-matching.py and used by altersplanung.py to
+# assign the planning areas to geocoded providers (see `assign_areas`).
+
+PLANUNGSRAEUME_FILE = Path("data/WK_Planungsraeume.xlsx")
+AREA_COLUMNS = ["ASD-Region", "ASD-Bezirk", "Soziale Hilfe", "Pflegestützpunkt"]
+
+
+def find_header_row(df_no_header):
+    """Sucht die Zeile mit Spaltennamen."""
+    must_have = {"PLZ", "Gemeindeziffer", "Gemeinde", "ASD-Regionen", "ASD-Bezirke" ,"Soziale Hilfen", "Pflegestützpunkte"}
+    for i in range(min(50, len(df_no_header))):
+        vals = [str(x).strip() for x in df_no_header.iloc[i].tolist()]
+        if must_have.issubset(set(vals)):
+            return i
+    with pd.option_context("display.max_columns", None, "display.width", 200):
+        print(df_no_header.head(5))
+    raise ValueError("Konnte die Kopfzeile nicht finden (PLZ/Gemeindeziffer/Gemeinde/ASD-Regionen/ASD-Bezirke/Soziale Hilfen/Pflegestützpunkte)")
+
+
+def read_zustaendigkeiten(xlsx_path: Path) -> pd.DataFrame:
+    """Liest das Tabellenblatt 'Zuständigkeiten'."""
+    raw = pd.read_excel(xlsx_path, sheet_name="Zuständigkeiten", header=None, dtype=str)
+
+    header_row = find_header_row(raw)
+    df = pd.read_excel(xlsx_path, sheet_name="Zuständigkeiten", header=header_row, dtype=str)
+    return df
+
+
+def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Behält nur benötigte Spalten und benennt sie um."""
+    orig_cols = list(df.columns)
+    df.columns = [str(c).strip() for c in df.columns]
+
+    needed_raw = ["ASD-Regionen", "ASD-Bezirke" ,"Soziale Hilfen", "Pflegestützpunkte", "Gemeinde", "Gemeindeziffer", "PLZ"]
+    missing = [c for c in needed_raw if c not in df.columns]
+    if missing:
+        raise ValueError(f"Fehlende Spalten: {missing}")
+
+    ren = {
+        "ASD-Regionen": "ASD-Region",
+        "ASD-Bezirke": "ASD-Bezirk",
+        "Soziale Hilfen": "Soziale Hilfe",
+        "Pflegestützpunkte": "Pflegestützpunkt",
+        "Gemeindeziffer": "Gemeindekennziffer",
+        "Gemeinde": "Gemeinde",
+        "PLZ": "PLZ",
+    }
+
+    return df[needed_raw].rename(columns=ren)
+
+
+def clean_zustaendigkeiten(df: pd.DataFrame) -> pd.DataFrame:
+    """Bereinigt die Zuständigkeiten: ohne Ergebniszeilen, PLZ und Gemeindekennziffer mit führenden Nullen."""
+    # Ergebniszeilen: "Ergebnis" in irgendeiner Zelle, geprüft auf dem ganzen Block auf einmal
+    values = np.char.lower(df.fillna("").to_numpy(dtype=str))
+    df = df[~(np.char.find(values, "ergebnis") >= 0).any(axis=1)]
+    df = df.dropna(how="all")
+
+    for col in ["ASD-Region", "ASD-Bezirk" ,"Soziale Hilfe", "Pflegestützpunkt", "Gemeinde", "Gemeindekennziffer", "PLZ"]:
+        df[col] = df[col].astype(str).str.strip()
+
+    df["PLZ"] = (
+        df["PLZ"]
+        .str.extract(r"(\d+)", expand=False)
+        .fillna("")
+        .str.zfill(5)
+    )
+    df["Gemeindekennziffer"] = (
+        df["Gemeindekennziffer"]
+        .str.extract(r"(\d+)", expand=False)
+        .fillna("")
+        .str.zfill(8)
+    )
+
+    before = len(df)
+    df = df[(df["Gemeinde"] != "") & (df["PLZ"] != "") & (df["Gemeinde"] != "") & (df["Gemeindekennziffer"] != "")]
+
+    df = df.drop_duplicates(subset=["ASD-Region", "ASD-Bezirk" ,"Soziale Hilfe", "Pflegestützpunkt", "Gemeindekennziffer", "PLZ", "Gemeinde"])
+    return df
+
+
+def read_planungsraeume(xlsx_path: Path = PLANUNGSRAEUME_FILE) -> pd.DataFrame:
+    """Cleaned Zuständigkeiten table: planning areas per Gemeindekennziffer and PLZ."""
+    return clean_zustaendigkeiten(normalize_columns(read_zustaendigkeiten(xlsx_path)))
+
+
+def assign_areas(kennziffer: pd.Series, plz: pd.Series, table: pd.DataFrame) -> pd.DataFrame:
+    """
+    Planning areas (AREA_COLUMNS) for every (Gemeindekennziffer, PLZ) pair, aligned to
+    `kennziffer`. Pairs missing from the table take the area of the Gemeinde if all of
+    its PLZ rows agree; otherwise the area stays empty.
+    """
+    plz = plz.astype(str).str.extract(r"(\d+)", expand=False).fillna("").str.zfill(5)
+    exact = table.drop_duplicates(["Gemeindekennziffer", "PLZ"]).set_index(["Gemeindekennziffer", "PLZ"])[AREA_COLUMNS]
+    areas = exact.reindex(pd.MultiIndex.from_arrays([kennziffer, plz])).reset_index(drop=True)
+
+    grouped = table.groupby("Gemeindekennziffer")[AREA_COLUMNS]
+    per_gemeinde = grouped.first().where(grouped.nunique() == 1)
+    fallback = per_gemeinde.reindex(kennziffer).reset_index(drop=True)
+    areas = areas.fillna(fallback)
+    areas.index = kennziffer.index
+    return areas
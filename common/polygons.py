@@ -0,0 +1,92 @@
+import functools
+import json
+import os
+
+import numpy as np
+
+# Gemeinde boundaries (one closed lon/lat ring per Gemeindekennziffer) in a compact store.
+#
+# The coordinates have four decimals, so they are kept as int32 fixed-point values
+# (degrees * SCALE) in one array of all rings back to back: <name>.npy. The index
+# <name>.json holds the Gemeindekennziffern with the start offsets of their rings. The
+# array is memory-mapped on load and a ring is only decoded when it is asked for:
+#
+#     store = polygon_store()
+#     store.array("06440008")      # float64 (n x 2) lon/lat of Friedberg
+#     store.geojson("06440008")    # "[[8.7994, 50.3659], ...]" as in the matching CSVs
+#
+# The store is built from a {Gemeindekennziffer: GeoJSON ring} mapping with
+# `PolygonStore.from_geojson(...).save(...)`.
+
+POLYGON_DIR = os.path.dirname(os.path.abspath(__file__))
+POLYGON_STORE = os.path.join(POLYGON_DIR, "gemeinde_polygons")
+SCALE = 10000
+
+
+class PolygonStore:
+    def __init__(self, coordinates: np.ndarray, offsets: np.ndarray, keys: list[str], scale: int = SCALE):
+        self.coordinates = coordinates                         # int32 (points x 2), lon/lat * scale
+        self.offsets = np.asarray(offsets, dtype=np.int64)     # ring i = coordinates[offsets[i]:offsets[i + 1]]
+        self.keys = list(keys)
+        self.scale = int(scale)
+        self._index = {k: i for i, k in enumerate(self.keys)}
+
+    @classmethod
+    def from_geojson(cls, mapping: dict[str, str], scale: int = SCALE) -> "PolygonStore":
+        """Builds the store from GeoJSON ring strings ("[[lon, lat], ...]") per key."""
+        keys = sorted(mapping)
+        rings = [np.asarray(json.loads(mapping[k]), dtype=np.float64).reshape(-1, 2) for k in keys]
+        fixed = [np.rint(ring * scale) for ring in rings]
+        for key, ring, f in zip(keys, rings, fixed):
+            if np.abs(f).max(initial=0) > np.iinfo(np.int32).max or not np.allclose(f / scale, ring, rtol=0, atol=1e-9):
+                raise ValueError(f"Polygon {key}: coordinates do not fit scale {scale}")
+        offsets = np.cumsum([0] + [len(ring) for ring in rings])
+        coordinates = np.concatenate(fixed).astype(np.int32) if fixed else np.zeros((0, 2), dtype=np.int32)
+        return cls(coordinates, offsets, keys, scale)
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def fixed(self, key: str) -> np.ndarray:
+        """Ring of `key` as stored: int32 (n x 2) lon/lat * scale."""
+        i = self._index[key]
+        return self.coordinates[self.offsets[i]:self.offsets[i + 1]]
+
+    def array(self, key: str) -> np.ndarray:
+        """Ring of `key` as float64 (n x 2) lon/lat."""
+        return self.fixed(key) / self.scale
+
+    def geojson(self, key: str) -> str:
+        """Ring of `key` as GeoJSON coordinate string, e.g. "[[8.7994, 50.3659], ...]"."""
+        return json.dumps(self.array(key).tolist())
+
+    def geojson_map(self, keys) -> dict[str, str]:
+        """GeoJSON strings of the known `keys` (each decoded once), e.g. for `Series.map`."""
+        return {k: self.geojson(k) for k in dict.fromkeys(keys) if k in self._index}
+
+    # Persistence
+
+    def save(self, base: str = POLYGON_STORE) -> str:
+        np.save(base + ".npy", np.ascontiguousarray(self.coordinates, dtype=np.int32))
+        index = {"scale": self.scale, "keys": self.keys, "offsets": self.offsets.tolist()}
+        with open(base + ".json.tmp", "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False, indent=2)
+        os.replace(base + ".json.tmp", base + ".json")
+        return base
+
+    @classmethod
+    def load(cls, base: str = POLYGON_STORE, mmap: bool = True) -> "PolygonStore":
+        """Loads `<base>.npy`/`<base>.json`; the coordinates are memory-mapped unless `mmap` is False."""
+        with open(base + ".json", "r", encoding="utf-8") as f:
+            index = json.load(f)
+        coordinates = np.load(base + ".npy", mmap_mode="r" if mmap else None)
+        return cls(coordinates, index["offsets"], index["keys"], index["scale"])
+
+
+@functools.lru_cache(maxsize=None)
+def polygon_store(base: str = POLYGON_STORE) -> PolygonStore:
+    """The Gemeinde boundary store, loaded on first use."""
+    return PolygonStore.load(base)
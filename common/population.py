@@ -0,0 +1,89 @@
+import functools
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+from common.age_matrix import MATRIX_DIR, AgeMatrix
+from common.db_loader import GEMEINDE_COLUMNS, YEAR_COLUMNS, with_canonical_keys
+from common.gebiet_schluessel import gebiet_schluessel
+from common.mapping import KREIS_SCHLUESSEL
+
+# Population index for per-capita rates.
+#
+# The index is read from the age matrix that geburtsjahrgangsstatistik.py stores
+# (result/.age_matrix/geburtsjahrgangsstatistik.npy), so the population workbook is not
+# read again. It holds the population per (gemeinde_schluessel, jahr) plus the district
+# total under the Kreisschlüssel, optionally restricted to an age range (e.g. 65+).
+#
+# `add_per_1000` joins it to any result table with a Gemeinde name or key column and a
+# year column (tables without a Gemeinde column are district-level, see db_loader):
+#
+#     df = add_per_1000(df, ["Insgesamt"], name="{} je 1.000 Einwohner", population_column="Einwohner")
+
+POPULATION_MATRIX = os.path.join(MATRIX_DIR, "geburtsjahrgangsstatistik")
+KEY_FACTOR = 10000  # gemeinde_schluessel * KEY_FACTOR + jahr
+
+
+@functools.lru_cache(maxsize=8)
+def population_index(min_age: int = 0, max_age: int | None = None, matrix_base: str = POPULATION_MATRIX) -> pd.Series | None:
+    """
+    Population aged min_age..max_age (None = open) as a Series indexed by
+    (gemeinde_schluessel, jahr), sorted. None if the age matrix has not been built yet.
+    """
+    if not os.path.exists(matrix_base + ".npy"):
+        logging.warning(f"Population index: '{matrix_base}.npy' not found, run geburtsjahrgangsstatistik.py first")
+        return None
+
+    matrix = AgeMatrix.load(matrix_base)
+    counts = matrix.range_counts(min_age, max_age).where(matrix.present)
+    counts.index = [gebiet_schluessel.get(g, (None, None))[0] for g in counts.index]
+    counts = counts[counts.index.notnull()]
+    counts.loc[KREIS_SCHLUESSEL] = counts.sum(min_count=1)
+
+    index = counts.stack().dropna().astype("int64")
+    index.index = index.index.set_names(["gemeinde_schluessel", "jahr"])
+    return index.sort_index()
+
+
+def population_for(df: pd.DataFrame, index: pd.Series) -> np.ndarray:
+    """Population of every row of `df` (NaN where the index has no value for the row's Gemeinde and year)."""
+    key_columns = [c for c in df.columns if c in GEMEINDE_COLUMNS + YEAR_COLUMNS or c == "gemeinde_schluessel"]
+    keys = with_canonical_keys(df[key_columns])
+    codes = keys["gemeinde_schluessel"].to_numpy(dtype=np.int64) * KEY_FACTOR + keys["jahr"].to_numpy(dtype=np.int64)
+
+    if index.empty:
+        return np.full(len(df), np.nan)
+    # The index is sorted by (gemeinde_schluessel, jahr), so its codes are sorted as well
+    index_codes = (index.index.get_level_values(0).to_numpy(dtype=np.int64) * KEY_FACTOR
+                   + index.index.get_level_values(1).to_numpy(dtype=np.int64))
+    position = np.minimum(np.searchsorted(index_codes, codes), len(index_codes) - 1)
+    return np.where(index_codes[position] == codes, index.to_numpy(dtype=np.float64)[position], np.nan)
+
+
+def add_per_1000(df: pd.DataFrame, columns: list[str], name: str = "{}_je_1000",
+                 population_column: str | None = "einwohner", min_age: int = 0, max_age: int | None = None) -> pd.DataFrame:
+    """
+    Adds `columns` per 1,000 inhabitants (aged min_age..max_age) and, with `population_column`,
+    the population itself. Rows without population data get NaN; without an index (age
+    matrix not built yet) the table is returned unchanged.
+    """
+    index = population_index(min_age, max_age)
+    if index is None:
+        return df
+
+    population = population_for(df, index)
+    missing = np.isnan(population).sum()
+    if missing:
+        logging.warning(f"Population index: no population for {missing} of {len(df)} row(s)")
+
+    derived = {}
+    if population_column:
+        derived[population_column] = pd.array(population, dtype="Int64")
+    values = df[columns].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rates = np.where(population[:, None] > 0, values / population[:, None] * 1000, np.nan)
+    for i, column in enumerate(columns):
+        derived[name.format(column)] = np.round(rates[:, i], 2)
+    return pd.concat([df, pd.DataFrame(derived, index=df.index)], axis=1)
@@ -0,0 +1,98 @@
+import numpy as np
+
+# Cohort-component population projection on per-Gemeinde single-age counts.
+#
+# Input is an array (Gemeinde x year x age) of consecutive Stichtag years, e.g.
+# `AgeMatrix.age_counts(MAX_AGE)` at `AgeMatrix.stichtage`; the last age is open-ended
+# (MAX_AGE+).
+#
+# Rates are derived from consecutive years without death or migration registers:
+# - cohort change ratio per Gemeinde and age: population aged a+1 in year t+1 per
+#   person aged a in year t (survival and net migration together)
+# - survival: the district-wide cohort change ratio, capped at 1 (net migration
+#   of the whole district is small compared to that of a single Gemeinde)
+# - migration: the remaining Gemeinde-specific change (net migrants per person)
+# - fertility: newborns per inhabitant of FERTILE_AGES (per Gemeinde)
+#
+# Years derived from one snapshot (all but the last year of the dadigesamt matrix) keep
+# every cohort unchanged, so their change ratio is 1 by construction. For them
+# `migration=False` leaves the change out: survival has to come from elsewhere (e.g.
+# the district files) and migration is 0; fertility still comes from the Jahrgänge.
+#
+# `project` advances all Gemeinden and scenarios at once; each step is one shifted
+# multiply-add over the age axis (the banded Leslie matrix), so a sweep over
+# hundreds of scenario parameters stays interactive.
+
+MAX_AGE = 90
+FERTILE_AGES = (15, 44)
+
+
+def estimate_rates(counts: np.ndarray, years: list[int], fertile_ages: tuple[int, int] = FERTILE_AGES,
+                   survival: np.ndarray | None = None, migration: bool = True) -> dict:
+    """
+    Survival (age), migration (Gemeinde x age) and fertility (Gemeinde) rates from the
+    transitions between consecutive years; all year pairs are pooled. A given `survival`
+    schedule (e.g. estimated from district data) replaces the estimated one. Without
+    `migration` (years that are not real Stichtage) the migration rates are 0 and
+    `survival` is required.
+    """
+    if len(years) < 2 or np.any(np.diff(years) != 1):
+        raise ValueError(f"Rates need at least two consecutive years, got {list(years)}")
+    if not migration and survival is None:
+        raise ValueError("Rates without migration need a given survival schedule")
+
+    counts = np.asarray(counts, dtype=np.float64)
+    before, after = counts[:, :-1, :], counts[:, 1:, :]
+    # Age a -> a+1; the open-ended age group also keeps its own survivors
+    exposed = before[:, :, :-1].sum(axis=1)
+    exposed[:, -1] += before[:, :, -1].sum(axis=1)
+    aged = after[:, :, 1:].sum(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = np.where(exposed > 0, aged / exposed, 1.0)
+        district = np.where(exposed.sum(axis=0) > 0, aged.sum(axis=0) / exposed.sum(axis=0), 1.0)
+        low, high = fertile_ages
+        mothers = before[:, :, low:high + 1].sum(axis=(1, 2))
+        fertility = np.where(mothers > 0, after[:, :, 0].sum(axis=1) / mothers, 0.0)
+
+    if survival is None:
+        survival = np.minimum(district, 1.0)
+    return {
+        "survival": survival,
+        "migration": change - survival[None, :] if migration else np.zeros_like(change),
+        "fertility": fertility,
+        "fertile_ages": fertile_ages,
+    }
+
+
+def project(base: np.ndarray, rates: dict, steps: int, survival_factor=1.0, migration_factor=1.0,
+            fertility_factor=1.0) -> np.ndarray:
+    """
+    Projects `base` (Gemeinde x age, the last observed year) `steps` years forward.
+
+    The factors scale the estimated rates and may be scalars or 1-d arrays of scenarios
+    (broadcast against each other). Returns scenario x Gemeinde x (steps + 1) x age,
+    index 0 of the time axis being `base`.
+    """
+    survival_factor, migration_factor, fertility_factor = (
+        np.asarray(f, dtype=np.float64).reshape(-1) for f in np.broadcast_arrays(
+            np.atleast_1d(survival_factor), np.atleast_1d(migration_factor), np.atleast_1d(fertility_factor))
+    )
+    base = np.asarray(base, dtype=np.float64)
+    scenarios = len(survival_factor)
+    low, high = rates["fertile_ages"]
+
+    # Scenario x Gemeinde x age transition factors, negative growth is cut at 0
+    growth = (survival_factor[:, None, None] * rates["survival"][None, None, :]
+              + migration_factor[:, None, None] * rates["migration"][None, :, :])
+    growth = np.maximum(growth, 0.0)
+    births = fertility_factor[:, None] * rates["fertility"][None, :]
+
+    result = np.empty((scenarios, base.shape[0], steps + 1, base.shape[1]))
+    result[:, :, 0] = base
+    for t in range(steps):
+        current, following = result[:, :, t], result[:, :, t + 1]
+        following[..., 1:] = current[..., :-1] * growth
+        following[..., -1] += current[..., -1] * growth[..., -1]
+        following[..., 0] = births * current[..., low:high + 1].sum(axis=-1)
+    return result
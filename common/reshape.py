@@ -0,0 +1,161 @@
+import os
+from typing import Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+# Wide-to-long reshaping ("melt") in chunks with compact column types.
+#
+# A long table repeats every id value once per variable, so with object columns the
+# Gemeinde names and variable labels dominate its memory. Here the text columns become
+# categoricals (one small integer code per row), the variable column is built directly
+# from its codes, integers get the smallest integer type that holds them and floats
+# become float32 where that is lossless. The kind of the value column (integer or float)
+# follows the input columns, so every chunk prints its numbers the same way. A later
+# chunk can only widen it: whole numbers with gaps (an integer column with a missing
+# value in that chunk, read as float) stay integers as nullable Int64, fractional values
+# turn the value column into floats from that chunk on.
+#
+# The input is processed CHUNK_ROWS wide rows at a time and `write_long` streams the
+# chunks into a CSV or Parquet file, so memory stays flat however many years and
+# variables the input has:
+#
+#     chunks = pd.read_csv("wide.csv", chunksize=CHUNK_ROWS)
+#     write_long(melt_chunks(chunks, ["gemeinde", "jahr"]), "long.csv")
+
+CHUNK_ROWS = 50_000
+
+
+def downcast(series: pd.Series) -> pd.Series:
+    """Text as categorical, integers in the smallest integer type, floats as float32 if lossless."""
+    if pd.api.types.is_bool_dtype(series) or isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    if pd.api.types.is_integer_dtype(series):
+        if series.count() == 0:
+            return series
+        low, high = series.min(), series.max()
+        nullable = isinstance(series.dtype, pd.api.extensions.ExtensionDtype)
+        for dtype in (np.int8, np.int16, np.int32):
+            if np.iinfo(dtype).min <= low and high <= np.iinfo(dtype).max:
+                return series.astype(f"Int{np.iinfo(dtype).bits}" if nullable else dtype)
+        return series
+    if pd.api.types.is_float_dtype(series):
+        values = series.to_numpy(dtype=np.float64)
+        with np.errstate(over="ignore", invalid="ignore"):
+            narrow = values.astype(np.float32)
+        same = (narrow.astype(np.float64) == values) | np.isnan(values)
+        return pd.Series(narrow, index=series.index, name=series.name) if same.all() else series
+    if series.dtype == object or pd.api.types.is_string_dtype(series):
+        return series.astype("category")
+    return series
+
+
+def _slices(data, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    if isinstance(data, pd.DataFrame):
+        for start in range(0, max(len(data), 1), chunk_rows):
+            yield data.iloc[start:start + chunk_rows]
+    else:
+        yield from data
+
+
+def melt_chunks(data: pd.DataFrame | Iterable[pd.DataFrame], id_vars: list[str], value_vars: list[str] | None = None,
+                var_name: str = "variable", value_name: str = "value",
+                chunk_rows: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """
+    Melts a wide table (a DataFrame or an iterable of chunks, e.g. `read_csv(chunksize=)`)
+    into long chunks with the columns `id_vars`, `var_name` and `value_name`, like
+    `DataFrame.melt` per chunk. Without `value_vars` all non-id columns of the first chunk
+    are melted. The variable column is a categorical with `value_vars` as categories.
+    """
+    value_kind = None
+    for chunk in _slices(data, chunk_rows):
+        if value_vars is None:
+            value_vars = [c for c in chunk.columns if c not in id_vars]
+        kind = np.result_type(*[chunk[c].dtype for c in value_vars]) if value_vars else np.dtype(np.float64)
+        if kind.kind not in "iuf":
+            kind = np.dtype(object)
+        value_kind = kind if value_kind is None else value_kind
+        rows, n = len(chunk), len(value_vars)
+
+        long = {c: downcast(pd.Series(np.tile(chunk[c].to_numpy(), n), name=c)) for c in id_vars}
+        codes = np.repeat(np.arange(n, dtype=np.int8 if n < 128 else np.int32), rows)
+        long[var_name] = pd.Categorical.from_codes(codes, categories=pd.Index(value_vars))
+        flat = chunk[value_vars].to_numpy(dtype=np.result_type(value_kind, kind)).reshape(-1, order="F")
+        if value_kind.kind in "iu" and flat.dtype.kind == "f":
+            present = flat[~np.isnan(flat)]
+            if np.array_equal(present, np.trunc(present)):
+                flat = pd.array(flat, dtype="Int64")
+        if flat.dtype.kind in "fO":
+            value_kind = flat.dtype
+        values = pd.Series(flat, name=value_name)
+        long[value_name] = values if value_kind == object else downcast(values)
+        yield pd.DataFrame(long)
+
+
+def melt_frame(df: pd.DataFrame, id_vars: list[str], value_vars: list[str] | None = None,
+               var_name: str = "variable", value_name: str = "value") -> pd.DataFrame:
+    """`melt_chunks` of an in-memory frame as one long frame (same row order as `DataFrame.melt`)."""
+    return next(melt_chunks(df, id_vars, value_vars, var_name, value_name, chunk_rows=max(len(df), 1)))
+
+
+def _widened(chunk: pd.DataFrame) -> pd.DataFrame:
+    """Chunk with plain column types, so all chunks share one Parquet schema."""
+    chunk = chunk.copy()
+    for column in chunk.columns:
+        series = chunk[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            chunk[column] = series.astype(object)
+        elif pd.api.types.is_integer_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            nullable = isinstance(series.dtype, pd.api.extensions.ExtensionDtype)
+            chunk[column] = series.astype("Int64" if nullable else np.int64)
+        elif pd.api.types.is_float_dtype(series):
+            chunk[column] = series.astype(np.float64)
+    return chunk
+
+
+def write_long(chunks: Iterable[pd.DataFrame], path: str, csv_options: dict | None = None) -> int:
+    """
+    Streams long chunks into `path` (.csv or .parquet, the latter requires pyarrow) and
+    returns the number of rows. The file is replaced only once all chunks are written.
+    Parquet keeps the column types of the first chunk; a later chunk that needs wider
+    ones (fractional values in an integer value column) is a ValueError.
+    """
+    fmt = os.path.splitext(path)[1].lower().lstrip(".")
+    if fmt not in ("csv", "parquet"):
+        raise ValueError(f"Unsupported long output '{path}': expected .csv or .parquet")
+    if fmt == "parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet output requires 'pyarrow' (pip install pyarrow)")
+        from common.output import PARQUET_COMPRESSION
+
+    tmp = path + ".tmp"
+    rows = 0
+    writer = None
+    try:
+        for chunk in chunks:
+            if fmt == "csv":
+                chunk.to_csv(tmp, index=False, mode="w" if writer is None else "a", header=writer is None,
+                             **(csv_options or {}))
+                writer = True
+            else:
+                try:
+                    table = pa.Table.from_pandas(_widened(chunk), schema=writer.schema if writer else None,
+                                                 preserve_index=False)
+                except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                    # e.g. fractional values after integer chunks: the written schema cannot widen
+                    raise ValueError(f"{path}: chunk at row {rows} does not fit the Parquet schema of "
+                                     f"the first chunk ({e}); read the value columns as float") from e
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp, table.schema, compression=PARQUET_COMPRESSION)
+                writer.write_table(table)
+            rows += len(chunk)
+        if writer is None:
+            open(tmp, "w").close()
+    finally:
+        if fmt == "parquet" and writer is not None:
+            writer.close()
+    os.replace(tmp, path)
+    return rows
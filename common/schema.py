@@ -0,0 +1,164 @@
+import numpy as np
+import pandas as pd
+
+from common import instrumentation
+
+# Column types of the result tables.
+#
+# SCHEMAS declares per table the compact type of its columns: text columns with few
+# distinct values (Gemeinde, Geschlecht, Eigenschaft, Straftat) as categoricals, counts
+# as int32, years and ages as int16, count columns that can be empty (left joins) as
+# float32. The scripts apply the schema to every extracted frame, so concat, merge and
+# groupby already run on the compact columns:
+#
+#     df = apply_schema(extract(path), "gender_distribution")
+#     combined = concat_tables(frames, "gender_distribution")
+#
+# A column is only narrowed within its kind and only where no value changes (integers
+# that fit, floats that are exact in float32), so the written CSV and Excel files stay
+# the same; columns a table does not have are skipped. Categoricals of different frames
+# are unified in `concat_tables`, a plain `pd.concat` would fall back to object columns.
+#
+# With DATEN_METRICS=1, `report_memory` adds the memory of every written table to the
+# metrics report (result/metrics/<script>.json), next to the memory the same table takes
+# with default types (object/int64/float64).
+
+_COUNTS = "int32"
+_YEAR = "int16"
+
+SCHEMAS: dict[str, dict[str, str]] = {
+    "altersverteilung": {
+        "Jahr": _YEAR, "Alter": _YEAR, "Jahrgang": _YEAR, "EW gesamt": _COUNTS,
+    },
+    "arbeitslose_wetterau": {
+        "Gemeinde": "category", "Jahr": _YEAR,
+        "Insgesamt": _COUNTS, "Männer": _COUNTS, "Frauen": _COUNTS, "SGB III": _COUNTS, "SGB II": _COUNTS,
+    },
+    "arbeitsmarkt_gesamt": {
+        "gemeinde": "category", "gemeinde_id": _COUNTS, "year": _YEAR,
+        "total": _COUNTS, "male-arbeitslos": _COUNTS, "female-arbeitslos": _COUNTS, "sgb3": _COUNTS, "sgb2": _COUNTS,
+        "nace-a": _COUNTS, "nace-b-f": _COUNTS, "nace-g-i": _COUNTS, "nace-j-u": _COUNTS,
+        "male-pendler": "float32", "female-pendler": "float32", "einpendler": "float32", "auspendler": "float32",
+    },
+    "arbeitsmarkt_gesamt_2": {
+        "Gemeinde": "category", "Jahr": _YEAR, "Eigenschaft": "category",
+        "Insgesamt": _COUNTS, "Männer": _COUNTS, "Frauen": _COUNTS, "SGB III": _COUNTS, "SGB II": _COUNTS,
+        "Land- und Forstwirtschaft, Fischerei ( A )": _COUNTS, "Produzierendes Gewerbe ( B - F )": _COUNTS,
+        "Handel, Verkehr und Gastgewerbe ( G - I )": _COUNTS, "Sonstige Dienstleistungen ( J - U )": _COUNTS,
+        "Männer (Pendlersaldo)": "float32", "Frauen (Pendlersaldo)": "float32",
+        "Einpendler": "float32", "Auspendler": "float32",
+    },
+    "arbeitsortbeschaeftigung": {
+        "gemeinde": "category",
+        "Land- und Forstwirtschaft, Fischerei ( A )": "float32", "Produzierendes Gewerbe ( B - F )": "float32",
+        "Handel, Verkehr und Gastgewerbe ( G - I )": "float32", "Sonstige Dienstleistungen ( J - U )": "float32",
+    },
+    "gemband": {
+        "gemeinde": "category", "year": _YEAR,
+        "male-pendler": "float32", "female-pendler": "float32", "einpendler": "float32", "auspendler": "float32",
+    },
+    "geburtsjahrgangsstatistik": {
+        "Gebiet": "category", "Gemeinde": "category", "gemeinde": "category", "Jahrgang": _YEAR,
+        "EW gesamt": _COUNTS, "gemeinde_schluessel": "Int32", "jahr": _YEAR,
+        "junge": _COUNTS, "mittleren": _COUNTS, "alte": _COUNTS,
+    },
+    "gender_distribution": {
+        "Jahr": _YEAR, "Gemeinde": "category", "Geschlecht": "category", "Anzahl": _COUNTS,
+    },
+    "kriminalstatistik": {
+        "schluessel": "category", "straftat": "category", "kreisart": "category", "jahr": _YEAR,
+        "faelle": _COUNTS, "versuche_anzahl": _COUNTS, "mit_schusswaffe_gedroht": _COUNTS,
+        "mit_schusswaffe_geschossen": _COUNTS, "aufklaerung_faelle": _COUNTS,
+        "tatverdaechtige_insgesamt": _COUNTS, "tatverdaechtige_maennlich": _COUNTS,
+        "tatverdaechtige_weiblich": _COUNTS, "nichtdeutsche_tv_anzahl": _COUNTS,
+    },
+}
+
+
+def _narrowed(series: pd.Series, dtype: str) -> pd.Series:
+    """`series` as `dtype` if that keeps its kind and every value, otherwise unchanged."""
+    if dtype == "category":
+        if isinstance(series.dtype, pd.CategoricalDtype) or not (series.dtype == object or pd.api.types.is_string_dtype(series)):
+            return series
+        return series.astype("category")
+
+    target = pd.api.types.pandas_dtype(dtype)
+    if pd.api.types.is_integer_dtype(target):
+        if not pd.api.types.is_integer_dtype(series) or pd.api.types.is_bool_dtype(series):
+            return series
+        nullable = isinstance(target, pd.api.extensions.ExtensionDtype)
+        if not nullable and series.isna().any():
+            return series
+        values = series.dropna()
+        info = np.iinfo(target.numpy_dtype if nullable else target)
+        if len(values) and (values.min() < info.min or values.max() > info.max):
+            return series
+        return series.astype(target)
+    if pd.api.types.is_float_dtype(target):
+        if not pd.api.types.is_float_dtype(series):
+            return series
+        values = series.to_numpy(dtype=np.float64)
+        with np.errstate(over="ignore", invalid="ignore"):
+            narrow = values.astype(target)
+        if not ((narrow.astype(np.float64) == values) | np.isnan(values)).all():
+            return series
+        return pd.Series(narrow, index=series.index, name=series.name)
+    return series
+
+
+def apply_schema(df: pd.DataFrame, table: str) -> pd.DataFrame:
+    """Copy of `df` with the columns declared for `table` in SCHEMAS narrowed to their types."""
+    schema = SCHEMAS[table]
+    df = df.copy()
+    for column in df.columns:
+        if column in schema:
+            df[column] = _narrowed(df[column], schema[column])
+    return df
+
+
+def concat_tables(frames: list[pd.DataFrame], table: str) -> pd.DataFrame:
+    """`pd.concat(frames, ignore_index=True)` with the schema of `table`; categoricals stay categoricals."""
+    frames = [apply_schema(f, table) for f in frames]
+    if not frames:
+        return pd.DataFrame()
+    for column in dict.fromkeys(c for f in frames for c in f.columns):
+        parts = [f[column] for f in frames if column in f.columns]
+        if not all(isinstance(p.dtype, pd.CategoricalDtype) for p in parts):
+            continue
+        categories = pd.Index(sorted(set().union(*(p.cat.categories for p in parts))))
+        for f in frames:
+            if column in f.columns:
+                f[column] = f[column].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
+
+
+def default_types(df: pd.DataFrame) -> pd.DataFrame:
+    """`df` with the types pandas gives without a schema (object text, int64, float64)."""
+    widened = {}
+    for column, dtype in df.dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            widened[column] = object
+        elif pd.api.types.is_integer_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            widened[column] = "Int64" if isinstance(dtype, pd.api.extensions.ExtensionDtype) else np.int64
+        elif pd.api.types.is_float_dtype(dtype):
+            widened[column] = np.float64
+    return df.astype(widened)
+
+
+def memory_report(df: pd.DataFrame, table: str) -> dict:
+    """Rows and memory (MB, deep) of `df`, per column and with default types for comparison."""
+    usage = df.memory_usage(index=False, deep=True)
+    default = default_types(df).memory_usage(index=False, deep=True).sum()
+    return {
+        "table": table,
+        "rows": len(df),
+        "memory_mb": round(usage.sum() / 2 ** 20, 3),
+        "default_types_mb": round(default / 2 ** 20, 3),
+        "columns": {str(c): {"dtype": str(df[c].dtype), "bytes": int(usage[c])} for c in df.columns},
+    }
+
+
+def report_memory(df: pd.DataFrame, table: str):
+    """Adds `memory_report` of `df` to the metrics report (no-op unless DATEN_METRICS is set)."""
+    if instrumentation.ENABLED:
+        instrumentation.record_table(memory_report(df, table))
@@ -0,0 +1,174 @@
+import functools
+import math
+import os
+import sys
+
+import numpy as np
+
+from common.polygons import POLYGON_STORE, PolygonStore, polygon_store
+
+# Douglas-Peucker simplification of the Gemeinde boundaries with shared arcs.
+#
+# Neighbouring Gemeinden share their common border as identical vertices. The rings are
+# cut into arcs at the junctions (vertices with more or less than two distinct
+# neighbours in the whole boundary graph), every arc is simplified once and each ring is
+# put back together from its arcs, so shared borders stay identical and no gaps or
+# overlaps appear between neighbours. Arcs of rings with fewer than three junctions are
+# split at their farthest vertex first, so every ring keeps at least three corners.
+#
+# All arcs are simplified together: one round per recursion depth of Douglas-Peucker,
+# each round computes the distances of the interior vertices of all open segments at
+# once and splits every segment at its farthest vertex beyond the tolerance.
+#
+# Tolerances are in metres (DETAIL_LEVELS); the level is selected per run with
+# `--detail=` or POLYGON_DETAIL, e.g. `--detail=medium`.
+
+DETAIL_LEVELS = {
+    "full": 0.0,
+    "high": 20.0,
+    "medium": 50.0,
+    "low": 150.0,
+}
+DEFAULT_DETAIL = "full"
+METRES_PER_DEGREE = 111_320.0
+
+
+def requested_detail() -> str:
+    """Detail level selected for this run via `--detail=` or POLYGON_DETAIL (default: full)."""
+    value = os.environ.get("POLYGON_DETAIL", "")
+    for arg in sys.argv[1:]:
+        if arg.startswith("--detail="):
+            value = arg.split("=", 1)[1]
+    value = value.strip().lower() or DEFAULT_DETAIL
+    if value not in DETAIL_LEVELS:
+        raise ValueError(f"Unknown detail level '{value}', expected one of {', '.join(DETAIL_LEVELS)}")
+    return value
+
+
+def _ring_arcs(ring: np.ndarray, junction: np.ndarray) -> list[np.ndarray]:
+    """Splits a closed ring of point ids (first == last) into arcs between junctions."""
+    points = ring[:-1]
+    cuts = np.flatnonzero(junction[points])
+    if not len(cuts):
+        return [ring]
+    rotated = np.roll(points, -cuts[0])
+    cuts = np.append(cuts - cuts[0], len(points))
+    return [np.append(rotated[a:b], rotated[b % len(points)]) for a, b in zip(cuts[:-1], cuts[1:])]
+
+
+def _canonical(arc: np.ndarray) -> tuple[tuple, bool]:
+    """Direction-independent key of an arc and whether it had to be reversed."""
+    reverse = arc[-1] < arc[0] or (arc[-1] == arc[0] and len(arc) > 2 and arc[-2] < arc[1])
+    return tuple((arc[::-1] if reverse else arc).tolist()), reverse
+
+
+def douglas_peucker(xy: np.ndarray, starts: np.ndarray, stops: np.ndarray, tolerance: float,
+                    split_first: np.ndarray | None = None) -> np.ndarray:
+    """
+    Keep-mask of the vertices of all arcs xy[starts[i]:stops[i]] (simplified together).
+
+    Arcs flagged in `split_first` are split at their farthest vertex regardless of the
+    tolerance (for a closed arc: the vertex farthest from its start).
+    """
+    keep = np.zeros(len(xy), dtype=bool)
+    keep[starts] = True
+    keep[stops - 1] = True
+
+    first = np.asarray(starts, dtype=np.int64)
+    last = np.asarray(stops, dtype=np.int64) - 1
+    force = np.zeros(len(first), dtype=bool) if split_first is None else np.asarray(split_first, dtype=bool)
+    while True:
+        open_ = last - first > 1
+        first, last, force = first[open_], last[open_], force[open_]
+        if not len(first):
+            return keep
+
+        # Interior vertices of all segments, flattened
+        lengths = last - first - 1
+        segment = np.repeat(np.arange(len(first)), lengths)
+        offsets = np.cumsum(lengths) - lengths
+        index = first[segment] + 1 + np.arange(lengths.sum()) - offsets[segment]
+
+        # Distance to the segment (to the start for degenerate, closed segments)
+        a, b, p = xy[first[segment]], xy[last[segment]], xy[index]
+        ab = b - a
+        length2 = (ab ** 2).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.where(length2 > 0, ((p - a) * ab).sum(axis=1) / length2, 0.0)
+        nearest = a + np.clip(t, 0.0, 1.0)[:, None] * ab
+        distance = np.sqrt(((p - nearest) ** 2).sum(axis=1))
+
+        # Farthest interior vertex per segment (first one on ties)
+        farthest = np.maximum.reduceat(distance, offsets)
+        candidates = np.flatnonzero(distance == farthest[segment])
+        _, first_candidate = np.unique(segment[candidates], return_index=True)
+        split_at = index[candidates[first_candidate]]
+
+        split = force | (farthest > tolerance)
+        keep[split_at[split]] = True
+        first, last = np.concatenate([first[split], split_at[split]]), np.concatenate([split_at[split], last[split]])
+        force = np.zeros(len(first), dtype=bool)
+
+
+def simplify(store: PolygonStore, tolerance_m: float) -> PolygonStore:
+    """Simplified copy of `store` (tolerance in metres); shared borders stay shared."""
+    if tolerance_m <= 0 or not len(store):
+        return store
+
+    coordinates = np.asarray(store.coordinates, dtype=np.int64)
+    packed = coordinates[:, 0] << 32 | (coordinates[:, 1] & 0xFFFFFFFF)
+    unique, ids = np.unique(packed, return_inverse=True)
+    ids = ids.reshape(-1)
+    vertices = np.column_stack([unique >> 32, (unique & 0xFFFFFFFF).astype(np.int32)])
+
+    # Junctions: vertices without exactly two distinct neighbours in the boundary graph
+    ring_of = np.repeat(np.arange(len(store)), np.diff(store.offsets))
+    same_ring = ring_of[1:] == ring_of[:-1]
+    a, b = ids[:-1][same_ring], ids[1:][same_ring]
+    edges = np.unique(np.minimum(a, b) * len(unique) + np.maximum(a, b))
+    edges = edges[edges // len(unique) != edges % len(unique)]
+    degree = np.bincount(np.concatenate([edges // len(unique), edges % len(unique)]), minlength=len(unique))
+    junction = degree != 2
+
+    # Unique arcs in canonical direction; rings as lists of (arc, reversed)
+    arcs, ring_arcs, needs_split = {}, [], {}
+    for i in range(len(store)):
+        ring = ids[store.offsets[i]:store.offsets[i + 1]]
+        parts = []
+        pieces = _ring_arcs(ring, junction)
+        for arc in pieces:
+            key, reverse = _canonical(arc)
+            arcs.setdefault(key, len(arcs))
+            parts.append((arcs[key], reverse))
+            # Too few corners or a closed arc: split at the farthest vertex first
+            needs_split[arcs[key]] = needs_split.get(arcs[key], False) or len(pieces) < 3 or arc[0] == arc[-1]
+        ring_arcs.append(parts)
+
+    # Planar coordinates in degrees of latitude (longitude scaled at the mean latitude)
+    keys = list(arcs)
+    lengths = np.array([len(k) for k in keys], dtype=np.int64)
+    stops = np.cumsum(lengths)
+    starts = stops - lengths
+    points = np.concatenate([np.asarray(k, dtype=np.int64) for k in keys])
+    lonlat = vertices / store.scale
+    xy = lonlat[points] * [math.cos(math.radians(lonlat[:, 1].mean())), 1.0]
+    keep = douglas_peucker(xy, starts, stops, tolerance_m / METRES_PER_DEGREE,
+                           np.array([needs_split[i] for i in range(len(keys))]))
+
+    simplified = [points[s:e][keep[s:e]] for s, e in zip(starts, stops)]
+    rings = []
+    for parts in ring_arcs:
+        pieces = [simplified[arc][::-1] if reverse else simplified[arc] for arc, reverse in parts]
+        # Consecutive arcs share their junction vertex
+        rings.append(np.concatenate([pieces[0]] + [piece[1:] for piece in pieces[1:]]))
+
+    offsets = np.cumsum([0] + [len(ring) for ring in rings])
+    return PolygonStore(vertices.astype(np.int32)[np.concatenate(rings)], offsets, store.keys, store.scale)
+
+
+@functools.lru_cache(maxsize=None)
+def detail_store(detail: str = DEFAULT_DETAIL, base: str = POLYGON_STORE) -> PolygonStore:
+    """The Gemeinde boundary store at a detail level of DETAIL_LEVELS (simplified on first use)."""
+    if detail not in DETAIL_LEVELS:
+        raise ValueError(f"Unknown detail level '{detail}', expected one of {', '.join(DETAIL_LEVELS)}")
+    return simplify(polygon_store(base), DETAIL_LEVELS[detail])
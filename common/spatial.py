@@ -0,0 +1,124 @@
+import functools
+
+import numpy as np
+
+from common.polygons import PolygonStore, polygon_store
+
+# Point-in-polygon assignment of coordinates to Gemeinden.
+#
+# A regular grid over the district's bounding box lists, per cell, the Gemeinden whose
+# bounding box overlaps the cell. A point is only tested against the Gemeinden of its
+# cell (usually one to three), and all (point, Gemeinde) candidates of a batch are
+# ray-cast together: every candidate is expanded over the edges of its ring and the
+# crossings are counted with one bincount. Thousands of points cost a few array
+# operations, not a loop over points:
+#
+#     index = polygon_index()
+#     index.locate_keys(df["longitude"], df["latitude"])   # Gemeindekennziffer or None
+#
+# A point inside two rings (overlapping borders) goes to the Gemeinde with the lower key.
+
+GRID_CELLS = 32          # cells per axis
+EDGE_BATCH = 2_000_000   # edge tests per ray-casting batch (bounds the memory use)
+
+
+class PolygonIndex:
+    def __init__(self, store: PolygonStore, cells: int = GRID_CELLS):
+        self.keys = list(store.keys)
+        coordinates = np.asarray(store.coordinates, dtype=np.float64) / store.scale
+        offsets = store.offsets
+
+        # Edges of all rings back to back: ring i has edges edge_offsets[i]:edge_offsets[i + 1]
+        ring_of = np.repeat(np.arange(len(self.keys)), np.diff(offsets))
+        same_ring = ring_of[1:] == ring_of[:-1]
+        self.start = coordinates[:-1][same_ring]
+        self.end = coordinates[1:][same_ring]
+        self.edge_offsets = np.concatenate([[0], np.cumsum(np.bincount(ring_of[1:][same_ring], minlength=len(self.keys)))])
+
+        starts = offsets[:-1]
+        self.bbox = np.column_stack([
+            np.minimum.reduceat(coordinates, starts, axis=0),
+            np.maximum.reduceat(coordinates, starts, axis=0),
+        ])                                                      # lon_min, lat_min, lon_max, lat_max
+
+        # Grid: cell -> rings whose bounding box overlaps it (CSR, rings in key order)
+        self.cells = cells
+        self.origin = self.bbox[:, :2].min(axis=0)
+        self.size = (self.bbox[:, 2:].max(axis=0) - self.origin) / cells
+        low = self._cell(self.bbox[:, :2])
+        high = self._cell(self.bbox[:, 2:])
+        ring_cells, cell_rings = [], []
+        for ring, ((x0, y0), (x1, y1)) in enumerate(zip(low, high)):
+            x, y = np.meshgrid(np.arange(x0, x1 + 1), np.arange(y0, y1 + 1))
+            ring_cells.append((y * cells + x).ravel())
+            cell_rings.append(np.full(x.size, ring))
+        ring_cells, cell_rings = np.concatenate(ring_cells), np.concatenate(cell_rings)
+        order = np.lexsort((cell_rings, ring_cells))
+        self.cell_rings = cell_rings[order]
+        self.cell_offsets = np.concatenate([[0], np.cumsum(np.bincount(ring_cells, minlength=cells * cells))])
+
+    def _cell(self, points: np.ndarray) -> np.ndarray:
+        """Grid cell (x, y) of every point, clipped to the grid."""
+        return np.clip(((points - self.origin) / self.size).astype(np.int64), 0, self.cells - 1)
+
+    def locate(self, lon, lat) -> np.ndarray:
+        """Ring index (position in `keys`) containing every point, -1 outside all rings or without coordinates."""
+        points = np.column_stack([np.asarray(lon, dtype=np.float64), np.asarray(lat, dtype=np.float64)])
+        result = np.full(len(points), -1, dtype=np.int64)
+        valid = np.flatnonzero(~np.isnan(points).any(axis=1)
+                               & (points >= self.origin).all(axis=1)
+                               & (points <= self.origin + self.size * self.cells).all(axis=1))
+        if not len(valid):
+            return result
+
+        # Candidate (point, ring) pairs from the grid, then the bounding boxes
+        cell = self._cell(points[valid])
+        cell = cell[:, 1] * self.cells + cell[:, 0]
+        counts = self.cell_offsets[cell + 1] - self.cell_offsets[cell]
+        point = np.repeat(valid, counts)
+        first = np.repeat(self.cell_offsets[cell] - (np.cumsum(counts) - counts), counts)
+        ring = self.cell_rings[first + np.arange(len(point))]
+        box = self.bbox[ring]
+        inside_box = ((points[point] >= box[:, :2]) & (points[point] <= box[:, 2:])).all(axis=1)
+        point, ring = point[inside_box], ring[inside_box]
+
+        # Ray casting towards +lon, in batches of at most EDGE_BATCH edge tests
+        inside = np.zeros(len(point), dtype=bool)
+        edges = self.edge_offsets[ring + 1] - self.edge_offsets[ring]
+        cumulative = np.cumsum(edges)
+        lower = 0
+        while lower < len(point):
+            done = cumulative[lower - 1] if lower else 0
+            upper = max(int(np.searchsorted(cumulative, done + EDGE_BATCH, side="right")), lower + 1)
+            inside[lower:upper] = self._ray_cast(points[point[lower:upper]], ring[lower:upper], edges[lower:upper])
+            lower = upper
+
+        # First containing ring per point (pairs are ordered by point, then ring)
+        point, ring = point[inside], ring[inside]
+        located, position = np.unique(point, return_index=True)
+        result[located] = ring[position]
+        return result
+
+    def _ray_cast(self, points: np.ndarray, rings: np.ndarray, edges: np.ndarray) -> np.ndarray:
+        """True for every (point, ring) pair whose point lies inside the ring (even-odd rule)."""
+        pair = np.repeat(np.arange(len(points)), edges)
+        offsets = np.cumsum(edges) - edges
+        edge = np.repeat(self.edge_offsets[rings], edges) + np.arange(edges.sum()) - offsets[pair]
+        (x0, y0), (x1, y1) = self.start[edge].T, self.end[edge].T
+        px, py = points[pair].T
+        spans = (y0 > py) != (y1 > py)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossing = spans & (px < x0 + (py - y0) * (x1 - x0) / (y1 - y0))
+        return np.bincount(pair, weights=crossing, minlength=len(points)) % 2 == 1
+
+    def locate_keys(self, lon, lat) -> np.ndarray:
+        """Key (Gemeindekennziffer) of the ring containing every point, None outside."""
+        ring = self.locate(lon, lat)
+        keys = np.array(self.keys + [None], dtype=object)
+        return keys[ring]
+
+
+@functools.lru_cache(maxsize=None)
+def polygon_index() -> PolygonIndex:
+    """Grid index over the full-resolution Gemeinde boundaries, built on first use."""
+    return PolygonIndex(polygon_store())
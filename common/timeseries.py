@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+# Derived time-series columns (year-over-year change, growth rate, rolling mean, shares),
+# precomputed so that dashboards only select them.
+#
+# All functions work on a whole table at once: rows are ordered by (*keys, year) with
+# one lexsort, and the previous year of a row is the preceding row of that order if it
+# belongs to the same group and is exactly one year earlier. No groupby.apply, no loops
+# over Gemeinden. New columns are returned in the row order of the input table.
+
+
+def _order(df: pd.DataFrame, keys: list[str], time_column: str) -> tuple[np.ndarray, np.ndarray]:
+    """Row order by (*keys, time) and, in that order, True where a new group starts."""
+    codes = [pd.factorize(df[k])[0] for k in keys]
+    order = np.lexsort([df[time_column].to_numpy()] + codes[::-1])
+    same = np.ones(len(df), dtype=bool)
+    same[:1] = False
+    for c in codes:
+        c = c[order]
+        same[1:] &= c[1:] == c[:-1]
+    return order, ~same
+
+
+def previous_positions(df: pd.DataFrame, keys: list[str], time_column: str) -> np.ndarray:
+    """Position of the previous year's row of the same group for every row, -1 if there is none."""
+    order, new_group = _order(df, keys, time_column)
+    time = df[time_column].to_numpy()[order]
+    previous = np.full(len(df), -1, dtype=np.int64)
+    if len(df) > 1:
+        consecutive = ~new_group[1:] & (time[1:] - time[:-1] == 1)
+        previous[order[1:][consecutive]] = order[:-1][consecutive]
+    return previous
+
+
+def add_changes(df: pd.DataFrame, keys: list[str], time_column: str, columns: list[str],
+                delta: str | None = "{}_delta", pct: str | None = "{}_pct") -> pd.DataFrame:
+    """
+    Adds the change against the previous year (`delta`) and the growth rate in percent
+    (`pct`) of every column; the names are format strings, None skips a kind.
+    The first year of a group, gaps and a previous value of 0 (pct) give NaN.
+    """
+    previous = previous_positions(df, keys, time_column)
+    values = df[columns].to_numpy(dtype=np.float64)
+    before = np.where(previous[:, None] >= 0, values[np.maximum(previous, 0)], np.nan)
+
+    derived = {}
+    change = values - before
+    for i, column in enumerate(columns):
+        if delta:
+            derived[delta.format(column)] = change[:, i]
+        if pct:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rate = np.where(before[:, i] != 0, change[:, i] / before[:, i] * 100, np.nan)
+            derived[pct.format(column)] = np.round(rate, 2)
+    return pd.concat([df, pd.DataFrame(derived, index=df.index)], axis=1)
+
+
+def add_rolling_mean(df: pd.DataFrame, keys: list[str], time_column: str, columns: list[str],
+                     window: int = 3, name: str = "{}_avg{window}") -> pd.DataFrame:
+    """
+    Adds the mean over the last `window` years of the group (current year included;
+    missing years and NaN values are left out) of every column.
+    """
+    order, new_group = _order(df, keys, time_column)
+    values = df[columns].to_numpy(dtype=np.float64)[order]
+    valid = ~np.isnan(values)
+
+    # Prefix sums with a leading zero row; a window is the difference of two prefix rows
+    sums = np.vstack([np.zeros((1, len(columns))), np.cumsum(np.where(valid, values, 0.0), axis=0)])
+    counts = np.vstack([np.zeros((1, len(columns))), np.cumsum(valid, axis=0)])
+    # First row of the window: same group and year > year - window (gaps shorten the window)
+    time = df[time_column].to_numpy(dtype=np.int64)[order]
+    low = time.min() if len(df) else 0
+    span = (time.max() - low if len(df) else 0) + window + 1
+    composite = np.cumsum(new_group) * span + (time - low)
+    position = np.arange(len(df))
+    first = np.searchsorted(composite, composite - window + 1)
+    total = sums[position + 1] - sums[first]
+    count = counts[position + 1] - counts[first]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(count > 0, total / count, np.nan)
+
+    result = np.empty_like(mean)
+    result[order] = mean
+    derived = {name.format(column, window=window): np.round(result[:, i], 2) for i, column in enumerate(columns)}
+    return pd.concat([df, pd.DataFrame(derived, index=df.index)], axis=1)
+
+
+def add_shares(df: pd.DataFrame, columns: list[str], name: str = "{}_share") -> pd.DataFrame:
+    """Adds the share in percent of every column in the sum of `columns` (per row)."""
+    values = df[columns].to_numpy(dtype=np.float64)
+    total = values.sum(axis=1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shares = np.where(total != 0, values / total * 100, np.nan)
+    derived = {name.format(column): np.round(shares[:, i], 2) for i, column in enumerate(columns)}
+    return pd.concat([df, pd.DataFrame(derived, index=df.index)], axis=1)
@@ -1,15 +1,11 @@
 import pandas as pd
 
+from common.geometry import add_density
+from common.reshape import CHUNK_ROWS, melt_chunks, write_long
+
 INPUT = "kartendarstellung.csv"
 OUTPUT = "kartendarstellung_long.csv"
 
-df = pd.read_csv(INPUT)
-
-df = df.rename(columns={
-    "Kommune": "gemeinde",
-    "Schlüssel": "gemeinde_schluessel",
-})
-
 vars8 = [
     "Anzahl Bevölkerung je Kommune",
     "Fläche der Kommune",
@@ -21,24 +17,29 @@ vars8 = [
     "Altenquotient",
 ]
 
-df["iso"] = ""
 
-long_df = df.melt(
+def prepare(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.rename(columns={
+        "Kommune": "gemeinde",
+        "Schlüssel": "gemeinde_schluessel",
+    })
+
+    # Area and density from the Gemeinde polygons; rows without a polygon keep their values
+    df = add_density(df, ["Anzahl Bevölkerung je Kommune"], area_column="Fläche der Kommune", name="Bevölkerungsdichte").fillna(df)
+
+    df["iso"] = ""
+    return df
+
+
+# Melted chunk by chunk and streamed to the output, so memory does not grow with the input
+chunks = (prepare(chunk) for chunk in pd.read_csv(INPUT, chunksize=CHUNK_ROWS))
+long_chunks = melt_chunks(
+    chunks,
     id_vars=["gemeinde", "gemeinde_schluessel", "iso", "jahr", "contour"],
     value_vars=vars8,
     var_name="variable",
     value_name="value",
 )
 
-long_df = long_df[[
-    "gemeinde",
-    "gemeinde_schluessel",
-    "iso",
-    "jahr",
-    "contour",
-    "variable",
-    "value",
-]]
-
-long_df.to_csv(OUTPUT, index=False)
-print(f"Saved: {OUTPUT}, rows: {len(long_df)}")
+rows = write_long(long_chunks, OUTPUT)
+print(f"Saved: {OUTPUT}, rows: {rows}")
@@ -1,9 +1,16 @@
 import pandas as pd
 import os
-import datetime
 
+from common.age_bands import DEFAULT_BOUNDS, band_labels, requested_bounds
+from common.age_matrix import AgeMatrix, load_or_build
 from common.gebiet_schluessel import gebiet_schluessel
-from common.mapping import get_gemeinde_from_gebiet, track_undetected_gebiete, log_missing_gebiete, get_gemeinde_by_schluessel
+from common.geometry import add_density
+from common.mapping import get_gemeinde_from_gebiet, track_undetected_gebiete, log_missing_gebiete, get_gemeinde_by_schluessel, lookup_gebiet
+from common.incremental import incremental_requested
+from common.memo import memoize
+from common.instrumentation import stage, run_instrumented
+from common.output import write_result
+from common.schema import apply_schema, report_memory
 
 FILENAME = "geburtsjahrgangsstatistik"
 INPUT_DIR = "data"
@@ -13,48 +20,63 @@ SHEET_NAME = "dadigesamt"
 INPUT_FILENAME = os.path.join(INPUT_DIR, FILENAME + ".xlsx")
 OUTPUT_FILENAME = os.path.join(OUTPUT_DIR, FILENAME + ".csv")
 
-def parse_excel_for_year(current_year):
-    xls = pd.ExcelFile(INPUT_FILENAME)
-    df = pd.read_excel(xls, sheet_name=SHEET_NAME, dtype=str)
-    df = df.dropna(subset=["Gebiet", "Jahrgang"])
-    df["Gebiet"] = df["Gebiet"].str.strip()
-    df["Jahrgang"] = pd.to_numeric(df["Jahrgang"], errors='coerce')
-    df = df.dropna(subset=["Jahrgang"])
-    df["Jahrgang"] = df["Jahrgang"].astype(int)
-    df = df[df["Jahrgang"] <= current_year]
-
-    df["Gemeinde"] = df["Gebiet"].map(get_gemeinde_from_gebiet)
-    all_gebieten = df["Gebiet"].dropna().unique().tolist()
-    undetected_gebiete = track_undetected_gebiete(all_gebieten)
-    log_missing_gebiete(undetected_gebiete)
+YEARS = [2019, 2020, 2021, 2022, 2023, 2024]
+# Age groups of the quotients: junge 0 - 20, mittleren 21 - 64, alte 65+
+GROUP_LABELS = ["junge", "mittleren", "alte"]
+
+@memoize(files=[INPUT_FILENAME])
+def read_birth_years():
+    """Reads the dadigesamt sheet once and maps every Gebiet to its Gemeinde."""
+    with stage("extract") as s:
+        df = pd.read_excel(INPUT_FILENAME, sheet_name=SHEET_NAME, dtype=str)
+        df = df.dropna(subset=["Gebiet", "Jahrgang"])
+        df["Gebiet"] = df["Gebiet"].str.strip()
+        df["Jahrgang"] = pd.to_numeric(df["Jahrgang"], errors='coerce')
+        df = df.dropna(subset=["Jahrgang"])
+        df["Jahrgang"] = df["Jahrgang"].astype(int)
+        # Gebiet as categorical: the mapping below runs once per distinct Gebiet
+        df = apply_schema(df, "geburtsjahrgangsstatistik")
+        s.rows = len(df)
+
+    with stage("map", rows=len(df)):
+        df["Gemeinde"] = df["Gebiet"].map(get_gemeinde_from_gebiet)
+        all_gebieten = df["Gebiet"].dropna().unique().tolist()
+        undetected_gebiete = track_undetected_gebiete(all_gebieten)
+        log_missing_gebiete(undetected_gebiete)
+        # Unmapped Gebiete keep their name as Gemeinde; like ignored ones they are not
+        # part of any Gemeinde total
+        mapped = [g for g in all_gebieten if lookup_gebiet(g) is not None]
+        df = df[df["Gebiet"].isin(mapped)]
 
     if "EW gesamt" not in df.columns:
-        return pd.DataFrame()
-
+        raise ValueError(f"Column 'EW gesamt' missing in {INPUT_FILENAME}")
     df["EW gesamt"] = pd.to_numeric(df["EW gesamt"], errors='coerce').fillna(0).astype(int)
+    return apply_schema(df, "geburtsjahrgangsstatistik")
+
 
-    def classify_group(year):
-        age = current_year - year
-        if age < 21:
-            return "junge"
-        elif age > 64:
-            return "alte"
-        return "mittleren"
+def build_age_matrix(source_sha256):
+    df = read_birth_years()
+    with stage("matrix", rows=len(df)):
+        return AgeMatrix.from_birth_years(df, YEARS, source_sha256=source_sha256)
 
-    df["gruppe"] = df["Jahrgang"].apply(classify_group)
-    df = df[df["Gemeinde"].notnull() & (df["Gemeinde"] != "")]
 
-    grouped = df.groupby(["Gemeinde", "gruppe"])["EW gesamt"].sum().unstack(fill_value=0).reset_index()
-    grouped["gemeinde_schluessel"] = grouped["Gemeinde"].map(lambda x: gebiet_schluessel.get(x, ("", ""))[0])
+def aggregate_years(matrix):
+    """
+    Age groups per Gemeinde for all years at once, read from the prefix sums of the
+    age matrix (two lookups per band). Bands requested with --age-bands=... are added
+    as extra columns.
+    """
+    grouped = matrix.band_table(DEFAULT_BOUNDS, labels=GROUP_LABELS)
+    grouped["gemeinde_schluessel"] = grouped["Gemeinde"].map(lambda x: gebiet_schluessel.get(x, (None, None))[0]).astype("Int64")
     grouped["gemeinde"] = grouped["gemeinde_schluessel"].apply(get_gemeinde_by_schluessel)
 
     grouped["junge_quotient"] = (grouped["junge"] / (grouped["mittleren"] + grouped["junge"] + grouped["alte"])).replace([float("inf"), -float("inf")], 0) * 100
     grouped["alte_quotient"] = (grouped["alte"] / (grouped["mittleren"] + grouped["junge"] + grouped["alte"])).replace([float("inf"), -float("inf")], 0) * 100
-    grouped["junge_quotient"] = grouped["junge_quotient"].round(2).astype(str)
-    grouped["alte_quotient"] = grouped["alte_quotient"].round(2).astype(str)
+    # Quotients stay numeric so that typed outputs (Parquet) keep them as floats
+    grouped["junge_quotient"] = grouped["junge_quotient"].round(2)
+    grouped["alte_quotient"] = grouped["alte_quotient"].round(2)
 
     grouped = grouped[~grouped["gemeinde"].isin(["Ausgewählte Gebiete zusammengefasst", "Sanierungsgebiet"])]
-    grouped["jahr"] = current_year
 
     final_columns = [
         "gemeinde",
@@ -66,7 +88,12 @@ def parse_excel_for_year(current_year):
         "alte_quotient",
         "jahr"
     ]
-    return grouped[final_columns]
+    bounds = requested_bounds()
+    if bounds:
+        extra = matrix.band_table(bounds)
+        grouped = grouped.merge(extra, on=["jahr", "Gemeinde"], how="left")
+        final_columns += band_labels(bounds)
+    return grouped[final_columns].reset_index(drop=True)
 
 
 def add_summary_row(df):
@@ -76,18 +103,20 @@ def add_summary_row(df):
         junge_sum = subset["junge"].sum()
         alte_sum = subset["alte"].sum()
         mittleren_sum = subset["mittleren"].sum()
-        junge_quot = f"{round((junge_sum / (mittleren_sum + junge_sum + alte_sum)) * 100, 2)}" if (mittleren_sum + junge_sum + alte_sum) else "0"
-        alte_quot = f"{round((alte_sum / (mittleren_sum + junge_sum + alte_sum)) * 100, 2)}" if (mittleren_sum + junge_sum + alte_sum) else "0"
+        junge_quot = round((junge_sum / (mittleren_sum + junge_sum + alte_sum)) * 100, 2) if (mittleren_sum + junge_sum + alte_sum) else 0.0
+        alte_quot = round((alte_sum / (mittleren_sum + junge_sum + alte_sum)) * 100, 2) if (mittleren_sum + junge_sum + alte_sum) else 0.0
 
         summary_rows.append({
             "gemeinde": "Wetteraukreis",
-            "gemeinde_schluessel": "6440",
+            "gemeinde_schluessel": 6440,
             "junge": junge_sum,
             "alte": alte_sum,
             "mittleren": mittleren_sum,
             "junge_quotient": junge_quot,
             "alte_quotient": alte_quot,
-            "jahr": year
+            "jahr": year,
+            # Additional --age-bands columns
+            **{c: subset[c].sum() for c in df.columns[df.columns.get_loc("jahr") + 1:]}
         })
 
     return pd.concat([df, pd.DataFrame(summary_rows)], ignore_index=True)
@@ -111,22 +140,29 @@ def parse_excel():
     - Load Excel file and clean data
     - Map Gebiet (area) to standardized Gemeinde (municipality)
     - Track unmapped Gebiet entries and log them
-    - Classify each record into age groups (young, middle, old)
-    - Group and sum total population by Gemeinde and age group
+    - Build the Gemeinde x year x Jahrgang prefix-sum matrix (result/.age_matrix/)
+    - Read the age groups (young, middle, old) per year and Gemeinde from it
+    - Add area and population density per Gemeinde (common/geometry.py)
     - Generate output Excel file with key demographic indicators
     """
-    YEARS = [2019, 2020, 2021, 2022, 2023, 2024]
+    # With --incremental the stored age matrix is reused while the sheet is unchanged
+    matrix = load_or_build(INPUT_FILENAME, FILENAME, YEARS, build_age_matrix, reuse=incremental_requested())
 
-    results = [parse_excel_for_year(year) for year in YEARS]
-    print(results[0])
-    combined = pd.concat(results, ignore_index=True)
+    with stage("aggregate"):
+        combined = aggregate_years(matrix)
     print(combined)
-    with_sum = add_summary_row(combined)
-    final = reorder_with_sum_after_each_year(with_sum)
+    with stage("summary"):
+        with_sum = add_summary_row(combined)
+        final = reorder_with_sum_after_each_year(with_sum)
+        # Area (km²) and population density from the Gemeinde polygons
+        final = add_density(apply_schema(final, "geburtsjahrgangsstatistik"), GROUP_LABELS)
+
+    report_memory(final, "geburtsjahrgangsstatistik")
 
-    final.to_csv(OUTPUT_FILENAME, index=False)
-    print(f"Result saved to {OUTPUT_FILENAME}")
+    with stage("write", rows=len(final)):
+        written = write_result(final, OUTPUT_FILENAME)
+    print(f"Result saved to {', '.join(written)}")
 
 
 if __name__ == "__main__":
-    parse_excel()
+    run_instrumented(parse_excel, "geburtsjahrgangsstatistik")
@@ -2,12 +2,18 @@ import pandas as pd
 import os
 import re
 
+from common.instrumentation import stage, run_instrumented
+from common.memo import memoize
+from common.output import write_result
+from common.schema import apply_schema, concat_tables, report_memory
+
 INPUT_DIR = "data/arbeitsortbeschäftigung"
 OUTPUT_DIR = "result"
 OUTPUT_FILENAME = "gender_distribution.xlsx"
 
 GENDER_CATEGORIES = ["Männer", "Frauen"]
 
+@memoize
 def extract_gender_data(file_path: str) -> pd.DataFrame:
     df = pd.read_excel(file_path, sheet_name="Daten", header=None)
 
@@ -40,7 +46,7 @@ def extract_gender_data(file_path: str) -> pd.DataFrame:
                 }
                 rows.append(row)
 
-    return pd.DataFrame(rows)
+    return apply_schema(pd.DataFrame(rows), "gender_distribution")
 
 def main():
     os.makedirs(OUTPUT_DIR, exist_ok=True)
@@ -51,28 +57,33 @@ def main():
         if f.endswith(".xlsx") and f.startswith("Arbeitsmarkt-kommunal")
     ]
 
-    result_frames = []
-    for file in all_files:
-        df = extract_gender_data(file)
-        result_frames.append(df)
+    with stage("extract") as s:
+        result_frames = []
+        for file in all_files:
+            df = extract_gender_data(file)
+            result_frames.append(df)
 
-    combined_df = pd.concat(result_frames, ignore_index=True)
+        combined_df = concat_tables(result_frames, "gender_distribution")
+        s.rows = len(combined_df)
 
-    sum_df = (
-        combined_df.groupby(["Jahr", "Geschlecht"])
-        .agg({"Anzahl": "sum"})
-        .reset_index()
-    )
-    sum_df["Gemeinde"] = "Wetteraukreis"
+    with stage("aggregate"):
+        sum_df = (
+            combined_df.groupby(["Jahr", "Geschlecht"], observed=True)
+            .agg({"Anzahl": "sum"})
+            .reset_index()
+        )
+        sum_df["Gemeinde"] = "Wetteraukreis"
 
-    final_df = pd.concat([combined_df, sum_df], ignore_index=True)
+        final_df = concat_tables([combined_df, sum_df], "gender_distribution")
 
-    final_df = final_df[["Jahr", "Gemeinde", "Geschlecht", "Anzahl"]]
+        final_df = final_df[["Jahr", "Gemeinde", "Geschlecht", "Anzahl"]]
 
     output_path = os.path.join(OUTPUT_DIR, OUTPUT_FILENAME)
-    final_df.to_excel(output_path, index=False)
+    report_memory(final_df, "gender_distribution")
+    with stage("write", rows=len(final_df)):
+        written = write_result(final_df, output_path, db_keys=["Geschlecht"])
 
-    print(f"Result saved to {output_path}")
+    print(f"Result saved to {', '.join(written)}")
 
 if __name__ == "__main__":
-    main()
+    run_instrumented(main, "gender_distribution")
@@ -13,6 +13,13 @@ import pandas as pd
 import math
 import re
 
+from common.incremental import process_partitions
+from common.instrumentation import stage, timed, run_instrumented
+from common.memo import memoize
+from common.output import write_result
+from common.population import add_per_1000
+from common.schema import apply_schema, concat_tables, report_memory
+
 # --- Pfade / Einstellungen
 BASE_DIR = Path("data/kriminalstatistik")   # Ordner mit xlsx
 SHEET_NAME = "T01_Kreise"                   # Blattname
@@ -94,6 +101,8 @@ def to_number(x):
     except Exception:
         return pd.NA
 
+@timed("process_file")
+@memoize
 def process_file(xlsx_path: Path) -> pd.DataFrame:
     """Ein Jahr verarbeiten und DataFrame zurückgeben."""
     print(f"\n[DEBUG] === Datei starten: {xlsx_path.name} ===")
@@ -188,7 +197,7 @@ def process_file(xlsx_path: Path) -> pd.DataFrame:
     print("[DEBUG] Kopf:")
     print(df_sel.head(3))
 
-    return df_sel
+    return apply_schema(df_sel, "kriminalstatistik")
 
 def export_datenkatalog(path: Path):
     """Schreibe Mapping (Original -> neu) als CSV."""
@@ -207,11 +216,11 @@ def main():
     if not files:
         raise SystemExit("Keine Dateien gefunden.")
 
-    frames = []
-    for p in files:
-        frames.append(process_file(p))
-
-    df_all = pd.concat(frames, ignore_index=True)
+    # Mit --incremental nur neue/geänderte Jahresdateien neu lesen
+    with stage("extract") as s:
+        frames = process_partitions("kriminalstatistik", files, process_file)
+        df_all = concat_tables(frames, "kriminalstatistik")
+        s.rows = len(df_all)
 
     # Reihenfolge sichern
     missing_final = [c for c in FINAL_ORDER if c not in df_all.columns]
@@ -219,6 +228,9 @@ def main():
         raise ValueError(f"Fehlende Zielspalten: {missing_final}")
     df_all = df_all[FINAL_ORDER]
 
+    # Fälle und Tatverdächtige je 1.000 Einwohner (Bevölkerung aus geburtsjahrgangsstatistik)
+    df_all = add_per_1000(df_all, ["faelle", "tatverdaechtige_insgesamt"])
+
     # Leichte Checks
     def in_0_100(series):
         return series.dropna().between(0, 100).all()
@@ -232,11 +244,14 @@ def main():
         print(f"[DEBUG] Check 0..100 für {pc}:", in_0_100(df_all[pc]))
 
     # CSV schreiben
-    df_all.to_csv(OUT_CSV, sep=";", index=False, encoding="utf-8")
-    print(f"[DEBUG] CSV gespeichert: {OUT_CSV}")
+    report_memory(df_all, "kriminalstatistik")
+    with stage("write", rows=len(df_all)):
+        written = write_result(df_all, str(OUT_CSV), csv_options={"sep": ";", "encoding": "utf-8"},
+                               db_keys=["schluessel"])
+        print(f"[DEBUG] Gespeichert: {', '.join(written)}")
 
-    # Datenkatalog schreiben (Header-Übersetzung)
-    export_datenkatalog(OUT_DICT)
+        # Datenkatalog schreiben (Header-Übersetzung)
+        export_datenkatalog(OUT_DICT)
 
 if __name__ == "__main__":
-    main()
+    run_instrumented(main, "kriminalstatistik")
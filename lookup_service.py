@@ -0,0 +1,49 @@
+"""
+Local lookup service for Gemeinde resolution, Gemeinde metadata and cached coordinates.
+
+Serves the in-memory indexes of common/mapping.py, the Gemeinde geometry and
+geocode_cache.json over HTTP, so tools that cannot import common/mapping.py resolve
+names the same way the scripts do. Endpoints and response format: see common/lookup.py.
+
+Usage (from the data root, like the scripts):
+    python3 lookup_service.py [--host 127.0.0.1] [--port 8765] [--socket PATH] [--verbose]
+
+    curl 'http://127.0.0.1:8765/resolve?name=Friedberg&name=Bad%20Nauheim,%20Stadt'
+    curl -d '{"schluessel": [6440008, "06440002"]}' http://127.0.0.1:8765/gemeinden
+    curl --unix-socket /tmp/gemeinden.sock -d '["Im Bachmichel 21, 63654 Büdingen"]' http://localhost/geocode
+"""
+
+import argparse
+import os
+import signal
+import sys
+
+from common.lookup import GEOCODE_CACHE, LookupIndex, make_server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve Gemeinde lookups and cached coordinates over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port (default: 8765)")
+    parser.add_argument("--socket", help="listen on this Unix socket instead of TCP")
+    parser.add_argument("--geocode-cache", default=GEOCODE_CACHE, help="geocode cache file (default: geocode_cache.json)")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    index = LookupIndex(args.geocode_cache)
+    server = make_server(index, args.host, args.port, args.socket, args.verbose)
+    where = args.socket or f"http://{args.host}:{server.server_address[1]}"
+    print(f"[lookup] {len(index.metadata)} Gemeinden, {len(index.geocodes)} cached address(es), listening on {where}")
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))   # clean up below also when stopped by a service manager
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("[lookup] stopped")
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.remove(args.socket)
+
+
+if __name__ == "__main__":
+    main()
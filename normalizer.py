@@ -1,9 +1,21 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import sys
+import argparse
 import csv
+import functools
+import glob
+import hashlib
+import io
+import json
 import os
+import re
+import sys
+from multiprocessing import Pool
+
+import numpy as np
+
+from common.incremental import file_sha256
 
 CHAR_MAP = {
     "Ä": "AE", "Ö": "OE", "Ü": "UE",
@@ -13,34 +25,498 @@ CHAR_MAP = {
     "§": "#",
 }
 
-def normalize_value(value):
+# Input is processed in chunks of about this many bytes, cut at line ends
+CHUNK_SIZE = 512 * 1024
+# Content hashes of the last normalization, kept in the output directory
+MANIFEST_NAME = ".normalizer_manifest.json"
+
+# Every field is stripped, CHAR_MAP is applied and every other non-ASCII character
+# becomes "*" (see normalize_value); rows are written the way csv.writer writes them.
+#
+# Instead of looping over characters, lines without quotes are processed in blocks
+# as UTF-8 bytes with numpy:
+# - mapped characters whose replacement is not longer than their UTF-8 encoding
+#   (umlauts, ß, €, §) are overwritten in place at the positions of the non-ASCII
+#   lead bytes, every other lead byte becomes "*" and continuation bytes are dropped
+# - runs of spaces next to ';' or a line end are dropped (field trimming)
+# - the remaining mappings (e.g. "$" -> "USD") are plain bytes.replace calls
+# Records with quotes go through the csv module; a placeholder line keeps their place
+# in the block. Blocks the fast path cannot handle exactly (invalid UTF-8, non-ASCII
+# whitespace, blank lines) go through the csv module as a whole.
+
+SEMICOLON, NEWLINE = ord(";"), ord("\n")
+QUOTED_PLACEHOLDER = b"\x00normalizer:quoted\x00"
+# Whitespace that str.strip() removes: ASCII (besides the line break) and non-ASCII
+ASCII_SPACE = np.array([chr(c).isspace() and c != NEWLINE for c in range(0x100)])
+NOT_CONTROL_SPACE_BYTES = bytes(c for c in range(0x100) if not ASCII_SPACE[c] or c == ord(" "))
+# Characters that decide field boundaries, trimming and quoting
+STRUCTURAL = ';"\r\n'
+
+
+def _replacement_tables(in_place: dict) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Replacement bytes and lengths per row, and the row of every codepoint of the Basic
+    Multilingual Plane (plus one slot for 4-byte characters). The last row is "*";
+    non-ASCII whitespace has row -1.
+    """
+    width = max([len(v) for v in in_place.values()] + [1])
+    replacement = np.zeros((len(in_place) + 1, width), dtype=np.uint8)
+    length = np.ones(len(in_place) + 1, dtype=np.int64)
+    rows = np.full(0x10001, len(in_place), dtype=np.int64)
+    for row, (codepoint, value) in enumerate(in_place.items()):
+        replacement[row, :len(value)] = list(value)
+        length[row] = len(value)
+        rows[codepoint] = row
+    replacement[-1, 0] = ord("*")
+    rows[[c for c in range(0x80, 0x10000) if chr(c).isspace()]] = -1
+    return replacement, length, rows
+
+
+class CharTables:
+    """
+    Lookup tables of one character map. The byte-level fast path is only used if the
+    map cannot change field boundaries or trimming (`fast`): keys and replacements
+    without whitespace, ';', quotes or line breaks, replacements non-empty ASCII.
+    Other maps are applied row by row through the csv module.
+    """
+
+    def __init__(self, char_map: dict):
+        self.char_map = dict(char_map)
+        self.translation = str.maketrans(self.char_map)
+        self.ascii_translation = str.maketrans({k: v for k, v in self.char_map.items() if k.isascii()})
+        # Unmapped non-ASCII characters become "*" before the map is applied,
+        # so non-ASCII replacements are kept as they are
+        mapped = "".join(re.escape(k) for k in self.char_map if not k.isascii())
+        self.non_ascii_re = re.compile(f"[^\\x00-\\x7f{mapped}]")
+
+        self.fast = all(
+            value and value.isascii() and value.isprintable() and " " not in value
+            and not key.isspace() and not any(c in STRUCTURAL for c in key + value)
+            for key, value in self.char_map.items()
+        )
+        in_place = {
+            ord(k): v.encode("ascii") for k, v in self.char_map.items()
+            if self.fast and 0x80 <= ord(k) < 0x10000 and len(v) <= len(k.encode("utf-8"))
+        }
+        self.replace = [(k.encode("utf-8"), v.encode("utf-8")) for k, v in self.char_map.items() if ord(k) not in in_place]
+        self.replacement_bytes, self.replacement_length, self.codepoint_row = _replacement_tables(in_place)
+
+
+DEFAULT_TABLES = CharTables(CHAR_MAP)
+
+
+@functools.lru_cache(maxsize=8)
+def tables_for(items: tuple) -> CharTables:
+    """Tables of a char map given as sorted items (workers get the items, not the tables)."""
+    return CharTables(dict(items))
+
+
+def map_items(char_map: dict | None) -> tuple:
+    return tuple(sorted((char_map if char_map is not None else CHAR_MAP).items()))
+
+
+def load_char_map(path: str) -> dict:
+    """
+    Reads a JSON object {"character": "replacement"}; its entries extend or override CHAR_MAP
+    (map a character to itself to keep it, e.g. {"$": "$"}).
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        loaded = json.load(f)
+    if not isinstance(loaded, dict):
+        raise ValueError(f"{path}: character map must be a JSON object")
+    for key, value in loaded.items():
+        if len(key) != 1 or not isinstance(value, str):
+            raise ValueError(f"{path}: invalid entry {key!r}: {value!r} (single character -> string expected)")
+    return {**CHAR_MAP, **loaded}
+
+
+def normalize_value(value, tables: CharTables = DEFAULT_TABLES):
     if value is None:
         return ""
     value = value.strip()
     if not value:
         return ""
-    result = []
-    for ch in value:
-        if ch in CHAR_MAP:
-            result.append(CHAR_MAP[ch])
-        elif ord(ch) < 128:
-            result.append(ch)
+    if value.isascii():
+        return value.translate(tables.ascii_translation)
+    return tables.non_ascii_re.sub("*", value).translate(tables.translation)
+
+
+def _normalize_csv(data: bytes, tables: CharTables = DEFAULT_TABLES) -> bytes:
+    # Reference path: csv module and normalize_value, row by row
+    out = io.StringIO()
+    writer = csv.writer(out, delimiter=";")
+    reader = csv.reader(io.StringIO(data.decode("utf-8", errors="replace") + "\n"), delimiter=";")
+    writer.writerows([normalize_value(v, tables) for v in row] for row in reader)
+    return out.getvalue().encode("utf-8")
+
+
+def _decode_leads(arr: np.ndarray, lead: np.ndarray, continuation: np.ndarray) -> np.ndarray | None:
+    """
+    Codepoints of the characters starting at the `lead` byte positions (-1 for 4-byte
+    characters), or None if the bytes are not valid UTF-8.
+    """
+    last = len(arr) - 1
+    b0 = arr[lead].astype(np.int32)
+    b1, b2, b3 = (arr[np.minimum(lead + k, last)].astype(np.int32) for k in (1, 2, 3))
+    size = np.where(b0 < 0xE0, 2, np.where(b0 < 0xF0, 3, 4))
+
+    # Every lead byte is followed by exactly its continuation bytes, and there are no others
+    valid = (np.count_nonzero(continuation) == (size - 1).sum()) and (lead + size - 1 <= last).all()
+    valid = valid and (continuation[np.minimum(lead + 1, last)]).all()
+    valid = valid and (continuation[np.minimum(lead + 2, last)] | (size < 3)).all()
+    valid = valid and (continuation[np.minimum(lead + 3, last)] | (size < 4)).all()
+    # No overlong forms, surrogates or codepoints above U+10FFFF
+    valid = valid and not (
+        (b0 < 0xC2) | (b0 > 0xF4)
+        | ((b0 == 0xE0) & (b1 < 0xA0)) | ((b0 == 0xED) & (b1 >= 0xA0))
+        | ((b0 == 0xF0) & (b1 < 0x90)) | ((b0 == 0xF4) & (b1 >= 0x90))
+    ).any()
+    if not valid:
+        return None
+
+    b1, b2 = b1 & 0x3F, b2 & 0x3F
+    return np.where(size == 2, ((b0 & 0x1F) << 6) | b1, np.where(size == 3, ((b0 & 0x0F) << 12) | (b1 << 6) | b2, -1))
+
+
+def _normalize_plain(data: bytes, tables: CharTables) -> bytes | None:
+    """
+    Lines without quotes: each line is its normalized fields joined by ';'.
+    Returns None if the block needs the csv module.
+    """
+    for key, value in tables.replace:
+        if key in data:
+            data = data.replace(key, value)
+
+    arr = np.frombuffer(data, dtype=np.uint8)
+    keep = None
+    if not data.isascii():
+        lead = np.flatnonzero(arr >= 0xC0)
+        continuation = (arr & 0xC0) == 0x80
+        codepoints = _decode_leads(arr, lead, continuation)
+        if codepoints is None:
+            return None
+        rows = tables.codepoint_row[codepoints]
+        if (rows < 0).any():
+            return None
+
+        arr = arr.copy()
+        keep = ~continuation
+        replacement, length = tables.replacement_bytes, tables.replacement_length
+        arr[lead] = replacement[rows, 0]
+        for offset in range(1, replacement.shape[1]):
+            positions = lead[length[rows] > offset] + offset
+            arr[positions] = replacement[rows[length[rows] > offset], offset]
+            keep[positions] = True
+
+    # Field trimming: whitespace runs next to ';' or a line break (or the block edges)
+    if data.translate(None, NOT_CONTROL_SPACE_BYTES):
+        space = ASCII_SPACE[arr]
+    else:
+        space = arr == ord(" ")
+    boundary = (arr == SEMICOLON) | (arr == NEWLINE)
+    near = np.ones(len(arr), dtype=bool)
+    near[1:] = boundary[:-1]
+    near[:-1] |= boundary[1:]
+    near[:1] = near[-1:] = True
+    seeds = np.flatnonzero(space & near)
+    if len(seeds):
+        last = len(arr) - 1
+        starts, ends = seeds.copy(), seeds.copy()
+        while True:
+            extend = space[np.maximum(starts - 1, 0)] & (starts > 0)
+            if not extend.any():
+                break
+            starts[extend] -= 1
+        while True:
+            extend = space[np.minimum(ends + 1, last)] & (ends < last)
+            if not extend.any():
+                break
+            ends[extend] += 1
+        starts, first = np.unique(starts, return_index=True)
+        ends = ends[first]
+        before = np.where(starts > 0, arr[np.maximum(starts - 1, 0)], NEWLINE)
+        after = np.where(ends < last, arr[np.minimum(ends + 1, last)], NEWLINE)
+        if ((before == NEWLINE) & (after == NEWLINE)).any():
+            # csv.writer writes a blank line as ""
+            return None
+        lengths = ends - starts + 1
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        if keep is None:
+            keep = np.ones(len(arr), dtype=bool)
+        keep[np.repeat(starts, lengths) + offsets] = False
+
+    if keep is not None:
+        data = arr[keep].tobytes()
+    return data.replace(b"\n", b"\r\n") + b"\r\n"
+
+
+def _normalize_lines(data: bytes, tables: CharTables) -> bytes:
+    result = _normalize_plain(data, tables)
+    return result if result is not None else _normalize_csv(data, tables)
+
+
+def normalize_bytes(data: bytes, tables: CharTables = DEFAULT_TABLES) -> bytes:
+    """
+    Normalizes a block of complete ';'-separated lines (UTF-8) and returns them as
+    csv.writer writes them: CRLF line ends, minimal quoting, fields like `normalize_value`.
+    """
+    if not data:
+        return b""
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    if data.endswith(b"\n"):
+        data = data[:-1]
+
+    if not tables.fast:
+        return _normalize_csv(data, tables)
+    if b'"' not in data:
+        return _normalize_lines(data, tables)
+    if QUOTED_PLACEHOLDER in data:
+        return _normalize_csv(data, tables)
+
+    # Records with quotes are normalized by the csv module (one reader and writer for
+    # the block) and replaced by a placeholder line, the rest goes through the fast path.
+    end = len(data)
+    pos = 0
+
+    def lines():
+        nonlocal pos
+        while pos <= end:
+            newline = data.find(b"\n", pos)
+            if newline < 0:
+                newline = end
+            line = data[pos:newline + 1].decode("utf-8", errors="replace")
+            pos = newline + 1
+            yield line
+
+    out = io.StringIO()
+    writer = csv.writer(out, delimiter=";")
+    reader = csv.reader(lines(), delimiter=";")
+    pieces = []
+    quoted = []
+    plain_start = 0
+    while True:
+        quote = data.find(b'"', plain_start)
+        if quote < 0:
+            break
+        pos = data.rfind(b"\n", plain_start, quote) + 1 or plain_start
+        pieces += [data[plain_start:pos], QUOTED_PLACEHOLDER]
+        offset = out.tell()
+        # One record may span lines (quoted line breaks); following lines with quotes are taken along
+        while True:
+            writer.writerow([normalize_value(v, tables) for v in next(reader)])
+            newline = data.find(b"\n", pos)
+            if pos > end or b'"' not in data[pos:newline if newline >= 0 else end]:
+                break
+        quoted.append((offset, out.tell()))
+        plain_start = pos - 1
+        if pos > end:
+            break
+    pieces.append(data[plain_start:])
+
+    result = _normalize_plain(b"".join(pieces), tables)
+    if result is None:
+        return _normalize_csv(data, tables)
+    written = out.getvalue().encode("ascii")
+    parts = result.split(QUOTED_PLACEHOLDER + b"\r\n")
+    records = [written[start:stop] for start, stop in quoted] + [b""]
+    return b"".join(part for pair in zip(parts, records) for part in pair)
+
+
+def record_end(data: bytes) -> tuple[int, int]:
+    """
+    Position after the last line break in `data` that ends a record, and the start of a
+    quoted field still open at the end of `data` (-1 if none). `data` starts at a record
+    start. Quotes follow the rules of csv.reader: a quote opens a quoted field only at
+    the start of a field, "" inside it is a quote, any other quote (e.g. `5" lang`) is
+    an ordinary character.
+    """
+    cut, outside_from, pos = 0, 0, 0
+    while True:
+        quote = data.find(b'"', pos)
+        if quote < 0:
+            newline = data.rfind(b"\n", outside_from)
+            return (newline + 1 if newline >= 0 else cut), -1
+        if quote > 0 and data[quote - 1] not in b";\r\n":
+            pos = quote + 1
+            continue
+        newline = data.rfind(b"\n", outside_from, quote)
+        if newline >= 0:
+            cut = newline + 1
+        pos = quote + 1
+        while True:
+            close = data.find(b'"', pos)
+            # A quote at the very end may still be the first half of ""
+            if close < 0 or close + 1 == len(data):
+                return cut, quote
+            if data[close + 1] != ord('"'):
+                break
+            pos = close + 2
+        pos = outside_from = close + 1
+
+
+def iter_chunks(path: str, chunk_size: int = CHUNK_SIZE):
+    """
+    Yields (start, end) byte ranges of about `chunk_size` that end at a record end (a
+    line break outside of quoted fields), so every range can be normalized on its own.
+    A quoted field that stays open for more than csv.field_size_limit() bytes is an
+    error, as it is for the csv module, so memory stays bounded.
+    """
+    limit = csv.field_size_limit()
+    with open(path, "rb") as f:
+        start = 0
+        pending = b""
+        while True:
+            block = f.read(chunk_size)
+            if not block:
+                if pending:
+                    yield start, start + len(pending)
+                break
+            pending += block
+            cut, open_quote = record_end(pending)
+            if cut == 0 and open_quote >= 0 and len(pending) - open_quote > limit + 2:
+                raise ValueError(f"{path}: quoted field at byte {start + open_quote} is not closed "
+                                 f"within the field size limit ({limit} bytes)")
+            if cut:
+                yield start, start + cut
+                start += cut
+                pending = pending[cut:]
+
+
+def normalize_file(input_path: str, output_path: str, chunk_size: int = CHUNK_SIZE, char_map: dict | None = None):
+    """
+    Streams `input_path` chunk by chunk into `output_path`; memory stays bounded by
+    the chunk size. The output is written to a temporary file and renamed at the end,
+    so an interrupted run never leaves a partial file behind.
+    """
+    tables = tables_for(map_items(char_map))
+    temp_path = output_path + ".tmp"
+    with open(input_path, "rb") as infile, open(temp_path, "wb") as outfile:
+        for start, end in iter_chunks(input_path, chunk_size):
+            infile.seek(start)
+            outfile.write(normalize_bytes(infile.read(end - start), tables))
+    os.replace(temp_path, output_path)
+
+
+def expand_inputs(patterns: list[str]) -> list[str]:
+    """Files for the given paths, glob patterns and directories (*.csv), without duplicates."""
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = sorted(glob.glob(os.path.join(pattern, "*.csv")))
+        elif glob.has_magic(pattern):
+            matches = sorted(p for p in glob.glob(pattern, recursive=True) if os.path.isfile(p))
         else:
-            result.append("*")
-    return "".join(result)
+            matches = [pattern]
+        if not matches:
+            print(f"warning: no CSV files match '{pattern}'")
+        paths += matches
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("usage: python3 normalizer.py <input.csv>")
+    unique = list(dict.fromkeys(os.path.abspath(p) for p in paths))
+    missing = [p for p in unique if not os.path.isfile(p)]
+    if missing:
+        raise FileNotFoundError(f"Input file(s) not found: {missing}")
+    return unique
+
+
+def load_manifest(out_dir: str) -> dict:
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except json.JSONDecodeError:
+        print(f"warning: manifest corrupted, all files are normalized again: {path}")
+        return {}
+
+
+def save_manifest(out_dir: str, manifest: dict):
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+
+def _normalize_task(task) -> str:
+    input_path, output_path, chunk_size, items = task
+    normalize_file(input_path, output_path, chunk_size=chunk_size, char_map=dict(items))
+    return input_path
+
+
+def normalize_batch(inputs: list[str], out_dir: str, jobs: int = 1, chunk_size: int = CHUNK_SIZE,
+                    char_map: dict | None = None, force: bool = False) -> dict:
+    """
+    Normalizes every input file into `out_dir` (same file name). Files whose content and
+    character map are unchanged since the last run, and whose output still exists, are
+    skipped; the content hashes are kept in `<out_dir>/.normalizer_manifest.json`.
+
+    Several files are distributed over `jobs` processes, one file each; a single file is
+    normalized in this process (passing its chunks to workers and their output back
+    costs more than the workers save).
+    Returns {"normalized": [...], "unchanged": [...]} input paths.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    items = map_items(char_map)
+    map_hash = hashlib.sha256(json.dumps(items, ensure_ascii=False).encode("utf-8")).hexdigest()
+    manifest = load_manifest(out_dir)
+
+    outputs = {}
+    for input_path in inputs:
+        output_path = os.path.abspath(os.path.join(out_dir, os.path.basename(input_path)))
+        if output_path == input_path:
+            raise ValueError(f"Input file would be overwritten by its output: {input_path}")
+        if output_path in outputs.values():
+            raise ValueError(f"Several inputs would be written to {output_path}")
+        outputs[input_path] = output_path
+
+    result = {"normalized": [], "unchanged": []}
+    pending = {}
+    for input_path, output_path in outputs.items():
+        entry = {"sha256": file_sha256(input_path), "char_map": map_hash, "output": os.path.basename(output_path)}
+        if not force and manifest.get(input_path) == entry and os.path.exists(output_path):
+            result["unchanged"].append(input_path)
+        else:
+            pending[input_path] = entry
+
+    tasks = [(input_path, outputs[input_path], chunk_size, items) for input_path in pending]
+    if len(tasks) == 1 or jobs <= 1:
+        for input_path, output_path, _, _ in tasks:
+            normalize_file(input_path, output_path, chunk_size=chunk_size, char_map=char_map)
+            manifest[input_path] = pending[input_path]
+            result["normalized"].append(input_path)
+    elif tasks:
+        with Pool(min(jobs, len(tasks))) as pool:
+            for input_path in pool.imap_unordered(_normalize_task, tasks):
+                manifest[input_path] = pending[input_path]
+                result["normalized"].append(input_path)
+
+    save_manifest(out_dir, manifest)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replaces umlauts and other non-ASCII characters in ';'-separated CSV files.")
+    parser.add_argument("inputs", nargs="+", help="CSV files, glob patterns (quoted, e.g. 'result/*.csv') or directories")
+    parser.add_argument("-o", "--out-dir", default=os.path.dirname(os.path.abspath(__file__)),
+                        help="output directory (default: next to the script)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="worker processes for several files (default: 1)")
+    parser.add_argument("--char-map", help="JSON file with additional/overriding replacements, e.g. {\"é\": \"e\"}")
+    parser.add_argument("--force", action="store_true", help="normalize all files, even if unchanged")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="chunk size in bytes")
+    args = parser.parse_args()
+
+    try:
+        char_map = load_char_map(args.char_map) if args.char_map else None
+        inputs = expand_inputs(args.inputs)
+        result = normalize_batch(inputs, args.out_dir, jobs=args.jobs, chunk_size=args.chunk_size,
+                                 char_map=char_map, force=args.force)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}")
         sys.exit(1)
 
-    input_path = sys.argv[1]
-    base_name = os.path.basename(input_path)
-    output_path = os.path.join(os.path.dirname(__file__), base_name)
+    print(f"{len(result['normalized'])} file(s) normalized, {len(result['unchanged'])} unchanged -> {args.out_dir}")
 
-    with open(input_path, "r", encoding="utf-8", errors="replace") as infile, \
-         open(output_path, "w", newline='', encoding="utf-8") as outfile:
-        reader = csv.reader(infile, delimiter=';')
-        writer = csv.writer(outfile, delimiter=';')
-        for row in reader:
-            writer.writerow([normalize_value(v) for v in row])
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,20 @@
 #!/usr/bin/env python3
 
+import json
+import os
+import sys
+
 import pandas as pd
 from pathlib import Path
 
+from common.geometry import dissolve, gemeinde_geometry, signed_area
+from common.instrumentation import stage, run_instrumented
+from common.output import write_result
+from common.planungsraeume import AREA_COLUMNS, PLANUNGSRAEUME_FILE, clean_zustaendigkeiten, normalize_columns, read_zustaendigkeiten
+from common.simplify import detail_store, requested_detail
+
 
-INPUT_FILE = Path("data/WK_Planungsraeume.xlsx")
+INPUT_FILE = PLANUNGSRAEUME_FILE
 OPTIONS = {
     "wk-ASD-Regionen-matching.csv":      ["ASD-Region",       "Gemeinde", "Gemeindekennziffer", "PLZ", "GEOjson"],
     "wk-ASD-Bezirke-matching.csv":       ["ASD-Bezirk",       "Gemeinde", "Gemeindekennziffer", "PLZ", "GEOjson"],
@@ -12,117 +22,84 @@ OPTIONS = {
     "wk-Pflegestützpunkte-matching.csv": ["Pflegestützpunkt", "Gemeinde", "Gemeindekennziffer", "PLZ", "GEOjson"],
 }
 
-
-GEOJSON_MAP = {
-    "06440001": "[[9.007, 50.302], [9.0051, 50.3016], [9.0038, 50.2986], [9.0064, 50.2978], [9.0079, 50.2963], [9.0026, 50.2909], [9.0074, 50.2855], [9.0027, 50.2827], [8.9966, 50.2818], [8.9919, 50.2801], [8.9888, 50.2797], [8.9841, 50.2815], [8.9767, 50.2818], [8.9706, 50.2804], [8.9714, 50.2789], [8.9725, 50.2795], [8.9757, 50.2751], [8.9785, 50.2699], [8.9781, 50.2669], [8.9789, 50.2651], [8.9742, 50.2654], [8.9722, 50.2658], [8.9707, 50.2632], [8.9667, 50.2627], [8.9618, 50.2659], [8.9614, 50.2648], [8.9612, 50.2632], [8.9601, 50.2627], [8.9607, 50.2618], [8.9656, 50.2552], [8.9627, 50.2532], [8.9606, 50.2551], [8.9568, 50.2556], [8.9531, 50.2584], [8.9535, 50.2604], [8.9531, 50.2621], [8.9515, 50.263], [8.9495, 50.2638], [8.9477, 50.2648], [8.9433, 50.266], [8.9389, 50.2648], [8.9361, 50.2622], [8.932, 50.2621], [8.9279, 50.2632], [8.9267, 50.2634], [8.9262, 50.2645], [8.9241, 50.2656], [8.924, 50.2673], [8.9212, 50.2716], [8.9185, 50.2738], [8.9194, 50.2747], [8.9157, 50.2757], [8.915, 50.2753], [8.9114, 50.2766], [8.9046, 50.277], [8.9008, 50.2759], [8.9042, 50.2806], [8.9034, 50.2868], [8.901, 50.2896], [8.9078, 50.2923], [8.9062, 50.2944], [8.9074, 50.2963], [8.9055, 50.2973], [8.9019, 50.2981], [8.8991, 50.2986], [8.9097, 50.3046], [8.9111, 50.3028], [8.9174, 50.2993], [8.9184, 50.2991], [8.9209, 50.2999], [8.9219, 50.2992], [8.9252, 50.3005], [8.926, 50.3014], [8.9289, 50.3027], [8.9294, 50.3043], [8.9314, 50.3053], [8.9349, 50.3045], [8.9354, 50.3052], [8.9377, 50.307], [8.9446, 50.3108], [8.9525, 50.314], [8.9554, 50.3124], [8.958, 50.3104], [8.9603, 50.3127], [8.9622, 50.312], [8.9684, 50.3154], [8.977, 50.3136], [8.9833, 50.3131], [8.9897, 50.3108], [8.991, 50.312], [8.9926, 50.3116], [8.9921, 50.3106], [8.9901, 50.3078], [8.9893, 50.3061], [8.9961, 50.305], [8.9999, 50.3026], [9.002, 50.3029], [9.007, 50.302]]",
-    "06440002": "[[8.7678, 50.4077], [8.7706, 50.4038], [8.7726, 50.4025], [8.7736, 50.3998], [8.777, 50.3975], [8.7809, 50.3907], [8.7795, 50.3901], [8.7813, 50.3888], [8.7809, 50.3881], [8.7827, 50.3877], [8.785, 50.382], [8.7824, 50.3725], [8.791, 50.3719], [8.7904, 50.3662], [8.7929, 50.366], [8.7926, 50.3635], [8.7945, 50.3638], [8.7912, 50.359], [8.7867, 50.3581], [8.785, 50.36], [8.7786, 50.3561], [8.7812, 50.3561], [8.7812, 50.3547], [8.7789, 50.3545], [8.7797, 50.3518], [8.7787, 50.3509], [8.7769, 50.3501], [8.7752, 50.35], [8.7741, 50.3484], [8.7686, 50.3421], [8.7628, 50.3453], [8.7616, 50.3471], [8.7592, 50.3485], [8.7555, 50.347], [8.7553, 50.346], [8.7536, 50.3459], [8.7506, 50.3464], [8.7481, 50.3492], [8.7429, 50.348], [8.7443, 50.3455], [8.7358, 50.3462], [8.7334, 50.3469], [8.7323, 50.346], [8.7292, 50.3465], [8.723, 50.3487], [8.7211, 50.3489], [8.714, 50.3488], [8.714, 50.3502], [8.7099, 50.3508], [8.7099, 50.3541], [8.7111, 50.3574], [8.7121, 50.3597], [8.7141, 50.3622], [8.7156, 50.3636], [8.7172, 50.3642], [8.7177, 50.3655], [8.7125, 50.3663], [8.7119, 50.3667], [8.7117, 50.3682], [8.7124, 50.3728], [8.7106, 50.3757], [8.7121, 50.3763], [8.7115, 50.3783], [8.7119, 50.3799], [8.7112, 50.3871], [8.7149, 50.3873], [8.7145, 50.3907], [8.7157, 50.3905], [8.7174, 50.3932], [8.7175, 50.4028], [8.7193, 50.4029], [8.7208, 50.4031], [8.7219, 50.4019], [8.7402, 50.4073], [8.74, 50.4055], [8.7455, 50.406], [8.7474, 50.4082], [8.7528, 50.4087], [8.7542, 50.408], [8.7631, 50.4111], [8.7678, 50.4077]]",
-    "06440003": "[[8.7895, 50.1947], [8.7902, 50.1931], [8.7901, 50.1899], [8.7938, 50.19], [8.794, 50.1875], [8.7932, 50.1842], [8.7899, 50.1798], [8.7899, 50.176], [8.7825, 50.1771], [8.7792, 50.1772], [8.7791, 50.1784], [8.7776, 50.1783], [8.7787, 50.1802], [8.763, 50.1791], [8.763, 50.1727], [8.7603, 50.1725], [8.758, 50.1719], [8.7572, 50.1715], [8.7511, 50.1691], [8.7497, 50.1678], [8.7437, 50.1646], [8.7387, 50.1626], [8.7376, 50.1634], [8.7333, 50.1621], [8.7313, 50.1621], [8.7289, 50.1629], [8.7226, 50.1635], [8.7202, 50.1662], [8.7188, 50.1684], [8.718, 50.1692], [8.7146, 50.1703], [8.714, 50.1714], [8.7119, 50.1725], [8.7108, 50.1741], [8.7092, 50.176], [8.7085, 50.1792], [8.7068, 50.1792], [8.7022, 50.1807], [8.7045, 50.1845], [8.7077, 50.1836], [8.7112, 50.1886], [8.7056, 50.1919], [8.7127, 50.1949], [8.714, 50.1945], [8.7184, 50.1962], [8.7197, 50.1989], [8.7291, 50.2024], [8.7307, 50.2036], [8.7306, 50.2053], [8.7318, 50.2065], [8.7314, 50.2119], [8.7333, 50.2123], [8.7335, 50.2154], [8.7323, 50.2158], [8.7311, 50.2177], [8.7364, 50.218], [8.7382, 50.2179], [8.7386, 50.2209], [8.7449, 50.2204], [8.745, 50.2215], [8.7478, 50.2214], [8.7478, 50.2222], [8.747, 50.2229], [8.7483, 50.2231], [8.7534, 50.2224], [8.7545, 50.2228], [8.7657, 50.2206], [8.7675, 50.2163], [8.7727, 50.2125], [8.7729, 50.2112], [8.7744, 50.2106], [8.7748, 50.2096], [8.7764, 50.2082], [8.7773, 50.2086], [8.7828, 50.2056], [8.7834, 50.2046], [8.7828, 50.2024], [8.7822, 50.2012], [8.7804, 50.2008], [8.7796, 50.199], [8.7848, 50.1968], [8.7855, 50.1946], [8.787, 50.1948], [8.7895, 50.1947]]",
-    "06440004": "[[9.228, 50.333], [9.2268, 50.3318], [9.2255, 50.3324], [9.224, 50.3315], [9.2232, 50.3287], [9.2219, 50.3286], [9.2187, 50.3261], [9.2161, 50.3244], [9.2151, 50.323], [9.2136, 50.323], [9.2138, 50.3205], [9.209, 50.3183], [9.2056, 50.3184], [9.2053, 50.3168], [9.2078, 50.3158], [9.2086, 50.3144], [9.2166, 50.3144], [9.2164, 50.3086], [9.2145, 50.3056], [9.2136, 50.305], [9.2125, 50.3038], [9.2115, 50.3021], [9.2112, 50.3013], [9.2103, 50.2959], [9.2088, 50.2947], [9.2077, 50.2928], [9.2066, 50.2923], [9.2061, 50.2914], [9.2071, 50.2905], [9.2075, 50.2893], [9.2082, 50.2887], [9.2081, 50.2879], [9.2088, 50.2865], [9.2084, 50.2857], [9.2073, 50.2851], [9.2058, 50.2848], [9.2047, 50.2841], [9.2035, 50.2827], [9.2023, 50.2823], [9.2013, 50.2816], [9.1985, 50.2817], [9.197, 50.2813], [9.1953, 50.2811], [9.1943, 50.2801], [9.1928, 50.2799], [9.1906, 50.2794], [9.1891, 50.2796], [9.1878, 50.2803], [9.1852, 50.2813], [9.1841, 50.2826], [9.1831, 50.2826], [9.1774, 50.2795], [9.1762, 50.279], [9.1743, 50.2771], [9.1745, 50.2763], [9.1739, 50.2755], [9.1741, 50.2742], [9.1739, 50.2726], [9.1719, 50.2723], [9.1706, 50.2715], [9.169, 50.2714], [9.164, 50.2674], [9.1622, 50.2663], [9.1598, 50.2645], [9.1604, 50.263], [9.1602, 50.2616], [9.1611, 50.2604], [9.1611, 50.2583], [9.163, 50.2573], [9.1638, 50.2551], [9.1582, 50.2511], [9.1569, 50.2505], [9.1543, 50.2496], [9.1525, 50.2486], [9.15, 50.2477], [9.1489, 50.2465], [9.1474, 50.2472], [9.1467, 50.2477], [9.1462, 50.249], [9.1448, 50.2486], [9.1436, 50.25], [9.1351, 50.2502], [9.1342, 50.2511], [9.1317, 50.251], [9.1294, 50.2507], [9.1278, 50.2503], [9.1253, 50.2522], [9.1211, 50.251], [9.1217, 50.2497], [9.1201, 50.2495], [9.118, 50.2491], [9.1134, 50.2458], [9.1111, 50.2461], [9.1119, 50.2469], [9.1109, 50.2478], [9.111, 50.2486], [9.1094, 50.2492], [9.0995, 50.2459], [9.0925, 50.2447], [9.0826, 50.2465], [9.0801, 50.2451], [9.0693, 50.2436], [9.0664, 50.2431], [9.0655, 50.2445], [9.0637, 50.244], [9.0633, 50.2451], [9.0589, 50.2445], [9.0581, 50.2451], [9.055, 50.247], [9.0592, 50.2492], [9.0578, 50.2501], [9.0504, 50.2487], [9.0486, 50.2483], [9.049, 50.2472], [9.0451, 50.2472], [9.0424, 50.2482], [9.0397, 50.2481], [9.0374, 50.2469], [9.0395, 50.2439], [9.0352, 50.2424], [9.0349, 50.2388], [9.0264, 50.2362], [9.0249, 50.2334], [9.0258, 50.2321], [9.0263, 50.2305], [9.0243, 50.2299], [9.0194, 50.2313], [9.0155, 50.2342], [9.0171, 50.2357], [9.0201, 50.2369], [9.0233, 50.238], [9.0224, 50.2394], [9.0196, 50.2402], [9.0167, 50.2391], [9.0118, 50.2407], [9.0107, 50.2394], [9.0103, 50.2375], [9.0091, 50.237], [9.0061, 50.2368], [9.0024, 50.2371], [9.0012, 50.2383], [9.0009, 50.2391], [9.0023, 50.2406], [9.0043, 50.2422], [9.006, 50.2431], [9.0083, 50.244], [9.0051, 50.2458], [9.0, 50.249], [9.0046, 50.2497], [9.0034, 50.2506], [9.0072, 50.2515], [9.0049, 50.2547], [9.0102, 50.2556], [9.019, 50.2618], [9.0203, 50.2647], [9.0176, 50.2656], [9.0177, 50.2673], [9.0236, 50.2698], [9.0231, 50.2707], [9.0203, 50.27], [9.0177, 50.2734], [9.0176, 50.2786], [9.0168, 50.2801], [9.0151, 50.28], [9.0147, 50.2812], [9.0101, 50.2834], [9.0074, 50.2855], [9.0026, 50.2909], [9.0079, 50.2963], [9.0064, 50.2978], [9.0038, 50.2986], [9.0051, 50.3016], [9.007, 50.302], [9.0154, 50.3028], [9.0075, 50.3078], [9.0159, 50.3112], [9.0193, 50.3117], [9.0246, 50.3103], [9.0294, 50.3117], [9.0327, 50.3121], [9.0319, 50.314], [9.0338, 50.3163], [9.0349, 50.3167], [9.0374, 50.316], [9.0399, 50.3157], [9.0565, 50.3166], [9.0571, 50.3159], [9.0633, 50.32], [9.0619, 50.3213], [9.0633, 50.3224], [9.0642, 50.3246], [9.0663, 50.3255], [9.0662, 50.3267], [9.0649, 50.327], [9.0649, 50.328], [9.0675, 50.3286], [9.0684, 50.3299], [9.0679, 50.3304], [9.0693, 50.3322], [9.074, 50.333], [9.0753, 50.3342], [9.0835, 50.3349], [9.0835, 50.3329], [9.0895, 50.3288], [9.0922, 50.3298], [9.0922, 50.3331], [9.1053, 50.3368], [9.1054, 50.3419], [9.1071, 50.342], [9.1072, 50.343], [9.1094, 50.343], [9.1146, 50.3398], [9.1097, 50.3368], [9.1175, 50.3316], [9.119, 50.3333], [9.1194, 50.3353], [9.121, 50.3359], [9.1219, 50.3367], [9.124, 50.3374], [9.1256, 50.3382], [9.1329, 50.3354], [9.1371, 50.3354], [9.1384, 50.3363], [9.1417, 50.3358], [9.1426, 50.3349], [9.1433, 50.3336], [9.1457, 50.3338], [9.1491, 50.3286], [9.1497, 50.328], [9.1531, 50.3255], [9.1605, 50.3315], [9.1589, 50.3327], [9.1599, 50.3349], [9.1627, 50.3364], [9.1636, 50.3398], [9.1726, 50.3377], [9.177, 50.3408], [9.189, 50.3434], [9.1906, 50.3432], [9.1948, 50.3439], [9.2045, 50.3411], [9.2076, 50.3397], [9.212, 50.3384], [9.2182, 50.3348], [9.2198, 50.3343], [9.2254, 50.3341], [9.228, 50.333]]",
-    "06440005": "[[8.6854, 50.4831], [8.6667, 50.4592], [8.6689, 50.458], [8.6697, 50.4579], [8.6734, 50.4569], [8.6749, 50.4568], [8.6775, 50.4572], [8.6837, 50.4575], [8.6861, 50.4555], [8.6937, 50.4564], [8.6943, 50.4545], [8.7002, 50.4546], [8.7041, 50.4536], [8.7078, 50.4501], [8.7112, 50.449], [8.712, 50.4496], [8.7134, 50.45], [8.7151, 50.4502], [8.7188, 50.4517], [8.7205, 50.452], [8.7219, 50.4521], [8.7259, 50.4469], [8.7281, 50.4471], [8.73, 50.4449], [8.7319, 50.4455], [8.7332, 50.4441], [8.736, 50.4434], [8.7371, 50.4425], [8.7339, 50.4397], [8.7298, 50.438], [8.7235, 50.4383], [8.7222, 50.4345], [8.7163, 50.4329], [8.7166, 50.432], [8.7101, 50.4293], [8.709, 50.4291], [8.7101, 50.4248], [8.711, 50.4249], [8.7113, 50.4243], [8.7128, 50.4188], [8.7139, 50.4187], [8.715, 50.4154], [8.7184, 50.4078], [8.7167, 50.4074], [8.7092, 50.4056], [8.7027, 50.4041], [8.7058, 50.4009], [8.6898, 50.3974], [8.6898, 50.396], [8.6864, 50.3961], [8.672, 50.3828], [8.6737, 50.3801], [8.6702, 50.3788], [8.6706, 50.3774], [8.6598, 50.3746], [8.657, 50.3744], [8.6399, 50.3756], [8.6385, 50.3755], [8.6312, 50.3734], [8.6307, 50.3739], [8.6278, 50.3722], [8.6261, 50.3723], [8.625, 50.3716], [8.6238, 50.3706], [8.6195, 50.3719], [8.6165, 50.3717], [8.61, 50.3727], [8.6067, 50.373], [8.6027, 50.3714], [8.6032, 50.3703], [8.5998, 50.369], [8.5978, 50.369], [8.5954, 50.3693], [8.5945, 50.3687], [8.5916, 50.3685], [8.5906, 50.3698], [8.5871, 50.3696], [8.5863, 50.3718], [8.5852, 50.3735], [8.5797, 50.3734], [8.5766, 50.3722], [8.5764, 50.3687], [8.5715, 50.3677], [8.5713, 50.3685], [8.5698, 50.3703], [8.5685, 50.3709], [8.5678, 50.3718], [8.5666, 50.3716], [8.5647, 50.3733], [8.5641, 50.3743], [8.5615, 50.3758], [8.5586, 50.3737], [8.5541, 50.3724], [8.5511, 50.3718], [8.5451, 50.3695], [8.5418, 50.3722], [8.5439, 50.3734], [8.5458, 50.3762], [8.5456, 50.379], [8.5441, 50.3802], [8.5406, 50.381], [8.5377, 50.3813], [8.5365, 50.3831], [8.5371, 50.3877], [8.5361, 50.3916], [8.5301, 50.3925], [8.5283, 50.3942], [8.5231, 50.3959], [8.5203, 50.3967], [8.5187, 50.3978], [8.5157, 50.3982], [8.5148, 50.398], [8.5141, 50.3994], [8.5158, 50.4009], [8.5187, 50.4016], [8.5203, 50.4024], [8.52, 50.4046], [8.5211, 50.4053], [8.5179, 50.4064], [8.5163, 50.4073], [8.5172, 50.408], [8.5185, 50.4075], [8.5215, 50.4062], [8.5279, 50.4103], [8.5295, 50.4107], [8.5284, 50.4123], [8.5329, 50.4128], [8.5358, 50.4146], [8.539, 50.4167], [8.544, 50.4164], [8.5481, 50.4168], [8.5488, 50.4155], [8.5521, 50.4163], [8.553, 50.4151], [8.5547, 50.4138], [8.5557, 50.4142], [8.5532, 50.4173], [8.5556, 50.4174], [8.5567, 50.4153], [8.5601, 50.4147], [8.562, 50.4132], [8.5628, 50.4136], [8.5612, 50.4158], [8.5599, 50.4169], [8.5619, 50.417], [8.5678, 50.4151], [8.5695, 50.4152], [8.5699, 50.4157], [8.574, 50.4149], [8.5775, 50.415], [8.5804, 50.4158], [8.5823, 50.4158], [8.5836, 50.4163], [8.5854, 50.4173], [8.5876, 50.4181], [8.5972, 50.4179], [8.5987, 50.4186], [8.6002, 50.4203], [8.6009, 50.4229], [8.5971, 50.4238], [8.5971, 50.4248], [8.598, 50.4266], [8.6022, 50.4315], [8.6013, 50.4328], [8.5987, 50.4332], [8.5983, 50.434], [8.5975, 50.4343], [8.5959, 50.4343], [8.5941, 50.434], [8.591, 50.4349], [8.5906, 50.4353], [8.59, 50.4367], [8.5895, 50.4371], [8.5877, 50.4373], [8.5842, 50.4385], [8.5824, 50.4403], [8.5811, 50.4412], [8.5794, 50.4417], [8.5774, 50.4426], [8.5759, 50.4439], [8.5745, 50.4454], [8.5744, 50.4462], [8.5761, 50.4474], [8.5791, 50.4476], [8.5795, 50.4471], [8.5821, 50.4474], [8.5835, 50.4467], [8.5851, 50.4473], [8.585, 50.4485], [8.5869, 50.4495], [8.5868, 50.4509], [8.5879, 50.4511], [8.589, 50.4531], [8.5921, 50.4535], [8.5953, 50.455], [8.5974, 50.4564], [8.6023, 50.4577], [8.6, 50.461], [8.6042, 50.462], [8.6053, 50.4625], [8.6065, 50.4636], [8.6083, 50.4639], [8.6094, 50.4645], [8.6107, 50.4649], [8.6126, 50.4658], [8.6155, 50.4638], [8.6163, 50.4643], [8.618, 50.4625], [8.6186, 50.4637], [8.6209, 50.4637], [8.6243, 50.4643], [8.6254, 50.4629], [8.628, 50.4637], [8.6267, 50.4647], [8.627, 50.467], [8.6279, 50.4672], [8.6275, 50.4687], [8.631, 50.469], [8.6312, 50.4704], [8.6305, 50.473], [8.634, 50.4732], [8.6336, 50.4744], [8.6323, 50.4767], [8.641, 50.4795], [8.6461, 50.4812], [8.6455, 50.4826], [8.6454, 50.4837], [8.6467, 50.4844], [8.649, 50.4833], [8.6569, 50.4838], [8.6608, 50.4842], [8.6691, 50.4852], [8.6688, 50.4834], [8.6711, 50.4827], [8.674, 50.4825], [8.6754, 50.4838], [8.6773, 50.4836], [8.6804, 50.4842], [8.6806, 50.4836], [8.6854, 50.4831]]",
-    "06440006": "[[8.9458, 50.3867], [8.9386, 50.3871], [8.9387, 50.3801], [8.9331, 50.3792], [8.9349, 50.3725], [8.9228, 50.372], [8.9162, 50.3661], [8.9054, 50.3593], [8.8948, 50.356], [8.8918, 50.3567], [8.8877, 50.3597], [8.8803, 50.3597], [8.8804, 50.3607], [8.8813, 50.3625], [8.8811, 50.3632], [8.8793, 50.3643], [8.8773, 50.3641], [8.8777, 50.367], [8.8744, 50.3703], [8.8843, 50.3706], [8.8838, 50.3732], [8.8776, 50.3728], [8.8773, 50.3716], [8.8741, 50.3715], [8.87, 50.3719], [8.8656, 50.3721], [8.8624, 50.3712], [8.8629, 50.3692], [8.8587, 50.3683], [8.8572, 50.3721], [8.8474, 50.3705], [8.8432, 50.3788], [8.8389, 50.3774], [8.8392, 50.3855], [8.844, 50.3853], [8.8429, 50.3926], [8.8447, 50.393], [8.8445, 50.395], [8.8465, 50.3958], [8.8446, 50.3967], [8.8431, 50.3971], [8.8434, 50.4], [8.8423, 50.4007], [8.8421, 50.4031], [8.8409, 50.4041], [8.8422, 50.4081], [8.8468, 50.4135], [8.8476, 50.4142], [8.8546, 50.4099], [8.8575, 50.4118], [8.8608, 50.4098], [8.8809, 50.4105], [8.8855, 50.4105], [8.8958, 50.4104], [8.9007, 50.4104], [8.9003, 50.4144], [8.9006, 50.4177], [8.9004, 50.4199], [8.9088, 50.4194], [8.9104, 50.4188], [8.9117, 50.4178], [8.9196, 50.4196], [8.9241, 50.411], [8.9362, 50.4147], [8.9387, 50.4126], [8.9441, 50.4148], [8.9454, 50.4162], [8.9487, 50.4155], [8.9538, 50.4161], [8.9557, 50.4159], [8.9573, 50.4158], [8.9563, 50.4146], [8.9547, 50.4133], [8.9551, 50.4106], [8.9544, 50.4098], [8.95, 50.4069], [8.9513, 50.4045], [8.9498, 50.4029], [8.9492, 50.4012], [8.9493, 50.4006], [8.951, 50.4002], [8.9504, 50.3997], [8.9508, 50.3989], [8.9523, 50.3985], [8.9528, 50.3976], [8.9524, 50.3963], [8.9512, 50.3947], [8.9523, 50.3937], [8.9489, 50.39], [8.947, 50.3902], [8.9458, 50.3867]]",
-    "06440007": "[[8.9252, 50.3456], [8.9297, 50.344], [8.9237, 50.3418], [8.9286, 50.3395], [8.9326, 50.3418], [8.9329, 50.3433], [8.9347, 50.3445], [8.9357, 50.3454], [8.9386, 50.3469], [8.9456, 50.3436], [8.9487, 50.3453], [8.9553, 50.3411], [8.9525, 50.3393], [8.9541, 50.3384], [8.9574, 50.3374], [8.9582, 50.3352], [8.9597, 50.3343], [8.9598, 50.3328], [8.9666, 50.3325], [8.967, 50.3315], [8.9612, 50.3306], [8.9645, 50.329], [8.9742, 50.3324], [8.9744, 50.3337], [8.9769, 50.3345], [8.9811, 50.3335], [8.9799, 50.3326], [8.982, 50.3318], [8.976, 50.3287], [8.9747, 50.3252], [8.9718, 50.3224], [8.9697, 50.3213], [8.9697, 50.3205], [8.9683, 50.3194], [8.9667, 50.3201], [8.9642, 50.3188], [8.9684, 50.3154], [8.9622, 50.312], [8.9603, 50.3127], [8.958, 50.3104], [8.9554, 50.3124], [8.9525, 50.314], [8.9446, 50.3108], [8.9377, 50.307], [8.9354, 50.3052], [8.9349, 50.3045], [8.9314, 50.3053], [8.9294, 50.3043], [8.9289, 50.3027], [8.926, 50.3014], [8.9252, 50.3005], [8.9219, 50.2992], [8.9209, 50.2999], [8.9184, 50.2991], [8.9174, 50.2993], [8.9111, 50.3028], [8.9097, 50.3046], [8.8991, 50.2986], [8.9019, 50.2981], [8.9055, 50.2973], [8.9074, 50.2963], [8.9062, 50.2944], [8.9078, 50.2923], [8.901, 50.2896], [8.8942, 50.293], [8.8923, 50.2931], [8.8891, 50.2957], [8.8829, 50.2941], [8.876, 50.2969], [8.8757, 50.3001], [8.8735, 50.3027], [8.8614, 50.3075], [8.855, 50.3079], [8.8489, 50.3121], [8.8419, 50.3179], [8.8348, 50.3142], [8.8304, 50.3169], [8.8239, 50.3189], [8.8257, 50.322], [8.8171, 50.3229], [8.8186, 50.3302], [8.8319, 50.3284], [8.8337, 50.3297], [8.8428, 50.3289], [8.8498, 50.3349], [8.8561, 50.3355], [8.8591, 50.3348], [8.8683, 50.3339], [8.8757, 50.3316], [8.8848, 50.3329], [8.8859, 50.3392], [8.8892, 50.3479], [8.889, 50.3485], [8.8923, 50.3495], [8.8911, 50.3512], [8.8908, 50.3534], [8.8924, 50.3544], [8.8985, 50.3542], [8.9031, 50.3552], [8.9046, 50.3533], [8.9048, 50.3515], [8.9084, 50.3505], [8.9085, 50.3496], [8.9252, 50.3456]]",
-    "06440008": "[[8.7994, 50.3659], [8.7998, 50.3605], [8.8017, 50.3605], [8.802, 50.3574], [8.8065, 50.3569], [8.818, 50.3529], [8.8184, 50.3439], [8.8207, 50.3434], [8.8197, 50.3408], [8.8212, 50.3369], [8.8205, 50.3353], [8.8209, 50.3345], [8.82, 50.3319], [8.819, 50.3313], [8.8186, 50.3302], [8.8171, 50.3229], [8.8158, 50.3221], [8.8131, 50.3179], [8.8142, 50.3166], [8.8101, 50.3147], [8.8059, 50.3134], [8.8068, 50.3124], [8.8042, 50.3097], [8.804, 50.308], [8.8058, 50.3072], [8.8025, 50.3051], [8.8039, 50.303], [8.8022, 50.3011], [8.8003, 50.3007], [8.7995, 50.3], [8.7996, 50.2994], [8.8016, 50.2991], [8.8003, 50.2959], [8.7936, 50.2929], [8.7879, 50.2898], [8.7834, 50.2921], [8.7837, 50.2928], [8.7783, 50.2946], [8.7733, 50.2923], [8.7699, 50.294], [8.769, 50.3025], [8.767, 50.3025], [8.7665, 50.3061], [8.7643, 50.3059], [8.7638, 50.3083], [8.7609, 50.3083], [8.7566, 50.3087], [8.7566, 50.3096], [8.7502, 50.3106], [8.7436, 50.31], [8.7411, 50.3064], [8.7362, 50.3069], [8.7314, 50.3084], [8.7193, 50.3085], [8.7201, 50.3105], [8.7184, 50.3106], [8.719, 50.3139], [8.716, 50.314], [8.7061, 50.3127], [8.7013, 50.3127], [8.6957, 50.3132], [8.6971, 50.316], [8.6929, 50.3147], [8.69, 50.3147], [8.682, 50.315], [8.6722, 50.3129], [8.6728, 50.3144], [8.6712, 50.3158], [8.6678, 50.3169], [8.6668, 50.3173], [8.666, 50.3182], [8.6548, 50.3169], [8.6528, 50.3164], [8.6482, 50.3158], [8.6424, 50.3157], [8.6395, 50.3163], [8.6363, 50.3186], [8.6392, 50.3236], [8.6427, 50.323], [8.6457, 50.3228], [8.6475, 50.323], [8.65, 50.3243], [8.6549, 50.3261], [8.6653, 50.3321], [8.6701, 50.3323], [8.6719, 50.3332], [8.6851, 50.3381], [8.692, 50.3403], [8.6995, 50.3421], [8.702, 50.3441], [8.714, 50.3488], [8.7211, 50.3489], [8.723, 50.3487], [8.7292, 50.3465], [8.7323, 50.346], [8.7334, 50.3469], [8.7358, 50.3462], [8.7443, 50.3455], [8.7429, 50.348], [8.7481, 50.3492], [8.7506, 50.3464], [8.7536, 50.3459], [8.7553, 50.346], [8.7555, 50.347], [8.7592, 50.3485], [8.7616, 50.3471], [8.7628, 50.3453], [8.7686, 50.3421], [8.7741, 50.3484], [8.7752, 50.35], [8.7769, 50.3501], [8.7787, 50.3509], [8.7797, 50.3518], [8.7789, 50.3545], [8.7812, 50.3547], [8.7812, 50.3561], [8.7786, 50.3561], [8.785, 50.36], [8.7867, 50.3581], [8.7912, 50.359], [8.7945, 50.3638], [8.7994, 50.3659]]",
-    "06440009": "[[9.2867, 50.4373], [9.2858, 50.4329], [9.2855, 50.43], [9.2865, 50.4284], [9.2874, 50.4274], [9.288, 50.4264], [9.2882, 50.4252], [9.2899, 50.4232], [9.2904, 50.4218], [9.288, 50.4219], [9.2857, 50.4217], [9.2823, 50.4171], [9.2806, 50.4166], [9.2737, 50.4165], [9.2735, 50.4149], [9.2731, 50.4138], [9.2732, 50.4128], [9.2718, 50.4121], [9.2685, 50.412], [9.2663, 50.4108], [9.2663, 50.4088], [9.2654, 50.4055], [9.2596, 50.3979], [9.2609, 50.3969], [9.2619, 50.3949], [9.2605, 50.3942], [9.2571, 50.3917], [9.2606, 50.3901], [9.2657, 50.3884], [9.265, 50.3874], [9.2629, 50.3852], [9.2624, 50.3843], [9.2592, 50.3846], [9.2556, 50.3811], [9.2531, 50.3766], [9.2517, 50.3749], [9.2471, 50.3724], [9.2435, 50.3713], [9.239, 50.3721], [9.2337, 50.3712], [9.2309, 50.3726], [9.223, 50.3681], [9.2198, 50.3667], [9.2191, 50.365], [9.2168, 50.3667], [9.2068, 50.3639], [9.2018, 50.3639], [9.198, 50.3626], [9.1952, 50.3621], [9.193, 50.3634], [9.1911, 50.3632], [9.1859, 50.3673], [9.1763, 50.3637], [9.1735, 50.3633], [9.1656, 50.3668], [9.1645, 50.3667], [9.1613, 50.3686], [9.1603, 50.3757], [9.158, 50.3773], [9.1556, 50.3787], [9.1563, 50.3808], [9.1608, 50.3827], [9.1606, 50.3854], [9.1552, 50.391], [9.1653, 50.3923], [9.1693, 50.3923], [9.1738, 50.3926], [9.1747, 50.3935], [9.1755, 50.3949], [9.1769, 50.396], [9.1764, 50.3979], [9.175, 50.4], [9.1678, 50.4005], [9.1661, 50.3999], [9.1627, 50.4004], [9.1656, 50.4019], [9.1681, 50.4025], [9.1671, 50.4048], [9.174, 50.4086], [9.1778, 50.4098], [9.1803, 50.4115], [9.1787, 50.4137], [9.1785, 50.4169], [9.1771, 50.4181], [9.1748, 50.4172], [9.1717, 50.4171], [9.1694, 50.4177], [9.1666, 50.4171], [9.1586, 50.4104], [9.1507, 50.4067], [9.1498, 50.4078], [9.1456, 50.4042], [9.1433, 50.4009], [9.1376, 50.401], [9.1362, 50.3992], [9.1301, 50.4001], [9.1337, 50.4041], [9.1356, 50.4082], [9.1352, 50.4099], [9.136, 50.4121], [9.1375, 50.415], [9.1379, 50.418], [9.1407, 50.4215], [9.1437, 50.4237], [9.1437, 50.4247], [9.1452, 50.4264], [9.1462, 50.4285], [9.148, 50.4304], [9.1506, 50.4321], [9.1517, 50.4345], [9.1557, 50.4374], [9.1588, 50.4389], [9.161, 50.4394], [9.1648, 50.4423], [9.1725, 50.445], [9.1752, 50.4445], [9.1796, 50.4439], [9.1844, 50.4456], [9.1903, 50.4438], [9.1932, 50.4446], [9.1951, 50.4467], [9.2049, 50.4515], [9.2081, 50.4527], [9.2103, 50.4527], [9.212, 50.4535], [9.2152, 50.4546], [9.2189, 50.4564], [9.2232, 50.4575], [9.2277, 50.4592], [9.2319, 50.4596], [9.2313, 50.4605], [9.2327, 50.4612], [9.2348, 50.4611], [9.2353, 50.4605], [9.2399, 50.4607], [9.2442, 50.4611], [9.2477, 50.4618], [9.2497, 50.4625], [9.252, 50.4624], [9.2544, 50.4626], [9.2566, 50.4627], [9.2586, 50.4636], [9.2595, 50.4634], [9.26, 50.4595], [9.2586, 50.4569], [9.2655, 50.4487], [9.2644, 50.4479], [9.2655, 50.4448], [9.2679, 50.4447], [9.2682, 50.4434], [9.2707, 50.4422], [9.2699, 50.4406], [9.2709, 50.4381], [9.2716, 50.4378], [9.2747, 50.4398], [9.2768, 50.4393], [9.278, 50.4407], [9.2811, 50.4389], [9.2835, 50.4381], [9.2867, 50.4373]]",
-    "06440010": "[[9.0374, 50.316], [9.0349, 50.3167], [9.0338, 50.3163], [9.0319, 50.314], [9.0327, 50.3121], [9.0294, 50.3117], [9.0246, 50.3103], [9.0193, 50.3117], [9.0159, 50.3112], [9.0075, 50.3078], [9.0154, 50.3028], [9.007, 50.302], [9.002, 50.3029], [8.9999, 50.3026], [8.9961, 50.305], [8.9893, 50.3061], [8.9901, 50.3078], [8.9921, 50.3106], [8.9926, 50.3116], [8.991, 50.312], [8.9897, 50.3108], [8.9833, 50.3131], [8.977, 50.3136], [8.9684, 50.3154], [8.9642, 50.3188], [8.9667, 50.3201], [8.9683, 50.3194], [8.9697, 50.3205], [8.9697, 50.3213], [8.9718, 50.3224], [8.9747, 50.3252], [8.976, 50.3287], [8.982, 50.3318], [8.9863, 50.3371], [8.9855, 50.3382], [8.9874, 50.3421], [8.9908, 50.3414], [8.9958, 50.3373], [9.0008, 50.3363], [9.0047, 50.3348], [9.0073, 50.3344], [9.0129, 50.3362], [9.0146, 50.3372], [9.0151, 50.338], [9.0161, 50.3381], [9.02, 50.3358], [9.0199, 50.3344], [9.0256, 50.3338], [9.0318, 50.3281], [9.0321, 50.3257], [9.0361, 50.3255], [9.0379, 50.3187], [9.036, 50.3181], [9.0374, 50.316]]",
-    "06440011": "[[9.1437, 50.4247], [9.1437, 50.4237], [9.1407, 50.4215], [9.1379, 50.418], [9.1375, 50.415], [9.136, 50.4121], [9.1352, 50.4099], [9.1356, 50.4082], [9.1337, 50.4041], [9.1301, 50.4001], [9.1362, 50.3992], [9.1376, 50.401], [9.1433, 50.4009], [9.1456, 50.4042], [9.1498, 50.4078], [9.1507, 50.4067], [9.1586, 50.4104], [9.1666, 50.4171], [9.1694, 50.4177], [9.1717, 50.4171], [9.1748, 50.4172], [9.1771, 50.4181], [9.1785, 50.4169], [9.1787, 50.4137], [9.1803, 50.4115], [9.1778, 50.4098], [9.174, 50.4086], [9.1671, 50.4048], [9.1681, 50.4025], [9.1656, 50.4019], [9.1627, 50.4004], [9.1661, 50.3999], [9.1678, 50.4005], [9.175, 50.4], [9.1764, 50.3979], [9.1769, 50.396], [9.1755, 50.3949], [9.1747, 50.3935], [9.1738, 50.3926], [9.1693, 50.3923], [9.1653, 50.3923], [9.1552, 50.391], [9.1526, 50.3916], [9.15, 50.3936], [9.1465, 50.392], [9.144, 50.3903], [9.1419, 50.3885], [9.1363, 50.3853], [9.1349, 50.3821], [9.1357, 50.3805], [9.1328, 50.3796], [9.1293, 50.3791], [9.1275, 50.3791], [9.1254, 50.3826], [9.1215, 50.3816], [9.117, 50.3794], [9.1152, 50.3815], [9.1115, 50.3837], [9.1132, 50.3853], [9.1142, 50.3855], [9.1151, 50.3861], [9.1112, 50.3878], [9.1107, 50.3893], [9.119, 50.3918], [9.1252, 50.3955], [9.1232, 50.3969], [9.1219, 50.3963], [9.1203, 50.3967], [9.119, 50.398], [9.1185, 50.3995], [9.1171, 50.401], [9.1176, 50.4023], [9.1173, 50.4085], [9.1227, 50.4147], [9.1231, 50.4155], [9.1206, 50.4157], [9.122, 50.4178], [9.1263, 50.4245], [9.1225, 50.425], [9.1203, 50.426], [9.1204, 50.4275], [9.1187, 50.4282], [9.1169, 50.4276], [9.1125, 50.4244], [9.1072, 50.4246], [9.1029, 50.4267], [9.0999, 50.4262], [9.0944, 50.4273], [9.0956, 50.4292], [9.0953, 50.4301], [9.0973, 50.4308], [9.0983, 50.4325], [9.1004, 50.434], [9.1029, 50.4357], [9.1043, 50.4361], [9.1077, 50.4347], [9.1097, 50.4346], [9.114, 50.436], [9.123, 50.4369], [9.1314, 50.4354], [9.1344, 50.436], [9.1429, 50.4369], [9.1446, 50.4371], [9.1459, 50.4422], [9.1468, 50.4422], [9.1478, 50.4413], [9.1516, 50.4403], [9.154, 50.4392], [9.1515, 50.4383], [9.1495, 50.4374], [9.1473, 50.4357], [9.1472, 50.4351], [9.1481, 50.4337], [9.1443, 50.4312], [9.145, 50.4305], [9.1429, 50.4258], [9.1437, 50.4247]]",
-    "06440012": "[[8.8102, 50.2373], [8.8071, 50.2333], [8.8044, 50.2293], [8.8114, 50.2281], [8.8126, 50.2247], [8.8168, 50.2156], [8.8221, 50.2055], [8.8263, 50.2016], [8.8242, 50.2012], [8.8232, 50.2005], [8.8227, 50.1997], [8.8217, 50.1992], [8.8185, 50.199], [8.8167, 50.1989], [8.8158, 50.1982], [8.8142, 50.1974], [8.8138, 50.1963], [8.8127, 50.1961], [8.8103, 50.1963], [8.8102, 50.1972], [8.8088, 50.1974], [8.8075, 50.1967], [8.8065, 50.1977], [8.8038, 50.1978], [8.8031, 50.1982], [8.7995, 50.1988], [8.7984, 50.1987], [8.7962, 50.198], [8.795, 50.1975], [8.7923, 50.1975], [8.7908, 50.1968], [8.7906, 50.1961], [8.7909, 50.1952], [8.7895, 50.1947], [8.787, 50.1948], [8.7855, 50.1946], [8.7848, 50.1968], [8.7796, 50.199], [8.7804, 50.2008], [8.7822, 50.2012], [8.7828, 50.2024], [8.7834, 50.2046], [8.7828, 50.2056], [8.7773, 50.2086], [8.7764, 50.2082], [8.7748, 50.2096], [8.7744, 50.2106], [8.7729, 50.2112], [8.7727, 50.2125], [8.7675, 50.2163], [8.7657, 50.2206], [8.7545, 50.2228], [8.7534, 50.2224], [8.7483, 50.2231], [8.747, 50.2229], [8.7478, 50.2222], [8.7478, 50.2214], [8.745, 50.2215], [8.7449, 50.2204], [8.7386, 50.2209], [8.7382, 50.2179], [8.7364, 50.218], [8.7311, 50.2177], [8.7276, 50.2191], [8.724, 50.2201], [8.7237, 50.2213], [8.7216, 50.2215], [8.7193, 50.2253], [8.7165, 50.2244], [8.7158, 50.2259], [8.7128, 50.225], [8.7116, 50.2248], [8.7114, 50.2263], [8.7124, 50.2271], [8.7119, 50.2293], [8.7018, 50.2294], [8.6967, 50.2316], [8.693, 50.2339], [8.6895, 50.2364], [8.6883, 50.2367], [8.6975, 50.2518], [8.7035, 50.2507], [8.7055, 50.2559], [8.7293, 50.252], [8.7313, 50.2522], [8.7331, 50.2507], [8.7385, 50.2596], [8.7414, 50.2618], [8.7437, 50.2632], [8.7555, 50.2631], [8.757, 50.2635], [8.7645, 50.2601], [8.7608, 50.2579], [8.7613, 50.2566], [8.7621, 50.2553], [8.7636, 50.2559], [8.7652, 50.256], [8.767, 50.2559], [8.7714, 50.2577], [8.7726, 50.2579], [8.7743, 50.2579], [8.7768, 50.2592], [8.7772, 50.2598], [8.7778, 50.262], [8.7773, 50.2627], [8.7775, 50.2636], [8.7792, 50.2646], [8.782, 50.2679], [8.7886, 50.266], [8.792, 50.2638], [8.8007, 50.2624], [8.8006, 50.2632], [8.8135, 50.2633], [8.818, 50.2646], [8.8191, 50.2653], [8.8237, 50.2634], [8.8269, 50.2616], [8.8255, 50.257], [8.8239, 50.257], [8.824, 50.2555], [8.8213, 50.2557], [8.8194, 50.2514], [8.8214, 50.2512], [8.8172, 50.2422], [8.8141, 50.2389], [8.8087, 50.2421], [8.8074, 50.2412], [8.8085, 50.2409], [8.8077, 50.2378], [8.8102, 50.2373]]",
-    "06440013": "[[9.2517, 50.3749], [9.2591, 50.3731], [9.2613, 50.3741], [9.2655, 50.373], [9.27, 50.3727], [9.2728, 50.3717], [9.2708, 50.3676], [9.275, 50.3642], [9.2762, 50.3618], [9.2721, 50.3605], [9.2671, 50.3627], [9.2571, 50.3608], [9.2578, 50.3593], [9.2588, 50.3561], [9.2586, 50.3554], [9.2575, 50.354], [9.2576, 50.3516], [9.2565, 50.3498], [9.2563, 50.3489], [9.2565, 50.3471], [9.256, 50.3463], [9.2548, 50.3455], [9.2539, 50.3446], [9.2537, 50.3438], [9.254, 50.343], [9.256, 50.3416], [9.2574, 50.3412], [9.2586, 50.3413], [9.2601, 50.3418], [9.2655, 50.3407], [9.2677, 50.3397], [9.2684, 50.3384], [9.2683, 50.3349], [9.2694, 50.3328], [9.2678, 50.3313], [9.2678, 50.328], [9.2657, 50.3283], [9.2639, 50.332], [9.2615, 50.332], [9.2604, 50.3331], [9.258, 50.3332], [9.2542, 50.3329], [9.25, 50.3323], [9.2406, 50.3299], [9.2362, 50.3302], [9.2364, 50.3314], [9.2335, 50.3318], [9.2309, 50.3338], [9.228, 50.333], [9.2254, 50.3341], [9.2198, 50.3343], [9.2182, 50.3348], [9.212, 50.3384], [9.2076, 50.3397], [9.2045, 50.3411], [9.1948, 50.3439], [9.1906, 50.3432], [9.189, 50.3434], [9.177, 50.3408], [9.1726, 50.3377], [9.1636, 50.3398], [9.1627, 50.3364], [9.1599, 50.3349], [9.1589, 50.3327], [9.1605, 50.3315], [9.1531, 50.3255], [9.1497, 50.328], [9.1491, 50.3286], [9.1457, 50.3338], [9.1433, 50.3336], [9.1426, 50.3349], [9.1417, 50.3358], [9.1384, 50.3363], [9.1371, 50.3354], [9.1329, 50.3354], [9.1256, 50.3382], [9.124, 50.3374], [9.1219, 50.3367], [9.121, 50.3359], [9.1194, 50.3353], [9.119, 50.3333], [9.1175, 50.3316], [9.1097, 50.3368], [9.1146, 50.3398], [9.1094, 50.343], [9.1097, 50.3442], [9.1274, 50.3435], [9.1311, 50.3427], [9.1335, 50.3431], [9.137, 50.3464], [9.1386, 50.3478], [9.1382, 50.3489], [9.1387, 50.3498], [9.1454, 50.3469], [9.1492, 50.3487], [9.1513, 50.353], [9.1565, 50.3571], [9.163, 50.3587], [9.1629, 50.3607], [9.1618, 50.3619], [9.1628, 50.363], [9.1645, 50.3667], [9.1656, 50.3668], [9.1735, 50.3633], [9.1763, 50.3637], [9.1859, 50.3673], [9.1911, 50.3632], [9.193, 50.3634], [9.1952, 50.3621], [9.198, 50.3626], [9.2018, 50.3639], [9.2068, 50.3639], [9.2168, 50.3667], [9.2191, 50.365], [9.2198, 50.3667], [9.223, 50.3681], [9.2309, 50.3726], [9.2337, 50.3712], [9.239, 50.3721], [9.2435, 50.3713], [9.2471, 50.3724], [9.2517, 50.3749]]",
-    "06440014": "[[9.0, 50.249], [8.9988, 50.2486], [8.9966, 50.252], [8.9954, 50.2536], [8.9872, 50.2512], [8.9875, 50.246], [8.9793, 50.2446], [8.974, 50.2437], [8.9716, 50.2468], [8.9682, 50.2449], [8.9571, 50.2474], [8.9596, 50.2498], [8.9609, 50.2521], [8.9627, 50.2532], [8.9656, 50.2552], [8.9607, 50.2618], [8.9601, 50.2627], [8.9612, 50.2632], [8.9614, 50.2648], [8.9618, 50.2659], [8.9667, 50.2627], [8.9707, 50.2632], [8.9722, 50.2658], [8.9742, 50.2654], [8.9789, 50.2651], [8.9781, 50.2669], [8.9785, 50.2699], [8.9757, 50.2751], [8.9725, 50.2795], [8.9714, 50.2789], [8.9706, 50.2804], [8.9767, 50.2818], [8.9841, 50.2815], [8.9888, 50.2797], [8.9919, 50.2801], [8.9966, 50.2818], [9.0027, 50.2827], [9.0074, 50.2855], [9.0101, 50.2834], [9.0147, 50.2812], [9.0151, 50.28], [9.0168, 50.2801], [9.0176, 50.2786], [9.0177, 50.2734], [9.0203, 50.27], [9.0231, 50.2707], [9.0236, 50.2698], [9.0177, 50.2673], [9.0176, 50.2656], [9.0203, 50.2647], [9.019, 50.2618], [9.0102, 50.2556], [9.0049, 50.2547], [9.0072, 50.2515], [9.0034, 50.2506], [9.0046, 50.2497], [9.0, 50.249]]",
-    "06440015": "[[8.7396, 50.4785], [8.7464, 50.4744], [8.7553, 50.4744], [8.7556, 50.4708], [8.7602, 50.4707], [8.7632, 50.47], [8.7643, 50.4688], [8.7619, 50.468], [8.7645, 50.4646], [8.766, 50.4648], [8.7679, 50.4649], [8.7682, 50.4652], [8.7653, 50.4675], [8.766, 50.4691], [8.7682, 50.4706], [8.7768, 50.4745], [8.7824, 50.4786], [8.7805, 50.4803], [8.7838, 50.4809], [8.784, 50.4786], [8.7936, 50.4792], [8.7941, 50.4745], [8.794, 50.4718], [8.7944, 50.4707], [8.7942, 50.4692], [8.7969, 50.4688], [8.8001, 50.4667], [8.8027, 50.4669], [8.8038, 50.4619], [8.8048, 50.4608], [8.8058, 50.4582], [8.7952, 50.4524], [8.7972, 50.4481], [8.7992, 50.4424], [8.8026, 50.4364], [8.7926, 50.4392], [8.787, 50.4352], [8.7867, 50.4331], [8.7796, 50.4321], [8.7688, 50.4348], [8.7636, 50.4348], [8.7498, 50.4405], [8.7439, 50.4387], [8.7371, 50.4425], [8.736, 50.4434], [8.7332, 50.4441], [8.7319, 50.4455], [8.73, 50.4449], [8.7281, 50.4471], [8.7259, 50.4469], [8.7219, 50.4521], [8.7205, 50.452], [8.7188, 50.4517], [8.7151, 50.4502], [8.7134, 50.45], [8.712, 50.4496], [8.7112, 50.449], [8.7078, 50.4501], [8.7041, 50.4536], [8.7002, 50.4546], [8.6943, 50.4545], [8.6937, 50.4564], [8.6861, 50.4555], [8.6837, 50.4575], [8.6775, 50.4572], [8.6749, 50.4568], [8.6734, 50.4569], [8.6697, 50.4579], [8.6689, 50.458], [8.6667, 50.4592], [8.6854, 50.4831], [8.6869, 50.4853], [8.6927, 50.4817], [8.6939, 50.4805], [8.6978, 50.4797], [8.6999, 50.4781], [8.7041, 50.4771], [8.7089, 50.4772], [8.7121, 50.4747], [8.7156, 50.4757], [8.7237, 50.4783], [8.7329, 50.4769], [8.7356, 50.4772], [8.738, 50.4778], [8.7396, 50.4785]]",
-    "06440016": "[[9.1043, 50.4361], [9.1029, 50.4357], [9.1004, 50.434], [9.0983, 50.4325], [9.0973, 50.4308], [9.0953, 50.4301], [9.0956, 50.4292], [9.0944, 50.4273], [9.0999, 50.4262], [9.1029, 50.4267], [9.1072, 50.4246], [9.1125, 50.4244], [9.1169, 50.4276], [9.1187, 50.4282], [9.1204, 50.4275], [9.1203, 50.426], [9.1225, 50.425], [9.1263, 50.4245], [9.122, 50.4178], [9.1206, 50.4157], [9.1231, 50.4155], [9.1227, 50.4147], [9.1173, 50.4085], [9.1176, 50.4023], [9.1171, 50.401], [9.1185, 50.3995], [9.119, 50.398], [9.1173, 50.3968], [9.1149, 50.3957], [9.112, 50.3955], [9.1098, 50.3948], [9.1074, 50.3943], [9.1038, 50.3932], [9.1021, 50.3922], [9.0991, 50.3913], [9.097, 50.3892], [9.0975, 50.3883], [9.0967, 50.3869], [9.0958, 50.386], [9.0948, 50.3845], [9.0944, 50.3827], [9.0939, 50.3823], [9.0919, 50.3823], [9.0905, 50.3818], [9.0887, 50.3831], [9.0881, 50.385], [9.0857, 50.3848], [9.0835, 50.3842], [9.0828, 50.3851], [9.0763, 50.3832], [9.075, 50.3841], [9.0652, 50.385], [9.0627, 50.3844], [9.0603, 50.3869], [9.0586, 50.3878], [9.0577, 50.389], [9.0536, 50.3909], [9.0459, 50.3878], [9.0442, 50.3887], [9.0293, 50.3799], [9.0251, 50.3782], [9.0221, 50.3799], [9.0203, 50.3834], [9.0189, 50.3838], [9.015, 50.3839], [9.0109, 50.3835], [9.0091, 50.3835], [9.0069, 50.3855], [9.0055, 50.3882], [9.003, 50.3878], [9.0007, 50.3869], [8.9988, 50.3858], [8.9973, 50.3844], [8.9897, 50.3806], [8.9877, 50.3798], [8.9835, 50.3799], [8.9798, 50.3788], [8.9796, 50.3792], [8.9742, 50.3885], [8.9725, 50.3883], [8.9706, 50.3899], [8.9649, 50.3892], [8.9641, 50.3854], [8.9644, 50.3826], [8.9557, 50.3814], [8.9548, 50.3795], [8.9512, 50.3796], [8.9505, 50.3816], [8.9453, 50.3811], [8.9448, 50.3853], [8.9458, 50.3867], [8.947, 50.3902], [8.9489, 50.39], [8.9523, 50.3937], [8.9512, 50.3947], [8.9524, 50.3963], [8.9528, 50.3976], [8.9523, 50.3985], [8.9508, 50.3989], [8.9504, 50.3997], [8.951, 50.4002], [8.9493, 50.4006], [8.9492, 50.4012], [8.9498, 50.4029], [8.9513, 50.4045], [8.95, 50.4069], [8.9544, 50.4098], [8.9551, 50.4106], [8.9547, 50.4133], [8.9563, 50.4146], [8.9573, 50.4158], [8.9557, 50.4159], [8.9538, 50.4161], [8.9487, 50.4155], [8.9454, 50.4162], [8.9441, 50.4148], [8.9387, 50.4126], [8.9362, 50.4147], [8.9241, 50.411], [8.9196, 50.4196], [8.9117, 50.4178], [8.9104, 50.4188], [8.9088, 50.4194], [8.9004, 50.4199], [8.9006, 50.4233], [8.9008, 50.4254], [8.9004, 50.4271], [8.9035, 50.4336], [8.9052, 50.4354], [8.9071, 50.4381], [8.9108, 50.4373], [8.9112, 50.4379], [8.9146, 50.4371], [8.9166, 50.4364], [8.9184, 50.4368], [8.9203, 50.4363], [8.922, 50.4356], [8.9219, 50.4352], [8.923, 50.4344], [8.9297, 50.4326], [8.9316, 50.4345], [8.9352, 50.4341], [8.9374, 50.4338], [8.9398, 50.4337], [8.9408, 50.4326], [8.9432, 50.4324], [8.947, 50.4328], [8.9481, 50.4311], [8.9538, 50.4334], [8.9575, 50.4368], [8.9616, 50.4392], [8.9635, 50.4404], [8.9608, 50.4434], [8.9582, 50.4437], [8.9568, 50.4444], [8.9574, 50.4465], [8.9581, 50.4476], [8.9606, 50.4487], [8.9644, 50.4484], [8.9638, 50.4498], [8.9695, 50.4505], [8.9704, 50.4496], [8.9739, 50.4501], [8.9768, 50.4514], [8.9833, 50.4523], [8.9878, 50.4539], [8.9878, 50.4556], [8.9861, 50.457], [8.987, 50.458], [8.99, 50.4591], [8.9889, 50.4641], [8.9796, 50.4651], [8.9805, 50.4681], [8.9789, 50.4683], [8.9802, 50.4708], [8.984, 50.4738], [8.9844, 50.4765], [8.9875, 50.4795], [8.9856, 50.4838], [8.9856, 50.4851], [8.9832, 50.4889], [8.9804, 50.4892], [8.9787, 50.4904], [8.9917, 50.4941], [8.9942, 50.4939], [8.9977, 50.4947], [9.0023, 50.4949], [9.0086, 50.4954], [9.0057, 50.4909], [9.0059, 50.4895], [9.0097, 50.4898], [9.0144, 50.4909], [9.017, 50.4926], [9.0217, 50.4936], [9.0235, 50.4948], [9.025, 50.4959], [9.0265, 50.4965], [9.0293, 50.4971], [9.0398, 50.4972], [9.0424, 50.498], [9.0474, 50.4997], [9.0542, 50.5001], [9.0577, 50.5], [9.07, 50.4971], [9.074, 50.4962], [9.076, 50.4955], [9.0772, 50.4954], [9.0767, 50.4934], [9.0721, 50.49], [9.069, 50.489], [9.0614, 50.485], [9.0609, 50.482], [9.0609, 50.4809], [9.0624, 50.4799], [9.0621, 50.4785], [9.0591, 50.4756], [9.0587, 50.4712], [9.0598, 50.4694], [9.0614, 50.4692], [9.0618, 50.4684], [9.0619, 50.4647], [9.0645, 50.4625], [9.0697, 50.4572], [9.0703, 50.4563], [9.076, 50.4592], [9.0786, 50.4593], [9.0795, 50.4586], [9.0808, 50.4595], [9.0832, 50.4584], [9.0858, 50.4569], [9.089, 50.4567], [9.0944, 50.4574], [9.0931, 50.4553], [9.092, 50.4517], [9.0912, 50.4497], [9.0939, 50.4497], [9.0959, 50.4458], [9.0947, 50.4433], [9.0922, 50.4425], [9.0915, 50.4414], [9.0871, 50.4394], [9.0874, 50.4383], [9.0931, 50.4371], [9.0946, 50.4363], [9.0976, 50.4356], [9.1022, 50.4369], [9.1031, 50.4368], [9.1043, 50.4361]]",
-    "06440017": "[[8.901, 50.2896], [8.9034, 50.2868], [8.9042, 50.2806], [8.9008, 50.2759], [8.9001, 50.2747], [8.8969, 50.2731], [8.8944, 50.2738], [8.8936, 50.2746], [8.8913, 50.2735], [8.8862, 50.2725], [8.8825, 50.2734], [8.8761, 50.2767], [8.8677, 50.2811], [8.8611, 50.2789], [8.8587, 50.2785], [8.8565, 50.2779], [8.8514, 50.2758], [8.8465, 50.2747], [8.8468, 50.2736], [8.8449, 50.2704], [8.8465, 50.2695], [8.847, 50.268], [8.8537, 50.2658], [8.8556, 50.265], [8.856, 50.2638], [8.8536, 50.2625], [8.8508, 50.2605], [8.8508, 50.2598], [8.8525, 50.2586], [8.8518, 50.2573], [8.8537, 50.2568], [8.8559, 50.2549], [8.8552, 50.2542], [8.8531, 50.2534], [8.8538, 50.252], [8.8556, 50.2509], [8.8555, 50.2496], [8.8522, 50.2492], [8.8445, 50.2469], [8.8409, 50.2412], [8.8378, 50.241], [8.8376, 50.2387], [8.8329, 50.2387], [8.8325, 50.2371], [8.8297, 50.2372], [8.8287, 50.235], [8.8225, 50.2354], [8.823, 50.2376], [8.8221, 50.2377], [8.8168, 50.2379], [8.8166, 50.2355], [8.8118, 50.2355], [8.812, 50.2374], [8.8102, 50.2373], [8.8077, 50.2378], [8.8085, 50.2409], [8.8074, 50.2412], [8.8087, 50.2421], [8.8141, 50.2389], [8.8172, 50.2422], [8.8214, 50.2512], [8.8194, 50.2514], [8.8213, 50.2557], [8.824, 50.2555], [8.8239, 50.257], [8.8255, 50.257], [8.8269, 50.2616], [8.8237, 50.2634], [8.8191, 50.2653], [8.818, 50.2646], [8.8135, 50.2633], [8.8006, 50.2632], [8.8007, 50.2624], [8.792, 50.2638], [8.7886, 50.266], [8.782, 50.2679], [8.7828, 50.2693], [8.7816, 50.2716], [8.7816, 50.2727], [8.7832, 50.2737], [8.7839, 50.2764], [8.7848, 50.2771], [8.7825, 50.2781], [8.778, 50.2804], [8.7768, 50.2806], [8.778, 50.2825], [8.7804, 50.2846], [8.781, 50.2854], [8.7824, 50.2862], [8.7859, 50.2881], [8.7879, 50.2898], [8.7936, 50.2929], [8.8003, 50.2959], [8.8016, 50.2991], [8.7996, 50.2994], [8.7995, 50.3], [8.8003, 50.3007], [8.8022, 50.3011], [8.8039, 50.303], [8.8025, 50.3051], [8.8058, 50.3072], [8.804, 50.308], [8.8042, 50.3097], [8.8068, 50.3124], [8.8059, 50.3134], [8.8101, 50.3147], [8.8142, 50.3166], [8.8131, 50.3179], [8.8158, 50.3221], [8.8171, 50.3229], [8.8257, 50.322], [8.8239, 50.3189], [8.8304, 50.3169], [8.8348, 50.3142], [8.8419, 50.3179], [8.8489, 50.3121], [8.855, 50.3079], [8.8614, 50.3075], [8.8735, 50.3027], [8.8757, 50.3001], [8.876, 50.2969], [8.8829, 50.2941], [8.8891, 50.2957], [8.8923, 50.2931], [8.8942, 50.293], [8.901, 50.2896]]",
-    "06440018": "[[8.714, 50.3488], [8.702, 50.3441], [8.6995, 50.3421], [8.692, 50.3403], [8.6851, 50.3381], [8.6719, 50.3332], [8.6701, 50.3323], [8.6653, 50.3321], [8.6549, 50.3261], [8.65, 50.3243], [8.6441, 50.3311], [8.6417, 50.3336], [8.6357, 50.3313], [8.6328, 50.3353], [8.6333, 50.3371], [8.6359, 50.337], [8.6311, 50.3403], [8.6267, 50.3404], [8.6254, 50.3411], [8.6298, 50.3434], [8.6291, 50.344], [8.6257, 50.3425], [8.6247, 50.3427], [8.6231, 50.3441], [8.624, 50.3472], [8.6222, 50.3479], [8.6198, 50.3508], [8.6153, 50.3501], [8.6138, 50.3514], [8.6107, 50.3519], [8.6073, 50.3529], [8.6049, 50.3545], [8.6028, 50.3564], [8.6027, 50.3578], [8.6004, 50.3588], [8.6003, 50.3594], [8.6024, 50.3611], [8.6032, 50.3616], [8.6064, 50.3622], [8.6082, 50.3624], [8.6098, 50.3631], [8.6123, 50.365], [8.6124, 50.3656], [8.6114, 50.3663], [8.6098, 50.3671], [8.6102, 50.3683], [8.609, 50.369], [8.6083, 50.3703], [8.61, 50.3727], [8.6165, 50.3717], [8.6195, 50.3719], [8.6238, 50.3706], [8.625, 50.3716], [8.6261, 50.3723], [8.6278, 50.3722], [8.6307, 50.3739], [8.6312, 50.3734], [8.6385, 50.3755], [8.6399, 50.3756], [8.657, 50.3744], [8.6598, 50.3746], [8.6706, 50.3774], [8.6702, 50.3788], [8.6737, 50.3801], [8.672, 50.3828], [8.6864, 50.3961], [8.6898, 50.396], [8.6898, 50.3974], [8.7058, 50.4009], [8.7027, 50.4041], [8.7092, 50.4056], [8.7167, 50.4074], [8.7193, 50.4029], [8.7175, 50.4028], [8.7174, 50.3932], [8.7157, 50.3905], [8.7145, 50.3907], [8.7149, 50.3873], [8.7112, 50.3871], [8.7119, 50.3799], [8.7115, 50.3783], [8.7121, 50.3763], [8.7106, 50.3757], [8.7124, 50.3728], [8.7117, 50.3682], [8.7119, 50.3667], [8.7125, 50.3663], [8.7177, 50.3655], [8.7172, 50.3642], [8.7156, 50.3636], [8.7141, 50.3622], [8.7121, 50.3597], [8.7111, 50.3574], [8.7099, 50.3541], [8.7099, 50.3508], [8.714, 50.3502], [8.714, 50.3488]]",
-    "06440019": "[[9.1552, 50.391], [9.1606, 50.3854], [9.1608, 50.3827], [9.1563, 50.3808], [9.1556, 50.3787], [9.158, 50.3773], [9.1603, 50.3757], [9.1613, 50.3686], [9.1645, 50.3667], [9.1628, 50.363], [9.1618, 50.3619], [9.1629, 50.3607], [9.163, 50.3587], [9.1565, 50.3571], [9.1513, 50.353], [9.1492, 50.3487], [9.1454, 50.3469], [9.1387, 50.3498], [9.1382, 50.3489], [9.1386, 50.3478], [9.137, 50.3464], [9.1335, 50.3431], [9.1311, 50.3427], [9.1274, 50.3435], [9.1097, 50.3442], [9.1094, 50.343], [9.1072, 50.343], [9.1071, 50.342], [9.1054, 50.3419], [9.1053, 50.3368], [9.0922, 50.3331], [9.0922, 50.3298], [9.0895, 50.3288], [9.0835, 50.3329], [9.0835, 50.3349], [9.0753, 50.3342], [9.074, 50.333], [9.0693, 50.3322], [9.0679, 50.3304], [9.0684, 50.3299], [9.0675, 50.3286], [9.0649, 50.328], [9.0649, 50.327], [9.0662, 50.3267], [9.0663, 50.3255], [9.0642, 50.3246], [9.0633, 50.3224], [9.0619, 50.3213], [9.0633, 50.32], [9.0571, 50.3159], [9.0565, 50.3166], [9.0399, 50.3157], [9.0374, 50.316], [9.036, 50.3181], [9.0379, 50.3187], [9.0361, 50.3255], [9.0321, 50.3257], [9.0318, 50.3281], [9.0256, 50.3338], [9.0199, 50.3344], [9.02, 50.3358], [9.0161, 50.3381], [9.0151, 50.338], [9.0146, 50.3372], [9.0129, 50.3362], [9.0073, 50.3344], [9.0047, 50.3348], [9.0008, 50.3363], [8.9958, 50.3373], [8.9908, 50.3414], [8.9874, 50.3421], [8.9869, 50.3453], [8.99, 50.3454], [8.9956, 50.347], [8.9985, 50.3492], [8.9996, 50.3508], [9.001, 50.3521], [9.0023, 50.3531], [9.0119, 50.3542], [9.0152, 50.3541], [9.0184, 50.3552], [9.0242, 50.3601], [9.0322, 50.3605], [9.0329, 50.3599], [9.04, 50.3633], [9.0482, 50.3645], [9.0522, 50.3649], [9.0524, 50.3676], [9.0507, 50.369], [9.0549, 50.3703], [9.0542, 50.3724], [9.0526, 50.3734], [9.0495, 50.3733], [9.0467, 50.3737], [9.0475, 50.3754], [9.0506, 50.3764], [9.0517, 50.3772], [9.054, 50.3805], [9.0565, 50.3824], [9.058, 50.384], [9.059, 50.3858], [9.0603, 50.3869], [9.0627, 50.3844], [9.0652, 50.385], [9.075, 50.3841], [9.0763, 50.3832], [9.0828, 50.3851], [9.0835, 50.3842], [9.0857, 50.3848], [9.0881, 50.385], [9.0887, 50.3831], [9.0905, 50.3818], [9.0919, 50.3823], [9.0939, 50.3823], [9.0944, 50.3827], [9.0948, 50.3845], [9.0958, 50.386], [9.0967, 50.3869], [9.0975, 50.3883], [9.097, 50.3892], [9.0991, 50.3913], [9.1021, 50.3922], [9.1038, 50.3932], [9.1074, 50.3943], [9.1098, 50.3948], [9.112, 50.3955], [9.1149, 50.3957], [9.1173, 50.3968], [9.119, 50.398], [9.1203, 50.3967], [9.1219, 50.3963], [9.1232, 50.3969], [9.1252, 50.3955], [9.119, 50.3918], [9.1107, 50.3893], [9.1112, 50.3878], [9.1151, 50.3861], [9.1142, 50.3855], [9.1132, 50.3853], [9.1115, 50.3837], [9.1152, 50.3815], [9.117, 50.3794], [9.1215, 50.3816], [9.1254, 50.3826], [9.1275, 50.3791], [9.1293, 50.3791], [9.1328, 50.3796], [9.1357, 50.3805], [9.1349, 50.3821], [9.1363, 50.3853], [9.1419, 50.3885], [9.144, 50.3903], [9.1465, 50.392], [9.15, 50.3936], [9.1526, 50.3916], [9.1552, 50.391]]",
-    "06440020": "[[9.0603, 50.3869], [9.059, 50.3858], [9.058, 50.384], [9.0565, 50.3824], [9.054, 50.3805], [9.0517, 50.3772], [9.0506, 50.3764], [9.0475, 50.3754], [9.0467, 50.3737], [9.0495, 50.3733], [9.0526, 50.3734], [9.0542, 50.3724], [9.0549, 50.3703], [9.0507, 50.369], [9.0524, 50.3676], [9.0522, 50.3649], [9.0482, 50.3645], [9.04, 50.3633], [9.0329, 50.3599], [9.0322, 50.3605], [9.0242, 50.3601], [9.0184, 50.3552], [9.0152, 50.3541], [9.0119, 50.3542], [9.0023, 50.3531], [9.001, 50.3521], [8.9996, 50.3508], [8.9985, 50.3492], [8.9956, 50.347], [8.99, 50.3454], [8.9869, 50.3453], [8.9874, 50.3421], [8.9855, 50.3382], [8.9863, 50.3371], [8.982, 50.3318], [8.9799, 50.3326], [8.9811, 50.3335], [8.9769, 50.3345], [8.9744, 50.3337], [8.9742, 50.3324], [8.9645, 50.329], [8.9612, 50.3306], [8.967, 50.3315], [8.9666, 50.3325], [8.9598, 50.3328], [8.9597, 50.3343], [8.9582, 50.3352], [8.9574, 50.3374], [8.9541, 50.3384], [8.9525, 50.3393], [8.9553, 50.3411], [8.9487, 50.3453], [8.9456, 50.3436], [8.9386, 50.3469], [8.9357, 50.3454], [8.9347, 50.3445], [8.9329, 50.3433], [8.9326, 50.3418], [8.9286, 50.3395], [8.9237, 50.3418], [8.9297, 50.344], [8.9252, 50.3456], [8.9268, 50.3496], [8.9286, 50.3525], [8.9265, 50.3555], [8.9276, 50.3561], [8.9281, 50.3577], [8.9333, 50.3599], [8.9334, 50.3619], [8.935, 50.3628], [8.9358, 50.3647], [8.936, 50.3677], [8.9359, 50.3703], [8.9349, 50.3725], [8.9331, 50.3792], [8.9387, 50.3801], [8.9386, 50.3871], [8.9458, 50.3867], [8.9448, 50.3853], [8.9453, 50.3811], [8.9505, 50.3816], [8.9512, 50.3796], [8.9548, 50.3795], [8.9557, 50.3814], [8.9644, 50.3826], [8.9641, 50.3854], [8.9649, 50.3892], [8.9706, 50.3899], [8.9725, 50.3883], [8.9742, 50.3885], [8.9796, 50.3792], [8.9798, 50.3788], [8.9835, 50.3799], [8.9877, 50.3798], [8.9897, 50.3806], [8.9973, 50.3844], [8.9988, 50.3858], [9.0007, 50.3869], [9.003, 50.3878], [9.0055, 50.3882], [9.0069, 50.3855], [9.0091, 50.3835], [9.0109, 50.3835], [9.015, 50.3839], [9.0189, 50.3838], [9.0203, 50.3834], [9.0221, 50.3799], [9.0251, 50.3782], [9.0293, 50.3799], [9.0442, 50.3887], [9.0459, 50.3878], [9.0536, 50.3909], [9.0577, 50.389], [9.0586, 50.3878], [9.0603, 50.3869]]",
-    "06440021": "[[8.9349, 50.3725], [8.9359, 50.3703], [8.936, 50.3677], [8.9358, 50.3647], [8.935, 50.3628], [8.9334, 50.3619], [8.9333, 50.3599], [8.9281, 50.3577], [8.9276, 50.3561], [8.9265, 50.3555], [8.9286, 50.3525], [8.9268, 50.3496], [8.9252, 50.3456], [8.9085, 50.3496], [8.9084, 50.3505], [8.9048, 50.3515], [8.9046, 50.3533], [8.9031, 50.3552], [8.8985, 50.3542], [8.8924, 50.3544], [8.8908, 50.3534], [8.8911, 50.3512], [8.8923, 50.3495], [8.889, 50.3485], [8.8892, 50.3479], [8.8859, 50.3392], [8.8848, 50.3329], [8.8757, 50.3316], [8.8683, 50.3339], [8.8591, 50.3348], [8.8561, 50.3355], [8.8498, 50.3349], [8.8428, 50.3289], [8.8337, 50.3297], [8.8319, 50.3284], [8.8186, 50.3302], [8.819, 50.3313], [8.82, 50.3319], [8.8209, 50.3345], [8.8205, 50.3353], [8.8212, 50.3369], [8.8197, 50.3408], [8.8207, 50.3434], [8.8184, 50.3439], [8.818, 50.3529], [8.8065, 50.3569], [8.802, 50.3574], [8.8017, 50.3605], [8.7998, 50.3605], [8.7994, 50.3659], [8.8201, 50.3722], [8.8334, 50.3689], [8.837, 50.3749], [8.8356, 50.3764], [8.8389, 50.3774], [8.8432, 50.3788], [8.8474, 50.3705], [8.8572, 50.3721], [8.8587, 50.3683], [8.8629, 50.3692], [8.8624, 50.3712], [8.8656, 50.3721], [8.87, 50.3719], [8.8741, 50.3715], [8.8773, 50.3716], [8.8776, 50.3728], [8.8838, 50.3732], [8.8843, 50.3706], [8.8744, 50.3703], [8.8777, 50.367], [8.8773, 50.3641], [8.8793, 50.3643], [8.8811, 50.3632], [8.8813, 50.3625], [8.8804, 50.3607], [8.8803, 50.3597], [8.8877, 50.3597], [8.8918, 50.3567], [8.8948, 50.356], [8.9054, 50.3593], [8.9162, 50.3661], [8.9228, 50.372], [8.9349, 50.3725]]",
-    "06440022": "[[8.7371, 50.4425], [8.7439, 50.4387], [8.7498, 50.4405], [8.7636, 50.4348], [8.7688, 50.4348], [8.7796, 50.4321], [8.7867, 50.4331], [8.7855, 50.4309], [8.7826, 50.4297], [8.7908, 50.426], [8.7925, 50.4243], [8.7912, 50.4207], [8.7862, 50.4194], [8.7846, 50.4184], [8.7814, 50.4196], [8.7789, 50.4168], [8.7791, 50.4152], [8.7753, 50.414], [8.7738, 50.4145], [8.7711, 50.4134], [8.7727, 50.4124], [8.7678, 50.4077], [8.7631, 50.4111], [8.7542, 50.408], [8.7528, 50.4087], [8.7474, 50.4082], [8.7455, 50.406], [8.74, 50.4055], [8.7402, 50.4073], [8.7219, 50.4019], [8.7208, 50.4031], [8.7193, 50.4029], [8.7167, 50.4074], [8.7184, 50.4078], [8.715, 50.4154], [8.7139, 50.4187], [8.7128, 50.4188], [8.7113, 50.4243], [8.711, 50.4249], [8.7101, 50.4248], [8.709, 50.4291], [8.7101, 50.4293], [8.7166, 50.432], [8.7163, 50.4329], [8.7222, 50.4345], [8.7235, 50.4383], [8.7298, 50.438], [8.7339, 50.4397], [8.7371, 50.4425]]",
-    "06440023": "[[8.7411, 50.3064], [8.744, 50.306], [8.7296, 50.2844], [8.7282, 50.2804], [8.7324, 50.2795], [8.7346, 50.2772], [8.7355, 50.2767], [8.7346, 50.2748], [8.7373, 50.2738], [8.74, 50.2717], [8.7413, 50.2703], [8.7425, 50.2675], [8.7433, 50.2664], [8.7438, 50.2646], [8.7437, 50.2632], [8.7414, 50.2618], [8.7385, 50.2596], [8.7331, 50.2507], [8.7313, 50.2522], [8.7293, 50.252], [8.7055, 50.2559], [8.7035, 50.2507], [8.6975, 50.2518], [8.6883, 50.2367], [8.6842, 50.2382], [8.689, 50.2498], [8.6902, 50.2532], [8.6861, 50.254], [8.6866, 50.256], [8.6826, 50.2571], [8.6814, 50.2578], [8.6756, 50.2601], [8.6774, 50.2629], [8.6734, 50.2643], [8.6712, 50.2643], [8.6692, 50.2646], [8.6688, 50.2653], [8.6662, 50.2652], [8.6632, 50.2665], [8.6607, 50.2677], [8.6598, 50.2695], [8.6587, 50.2726], [8.659, 50.274], [8.66, 50.2771], [8.6608, 50.2786], [8.6598, 50.2796], [8.6619, 50.2818], [8.6627, 50.2834], [8.6651, 50.2836], [8.667, 50.2835], [8.6685, 50.2877], [8.6657, 50.2879], [8.6637, 50.2883], [8.6603, 50.2902], [8.6586, 50.2888], [8.6565, 50.2894], [8.6523, 50.286], [8.6569, 50.2836], [8.6593, 50.2824], [8.6577, 50.281], [8.6559, 50.2814], [8.6544, 50.2813], [8.6511, 50.2816], [8.6441, 50.2827], [8.6397, 50.2834], [8.607, 50.2883], [8.5923, 50.2904], [8.5958, 50.2908], [8.5992, 50.291], [8.6014, 50.2921], [8.606, 50.2934], [8.6161, 50.2966], [8.6174, 50.298], [8.6176, 50.2993], [8.6215, 50.3036], [8.6332, 50.3106], [8.6341, 50.3139], [8.6363, 50.3135], [8.6384, 50.3134], [8.6395, 50.3163], [8.6424, 50.3157], [8.6482, 50.3158], [8.6528, 50.3164], [8.6548, 50.3169], [8.666, 50.3182], [8.6668, 50.3173], [8.6678, 50.3169], [8.6712, 50.3158], [8.6728, 50.3144], [8.6722, 50.3129], [8.682, 50.315], [8.69, 50.3147], [8.6929, 50.3147], [8.6971, 50.316], [8.6957, 50.3132], [8.7013, 50.3127], [8.7061, 50.3127], [8.716, 50.314], [8.719, 50.3139], [8.7184, 50.3106], [8.7201, 50.3105], [8.7193, 50.3085], [8.7314, 50.3084], [8.7362, 50.3069], [8.7411, 50.3064]]",
-    "06440024": "[[8.9004, 50.4271], [8.9008, 50.4254], [8.9006, 50.4233], [8.9004, 50.4199], [8.9006, 50.4177], [8.9003, 50.4144], [8.9007, 50.4104], [8.8958, 50.4104], [8.8855, 50.4105], [8.8809, 50.4105], [8.8608, 50.4098], [8.8575, 50.4118], [8.8546, 50.4099], [8.8476, 50.4142], [8.8468, 50.4135], [8.8422, 50.4081], [8.8409, 50.4041], [8.8421, 50.4031], [8.8423, 50.4007], [8.8434, 50.4], [8.8431, 50.3971], [8.8446, 50.3967], [8.8465, 50.3958], [8.8445, 50.395], [8.8447, 50.393], [8.8429, 50.3926], [8.844, 50.3853], [8.8392, 50.3855], [8.8389, 50.3774], [8.8356, 50.3764], [8.837, 50.3749], [8.8334, 50.3689], [8.8201, 50.3722], [8.7994, 50.3659], [8.7945, 50.3638], [8.7926, 50.3635], [8.7929, 50.366], [8.7904, 50.3662], [8.791, 50.3719], [8.7824, 50.3725], [8.785, 50.382], [8.7827, 50.3877], [8.7809, 50.3881], [8.7813, 50.3888], [8.7795, 50.3901], [8.7809, 50.3907], [8.777, 50.3975], [8.7736, 50.3998], [8.7726, 50.4025], [8.7706, 50.4038], [8.7678, 50.4077], [8.7727, 50.4124], [8.7711, 50.4134], [8.7738, 50.4145], [8.7753, 50.414], [8.7791, 50.4152], [8.7789, 50.4168], [8.7814, 50.4196], [8.7846, 50.4184], [8.7862, 50.4194], [8.7912, 50.4207], [8.7925, 50.4243], [8.7908, 50.426], [8.7826, 50.4297], [8.7855, 50.4309], [8.7867, 50.4331], [8.787, 50.4352], [8.7926, 50.4392], [8.8026, 50.4364], [8.7992, 50.4424], [8.8114, 50.436], [8.8133, 50.4353], [8.8173, 50.4351], [8.8175, 50.4336], [8.8223, 50.434], [8.8225, 50.4332], [8.8259, 50.4335], [8.83, 50.4328], [8.8319, 50.4328], [8.8352, 50.4322], [8.8372, 50.4321], [8.8402, 50.4316], [8.8408, 50.4332], [8.8485, 50.4322], [8.8528, 50.4321], [8.8542, 50.4349], [8.8559, 50.4345], [8.858, 50.4378], [8.8604, 50.4403], [8.8587, 50.441], [8.861, 50.4434], [8.8596, 50.4439], [8.8623, 50.4466], [8.8693, 50.4448], [8.8687, 50.4432], [8.8738, 50.4418], [8.8723, 50.4388], [8.8748, 50.4381], [8.8735, 50.4353], [8.8774, 50.4341], [8.8872, 50.4277], [8.8899, 50.4274], [8.8943, 50.4272], [8.8993, 50.4275], [8.9004, 50.4271]]",
-    "06440025": "[[8.7879, 50.2898], [8.7859, 50.2881], [8.7824, 50.2862], [8.781, 50.2854], [8.7804, 50.2846], [8.778, 50.2825], [8.7768, 50.2806], [8.778, 50.2804], [8.7825, 50.2781], [8.7848, 50.2771], [8.7839, 50.2764], [8.7832, 50.2737], [8.7816, 50.2727], [8.7816, 50.2716], [8.7828, 50.2693], [8.782, 50.2679], [8.7792, 50.2646], [8.7775, 50.2636], [8.7773, 50.2627], [8.7778, 50.262], [8.7772, 50.2598], [8.7768, 50.2592], [8.7743, 50.2579], [8.7726, 50.2579], [8.7714, 50.2577], [8.767, 50.2559], [8.7652, 50.256], [8.7636, 50.2559], [8.7621, 50.2553], [8.7613, 50.2566], [8.7608, 50.2579], [8.7645, 50.2601], [8.757, 50.2635], [8.7555, 50.2631], [8.7437, 50.2632], [8.7438, 50.2646], [8.7433, 50.2664], [8.7425, 50.2675], [8.7413, 50.2703], [8.74, 50.2717], [8.7373, 50.2738], [8.7346, 50.2748], [8.7355, 50.2767], [8.7346, 50.2772], [8.7324, 50.2795], [8.7282, 50.2804], [8.7296, 50.2844], [8.744, 50.306], [8.7411, 50.3064], [8.7436, 50.31], [8.7502, 50.3106], [8.7566, 50.3096], [8.7566, 50.3087], [8.7609, 50.3083], [8.7638, 50.3083], [8.7643, 50.3059], [8.7665, 50.3061], [8.767, 50.3025], [8.769, 50.3025], [8.7699, 50.294], [8.7733, 50.2923], [8.7783, 50.2946], [8.7837, 50.2928], [8.7834, 50.2921], [8.7879, 50.2898]]",
-}
+# Normalized output (--star-schema or PLANNING_AREAS_STAR=1) instead of the four files above:
+# the polygon is stored once per Gemeinde in a geometry dimension, the planning areas refer
+# to it by Gemeindekennziffer. With --dissolve (PLANNING_AREAS_DISSOLVE=1) one polygon per
+# planning area (union of its Gemeinden) is written as well.
+GEOMETRY_FILENAME = "wk-gemeinden-geometrie.csv"
+MAPPING_FILENAME = "wk-planungsraeume-zuordnung.csv"
+DISSOLVED_FILENAME = "wk-planungsraeume-polygone.csv"
 
 
-def find_header_row(df_no_header):
-    """Sucht die Zeile mit Spaltennamen."""
-    must_have = {"PLZ", "Gemeindeziffer", "Gemeinde", "ASD-Regionen", "ASD-Bezirke" ,"Soziale Hilfen", "Pflegestützpunkte"}
-    for i in range(min(50, len(df_no_header))):
-        vals = [str(x).strip() for x in df_no_header.iloc[i].tolist()]
-        if must_have.issubset(set(vals)):
-            return i
-    with pd.option_context("display.max_columns", None, "display.width", 200):
-        print(df_no_header.head(5))
-    raise ValueError("Konnte die Kopfzeile nicht finden (PLZ/Gemeindeziffer/Gemeinde/ASD-Regionen/ASD-Bezirke/Soziale Hilfen/Pflegestützpunkte)")
+def clean_and_format(df: pd.DataFrame) -> pd.DataFrame:
+    """Bereinigt und formatiert die Daten und ergänzt die Gemeindegrenzen."""
+    df = clean_zustaendigkeiten(df)
+    # Boundaries from the polygon store (common/gemeinde_polygons.npy), decoded once per Gemeinde;
+    # `--detail=high|medium|low` writes simplified polygons (see common/simplify.py)
+    geojson = detail_store(requested_detail()).geojson_map(df["Gemeindekennziffer"])
+    df["GEOjson"] = df["Gemeindekennziffer"].map(geojson).fillna("")
+    df = df[["ASD-Region", "ASD-Bezirk" ,"Soziale Hilfe", "Pflegestützpunkt", "Gemeinde", "Gemeindekennziffer", "PLZ", "GEOjson"]].reset_index(drop=True)
+    return df
 
 
-def read_zustaendigkeiten(xlsx_path: Path) -> pd.DataFrame:
-    """Liest das Tabellenblatt 'Zuständigkeiten'."""
-    raw = pd.read_excel(xlsx_path, sheet_name="Zuständigkeiten", header=None, dtype=str)
+def star_requested() -> bool:
+    return "--star-schema" in sys.argv[1:] or os.environ.get("PLANNING_AREAS_STAR") == "1"
 
-    header_row = find_header_row(raw)
-    df = pd.read_excel(xlsx_path, sheet_name="Zuständigkeiten", header=header_row, dtype=str)
-    return df
 
+def dissolve_requested() -> bool:
+    return "--dissolve" in sys.argv[1:] or os.environ.get("PLANNING_AREAS_DISSOLVE") == "1"
 
-def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Behält nur benötigte Spalten und benennt sie um."""
-    orig_cols = list(df.columns)
-    df.columns = [str(c).strip() for c in df.columns]
 
-    needed_raw = ["ASD-Regionen", "ASD-Bezirke" ,"Soziale Hilfen", "Pflegestützpunkte", "Gemeinde", "Gemeindeziffer", "PLZ"]
-    missing = [c for c in needed_raw if c not in df.columns]
-    if missing:
-        raise ValueError(f"Fehlende Spalten: {missing}")
+def geometry_dimension(df: pd.DataFrame) -> pd.DataFrame:
+    """Eine Zeile je Gemeinde: Name, Fläche, Schwerpunkt, Bounding Box und Polygon."""
+    gemeinden = df.drop_duplicates("Gemeindekennziffer")[["Gemeindekennziffer", "Gemeinde", "GEOjson"]]
+    attributes = gemeinde_geometry().drop(columns="gemeinde_schluessel")
+    table = gemeinden.merge(attributes, left_on="Gemeindekennziffer", right_index=True, how="left")
+    columns = ["Gemeindekennziffer", "Gemeinde"] + list(attributes.columns) + ["GEOjson"]
+    return table[columns].sort_values("Gemeindekennziffer").reset_index(drop=True)
 
-    ren = {
-        "ASD-Regionen": "ASD-Region",
-        "ASD-Bezirke": "ASD-Bezirk",
-        "Soziale Hilfen": "Soziale Hilfe",
-        "Pflegestützpunkte": "Pflegestützpunkt",
-        "Gemeindeziffer": "Gemeindekennziffer",
-        "Gemeinde": "Gemeinde",
-        "PLZ": "PLZ",
-    }
 
-    return df[needed_raw].rename(columns=ren)
+def dissolved_areas(df: pd.DataFrame) -> pd.DataFrame:
+    """Polygon je Planungsraum (Vereinigung seiner Gemeinden), eine Zeile je Ring."""
+    store = detail_store(requested_detail())
+    rows = []
+    for area_type in AREA_COLUMNS:
+        for area, members in df.groupby(area_type, sort=True)["Gemeindekennziffer"]:
+            keys = [k for k in members.unique() if k in store]
+            for i, ring in enumerate(dissolve(store, keys)):
+                rows.append({
+                    "Planungsraum-Typ": area_type,
+                    "Planungsraum": area,
+                    "Ring": i,
+                    "Innenring": signed_area(ring) < 0,
+                    "Gemeinden": len(keys),
+                    "GEOjson": json.dumps((ring / store.scale).tolist()),
+                })
+    return pd.DataFrame(rows, columns=["Planungsraum-Typ", "Planungsraum", "Ring", "Innenring", "Gemeinden", "GEOjson"])
 
 
-def clean_and_format(df: pd.DataFrame) -> pd.DataFrame:
-    """Bereinigt und formatiert die Daten."""
-    df = df[~df.apply(lambda x: x.astype(str).str.contains("Ergebnis", case=False, na=False)).any(axis=1)]
-    df = df.dropna(how="all")
-
-    for col in ["ASD-Region", "ASD-Bezirk" ,"Soziale Hilfe", "Pflegestützpunkt", "Gemeinde", "Gemeindekennziffer", "PLZ"]:
-        df[col] = df[col].astype(str).str.strip()
-
-    df["PLZ"] = (
-        df["PLZ"]
-        .str.extract(r"(\d+)", expand=False)
-        .fillna("")
-        .str.zfill(5)
-    )
-    df["Gemeindekennziffer"] = (
-        df["Gemeindekennziffer"]
-        .str.extract(r"(\d+)", expand=False)
-        .fillna("")
-        .str.zfill(8)
-    )
-
-    before = len(df)
-    df = df[(df["Gemeinde"] != "") & (df["PLZ"] != "") & (df["Gemeinde"] != "") & (df["Gemeindekennziffer"] != "")]
-
-    df = df.drop_duplicates(subset=["ASD-Region", "ASD-Bezirk" ,"Soziale Hilfe", "Pflegestützpunkt", "Gemeindekennziffer", "PLZ", "Gemeinde"])
-    df["GEOjson"] = df["Gemeindekennziffer"].map(GEOJSON_MAP).fillna("")
-    df = df[["ASD-Region", "ASD-Bezirk" ,"Soziale Hilfe", "Pflegestützpunkt", "Gemeinde", "Gemeindekennziffer", "PLZ", "GEOjson"]].reset_index(drop=True)
-    return df
+def star_schema(df: pd.DataFrame) -> list[tuple[str, pd.DataFrame, list[str]]]:
+    """Geometrie-Dimension, Zuordnungstabelle und optional die Planungsraum-Polygone (Datei, Tabelle, DB-Schlüssel)."""
+    tables = [
+        (GEOMETRY_FILENAME, geometry_dimension(df), ["Gemeindekennziffer"]),
+        (MAPPING_FILENAME, df[AREA_COLUMNS + ["Gemeinde", "Gemeindekennziffer", "PLZ"]].copy(), AREA_COLUMNS + ["PLZ"]),
+    ]
+    if dissolve_requested():
+        tables.append((DISSOLVED_FILENAME, dissolved_areas(df), ["Planungsraum-Typ", "Planungsraum", "Ring"]))
+    return tables
 
 
 def build_matching_table(xlsx_path: Path) -> pd.DataFrame:
     """Erstellt die fertige Tabelle."""
     xls = pd.ExcelFile(xlsx_path)
 
-    df_raw = read_zustaendigkeiten(xlsx_path)
-    df_norm = normalize_columns(df_raw)
-    df_clean = clean_and_format(df_norm)
+    with stage("extract") as s:
+        df_raw = read_zustaendigkeiten(xlsx_path)
+        s.rows = len(df_raw)
+    with stage("map") as s:
+        df_norm = normalize_columns(df_raw)
+        df_clean = clean_and_format(df_norm)
+        s.rows = len(df_clean)
     return df_clean
 
 
@@ -137,14 +114,22 @@ def main():
         print("Fehler beim Erstellen der Tabelle:", repr(e))
         return
 
+    if star_requested():
+        with stage("aggregate"):
+            outputs = star_schema(df)
+    else:
+        outputs = [(filename, df[cols], [cols[0], "PLZ"]) for filename, cols in OPTIONS.items()]
+
     try:
-        for filename, cols in OPTIONS.items():
-            sub = df[cols].copy()
-            sub.to_csv(Path(filename), index=False, encoding="utf-8-sig")
-            print(f"Fertig: Datei gespeichert in {filename}")
+        for filename, table, keys in outputs:
+            with stage("write", rows=len(table)):
+                sub = table.copy()
+                written = write_result(sub, filename, csv_options={"encoding": "utf-8-sig"},
+                                       db_keys=keys)
+            print(f"Fertig: Datei gespeichert in {', '.join(written)}")
     except Exception as e:
         print("Fehler beim Speichern der CSV-Datei:", repr(e))
 
 
 if __name__ == "__main__":
-    main()
+    run_instrumented(main, "planning-areas-matching")
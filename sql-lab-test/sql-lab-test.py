@@ -1,7 +1,14 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import pandas as pd
 
+from common.merge import merge_tables
+
 df1 = pd.read_excel("sql-lab-test-1.xlsx")
 df2 = pd.read_excel("sql-lab-test-2.xlsx")
 
-merged = pd.merge(df1, df2, on=["Gemeinde", "Jahr"])
-merged.to_excel("merged.xlsx", sheet_name="Merged", index=False)
\ No newline at end of file
+# Joined on (gemeinde_schluessel, jahr), so differently spelled Gemeinde names still match
+merged, _ = merge_tables({"sql-lab-test-1": df1, "sql-lab-test-2": df2}, how="inner")
+merged.to_excel("merged.xlsx", sheet_name="Merged", index=False)
@@ -0,0 +1,388 @@
+"""
+Generates synthetic versions of all source workbooks for benchmarks and local runs.
+
+The files are written into a data root with the same layout the scripts expect
+(`<root>/data/...` plus `<root>/geocode_cache.json`), so any script can be run with
+the data root as working directory. Sizes are controlled by scale factors:
+
+- gemeinden: number of copies of the 25 Wetterau Gemeinden (Arbeitsmarkt files, Anbieter, Planungsräume)
+- years:     number of yearly files (altersverteilung, PKS, gemband)
+- gebiete:   rows per Gebiet and Jahrgang in dadigesamt, Kreise in PKS, PLZ per Gemeinde
+
+Usage:
+    python3 synthetic_data.py <data_root> [--gemeinden N] [--years N] [--gebiete N] [--seed N]
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+from openpyxl import Workbook
+
+from common.gemeinde_aliases import gemeinde_aliases
+from common.mapping import mapping, mapping_gemeinde, ignore_list
+from common.schluessel_map import schluessel_map
+
+LAST_YEAR = 2024
+ARBEITSMARKT_YEARS = [2020, 2021, 2022, 2023, 2024]
+
+# Row ranges of the Wetterau block in "Gemeindedaten" (see common/gemband.py)
+GEMBAND_ROW_RANGES = {
+    2020: (2947, 2971),
+    2021: (2947, 2971),
+    2022: (2945, 2969),
+    2023: (2942, 2966),
+    2024: (2942, 2966),
+}
+GEMBAND_ROWS = 3000
+
+SHEET_PKS = "T01_Kreise"
+KREIS_GKZ = 6440
+
+SEKTOREN = [
+    "Land- und Forstwirtschaft, Fischerei ( A )",
+    "Produzierendes Gewerbe ( B - F )",
+    "Handel, Verkehr und Gastgewerbe ( G - I )",
+    "Sonstige Dienstleistungen ( J - U )",
+]
+
+ARBEITSLOSE = [
+    "Insgesamt",
+    "Männer",
+    "Frauen",
+    "15 bis unter 25 Jahre",
+    "55 bis unter 65 Jahre",
+    "Langzeitarbeitslose",
+    "Ausländer",
+    "SGB III",
+    "SGB II",
+]
+
+STRAFTATEN = [
+    ("------", "Straftaten insgesamt"),
+    ("100000", "Straftaten gegen das Leben"),
+    ("200000", "Rohheitsdelikte und Straftaten gegen die persönliche Freiheit"),
+    ("220000", "Körperverletzung"),
+    ("300000", "Diebstahl ohne erschwerende Umstände"),
+    ("400000", "Diebstahl unter erschwerenden Umständen"),
+    ("510000", "Betrug"),
+    ("620000", "Widerstand gegen die Staatsgewalt"),
+    ("674000", "Sachbeschädigung"),
+    ("730000", "Rauschgiftdelikte"),
+]
+
+BRANCHEN = [
+    "Ambulante Pflege",
+    "Stationäre Pflege",
+    "Tagespflege",
+    "Betreutes Wohnen",
+    "Beratung",
+]
+
+# Rough bounding box of the Wetteraukreis (lon, lat)
+WETTERAU_BBOX = (8.60, 50.17, 9.35, 50.50)
+
+
+def gemeinde_names(factor: int) -> list[str]:
+    """Canonical Gemeinde names, repeated with a numeric suffix for factor > 1."""
+    base = [name for name in gemeinde_aliases if name != "Wetteraukreis"]
+    names = list(base)
+    for copy in range(2, factor + 1):
+        names.extend(f"{name} {copy}" for name in base)
+    return names
+
+
+def gebiet_names() -> list[str]:
+    """All Gebiet names known to the mapping, plus the Gemeinde names and ignored areas."""
+    names = []
+    for gemeinde_names_list in mapping_gemeinde.values():
+        names.append(gemeinde_names_list[0])
+    for gebiete in mapping.values():
+        for group in gebiete:
+            names.extend(group)
+    names.extend(sorted(ignore_list))
+    return names
+
+
+def age_profile(rng: np.random.Generator, ages: np.ndarray, scale: float) -> np.ndarray:
+    """Plausible population per age: flat until 60, then declining."""
+    base = np.where(ages < 60, 1.0, np.exp(-(ages - 60) / 12.0))
+    noise = rng.uniform(0.85, 1.15, size=len(ages))
+    return np.round(base * noise * scale).astype(int)
+
+
+def save(wb: Workbook, path: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    wb.save(path)
+    print(f"Written: {path}")
+
+
+def write_arbeitsmarkt(root: str, rng: np.random.Generator, gemeinden_factor: int):
+    """Arbeitsmarkt-kommunal_<nr>_<Gemeinde>.xlsx with the 'Daten' layout."""
+    target = os.path.join(root, "data", "arbeitsortbeschäftigung")
+    for nr, name in enumerate(gemeinde_names(gemeinden_factor), start=1):
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Daten")
+        rows = [[None] * 7 for _ in range(50)]
+        rows[0][1] = f"Arbeitsmarkt kommunal - {name}"
+        rows[2][1] = "Berichtsmonat Juni"
+        rows[16][1] = "Sozialversicherungspflichtig Beschäftigte am Arbeitsort nach Wirtschaftszweigen"
+        rows[16][2:7] = ARBEITSMARKT_YEARS
+
+        size = rng.uniform(0.3, 3.0)
+        for i, sektor in enumerate(SEKTOREN):
+            rows[17 + i][1] = sektor
+            base = [40, 2500, 1800, 3200][i] * size
+            rows[17 + i][2:7] = [int(base * rng.uniform(0.9, 1.1)) for _ in ARBEITSMARKT_YEARS]
+        # Suppressed values appear as '*' in the real exports
+        rows[17][6] = "*" if rng.random() < 0.2 else rows[17][6]
+
+        rows[36][1] = "Arbeitslose"
+        rows[36][2:7] = ARBEITSMARKT_YEARS
+        for year_idx in range(len(ARBEITSMARKT_YEARS)):
+            total = int(400 * size * rng.uniform(0.8, 1.2))
+            men = int(total * rng.uniform(0.45, 0.55))
+            sgb3 = int(total * rng.uniform(0.3, 0.4))
+            values = [
+                total,
+                men,
+                total - men,
+                int(total * 0.1),
+                int(total * 0.2),
+                int(total * 0.3),
+                int(total * 0.25),
+                sgb3,
+                total - sgb3,
+            ]
+            for i, value in enumerate(values):
+                rows[37 + i][2 + year_idx] = value
+        for i, label in enumerate(ARBEITSLOSE):
+            rows[37 + i][1] = label
+
+        for row in rows:
+            ws.append(row)
+
+        file_name = f"Arbeitsmarkt-kommunal_{nr:03d}_{name.replace(' ', '_')}.xlsx"
+        save(wb, os.path.join(target, file_name))
+
+
+def write_gemband(root: str, rng: np.random.Generator, years: list[int]):
+    """gemband_<..>_0-<year>06.xlsx with the 'Gemeindedaten' sheet."""
+    target = os.path.join(root, "data", "gemband")
+    names = [name for name in gemeinde_aliases if name != "Wetteraukreis"]
+    for year in years:
+        if year not in GEMBAND_ROW_RANGES:
+            continue
+        row_start, row_end = GEMBAND_ROW_RANGES[year]
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Gemeindedaten")
+        for idx in range(GEMBAND_ROWS):
+            if row_start <= idx <= row_end:
+                name = names[idx - row_start]
+                key = f"06440{idx - row_start + 1:03d}"
+            else:
+                name = f"Gemeinde {idx:04d}"
+                key = f"06{idx:06d}"
+            einpendler = int(rng.uniform(500, 15000))
+            auspendler = int(rng.uniform(500, 15000))
+            row = [key, name, einpendler + auspendler]
+            row += [int(rng.uniform(-3000, 3000)), int(rng.uniform(-3000, 3000))]
+            row += [int(rng.uniform(0, 5000)) for _ in range(7)]
+            row += [einpendler, auspendler]
+            ws.append(row)
+        save(wb, os.path.join(target, f"gemband_dlk_0-{year}06.xlsx"))
+
+
+def write_dadigesamt(root: str, rng: np.random.Generator, gebiete_factor: int):
+    """geburtsjahrgangsstatistik.xlsx with the 'dadigesamt' sheet (Gebiet x Jahrgang)."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("dadigesamt")
+    ws.append(["Gebiet", "Jahrgang", "EW gesamt", "EW männlich", "EW weiblich"])
+    jahrgaenge = np.arange(LAST_YEAR - 100, LAST_YEAR + 1)
+    ages = LAST_YEAR - jahrgaenge
+    for gebiet in gebiet_names():
+        for _ in range(gebiete_factor):
+            counts = age_profile(rng, ages, rng.uniform(2, 40) / gebiete_factor)
+            for jahrgang, count in zip(jahrgaenge, counts):
+                men = int(count // 2)
+                ws.append([gebiet, str(jahrgang), str(count), str(men), str(count - men)])
+    save(wb, os.path.join(root, "data", "geburtsjahrgangsstatistik.xlsx"))
+
+
+def write_altersverteilung(root: str, rng: np.random.Generator, years: list[int]):
+    """'<year> GjS Wetteraukreis mit GKZ.XLSX' files."""
+    target = os.path.join(root, "data", "altersverteilung")
+    for year in years:
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(f"{year} GjS Wetteraukreis")
+        ws.append(["GKZ", "Jahrgang", "EW gesamt"])
+        jahrgaenge = np.arange(year - 100, year + 1)
+        counts = age_profile(rng, year - jahrgaenge, 3000)
+        for jahrgang, count in zip(jahrgaenge, counts):
+            ws.append([KREIS_GKZ, int(jahrgang), int(count)])
+        save(wb, os.path.join(target, f"{year} GjS Wetteraukreis mit GKZ.XLSX"))
+
+
+def write_kriminalstatistik(root: str, rng: np.random.Generator, years: list[int], gebiete_factor: int):
+    """kriminalstatistik_<year>.xlsx with the PKS 'T01_Kreise' two-row header layout."""
+    target = os.path.join(root, "data", "kriminalstatistik")
+    top = [
+        "Schlüssel", "Straftat", "Gemeindeschlüssel", "Stadt-/Landkreis", "Kreisart",
+        "Anzahl erfasste Fälle", "HZ",
+        "erfasste Fälle davon: Versuche", None,
+        "mit Schusswaffe", None,
+        "Aufklärung", None,
+        "Tatverdächtige", None, None,
+        "Nichtdeutsche Tatverdächtige", None,
+    ]
+    kreise = [("06440", "Wetteraukreis", "LK")]
+    for i in range(1, 25 * gebiete_factor):
+        kreise.append((f"06{400 + i:03d}", f"Landkreis {i:03d}", "LK"))
+
+    for year in years:
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(SHEET_PKS)
+        ws.append([f"Polizeiliche Kriminalstatistik {year}"])
+        ws.append(["T01 Grundtabelle - Kreise - Fallentwicklung"])
+        ws.append([])
+        ws.append(top)
+        ws.append([None] * len(top))
+        for kreis_key, kreis_name, kreisart in kreise:
+            for key, straftat in STRAFTATEN:
+                faelle = int(rng.uniform(5, 20000))
+                versuche = int(faelle * rng.uniform(0, 0.2))
+                aufgeklaert = int(faelle * rng.uniform(0.3, 0.9))
+                tv = int(aufgeklaert * rng.uniform(0.6, 1.0))
+                tv_m = int(tv * 0.75)
+                nd = int(tv * rng.uniform(0.1, 0.5))
+                ws.append([
+                    key, straftat, kreis_key, kreis_name, kreisart,
+                    faelle, round(faelle / 3.1, 1),
+                    versuche, round(100 * versuche / faelle, 1),
+                    int(rng.uniform(0, 5)), int(rng.uniform(0, 3)),
+                    aufgeklaert, round(100 * aufgeklaert / faelle, 1),
+                    tv, tv_m, tv - tv_m,
+                    nd, round(100 * nd / tv, 1) if tv else 0,
+                ])
+        save(wb, os.path.join(target, f"kriminalstatistik_{year}.xlsx"))
+
+
+def write_planungsraeume(root: str, rng: np.random.Generator, gebiete_factor: int):
+    """WK_Planungsraeume.xlsx with the 'Zuständigkeiten' sheet including 'Ergebnis' rows."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Zuständigkeiten")
+    ws.append(["Wetteraukreis - Zuständigkeiten der Planungsräume"])
+    ws.append([])
+    ws.append(["PLZ", "Gemeindeziffer", "Gemeinde", "ASD-Regionen", "ASD-Bezirke", "Soziale Hilfen", "Pflegestützpunkte"])
+    for schluessel, name in schluessel_map.items():
+        region = f"Region {'Nord' if schluessel % 2 else 'Süd'}"
+        for i in range(gebiete_factor):
+            plz = str(61000 + int(rng.uniform(0, 4000)))
+            ws.append([
+                plz, str(schluessel), name, region,
+                f"Bezirk {schluessel % 7 + 1}",
+                f"Soziale Hilfe {schluessel % 4 + 1}",
+                f"Pflegestützpunkt {schluessel % 3 + 1}",
+            ])
+        ws.append([None, None, f"{name} Ergebnis", None, None, None, None])
+    ws.append([None, None, "Gesamtergebnis", None, None, None, None])
+    save(wb, os.path.join(root, "data", "WK_Planungsraeume.xlsx"))
+
+
+def write_anbieter(root: str, rng: np.random.Generator, gemeinden_factor: int, real_cache: dict):
+    """Altersplanung_Anbieterverzeichnis.xlsx ('Anbieter') plus a matching offline geocode cache."""
+    addresses = list(real_cache.items())
+    cache = {}
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Anbieter")
+    ws.append(["Branche", "Anbieter", "Anschrift", "PLZ", "Ort", "Telefon"])
+
+    count = max(len(addresses), 40) * gemeinden_factor
+    for i in range(count):
+        if i < len(addresses):
+            address, coords = addresses[i]
+            street, plz_ort = address.rsplit(", ", 1)
+            plz, ort = plz_ort.split(" ", 1)
+        else:
+            ort = gemeinde_names(1)[i % 25]
+            street = f"Synthetische Straße {i}"
+            plz = str(61000 + i % 4000)
+            lon = rng.uniform(WETTERAU_BBOX[0], WETTERAU_BBOX[2])
+            lat = rng.uniform(WETTERAU_BBOX[1], WETTERAU_BBOX[3])
+            coords = [round(lat, 7), round(lon, 7)]
+            address = f"{street}, {plz} {ort}"
+        cache[address] = coords
+        ws.append([BRANCHEN[i % len(BRANCHEN)], f"Anbieter {i:05d}", street, plz, ort, "06031 0000"])
+
+    save(wb, os.path.join(root, "data", "Altersplanung_Anbieterverzeichnis.xlsx"))
+    with open(os.path.join(root, "geocode_cache.json"), "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False, indent=2)
+
+
+def write_csv_export(path: str, size_mb: int = 50, seed: int = 42):
+    """
+    A ';'-separated export like the Superset CSV downloads normalizer.py is used on:
+    umlauts, currency signs, padded fields and a few quoted fields with ';' or line breaks.
+    """
+    rng = np.random.default_rng(seed)
+    names = gemeinde_names(1) + ["Bad Nauheim", "Büdingen", "Gedern", "Nidda"]
+    remarks = ["", "", "", "geprüft", "Schätzung §12", "Größe in €", "Kosten in $", "  vorläufig ", "Übertrag"]
+    quoted = ['"Teil A; Teil B"', '"Zeile 1\nZeile 2"', '"Hinweis: ""vorläufig"""']
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    target = size_mb * 1024 * 1024
+    written = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write("Gemeinde;Jahr;Merkmal;Wert;Betrag;Bemerkung\n")
+        while written < target:
+            n = 10000
+            gemeinden = rng.choice(names, n)
+            jahre = rng.integers(2015, LAST_YEAR + 1, n)
+            merkmale = rng.choice(BRANCHEN + SEKTOREN, n)
+            werte = rng.integers(0, 100000, n)
+            betraege = rng.uniform(0, 1e6, n)
+            bemerkungen = rng.choice(remarks, n)
+            special = rng.random(n) < 0.01
+            lines = []
+            for i in range(n):
+                remark = rng.choice(quoted) if special[i] else bemerkungen[i]
+                lines.append(f"{gemeinden[i]};{jahre[i]};{merkmale[i]};{werte[i]};{betraege[i]:.2f} €;{remark}\n")
+            chunk = "".join(lines)
+            f.write(chunk)
+            written += len(chunk.encode("utf-8"))
+
+
+def generate(root: str, gemeinden: int = 1, years: int = 5, gebiete: int = 1, seed: int = 42):
+    """Writes the complete synthetic data root."""
+    rng = np.random.default_rng(seed)
+    year_list = list(range(LAST_YEAR - years + 1, LAST_YEAR + 1))
+
+    cache_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "geocode_cache.json")
+    with open(cache_path, "r", encoding="utf-8") as f:
+        real_cache = json.load(f)
+
+    write_arbeitsmarkt(root, rng, gemeinden)
+    write_gemband(root, rng, year_list)
+    write_dadigesamt(root, rng, gebiete)
+    write_altersverteilung(root, rng, year_list)
+    write_kriminalstatistik(root, rng, year_list, gebiete)
+    write_planungsraeume(root, rng, gebiete)
+    write_anbieter(root, rng, gemeinden, real_cache)
+    os.makedirs(os.path.join(root, "result"), exist_ok=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic source workbooks.")
+    parser.add_argument("root", help="target data root (used as working directory for the scripts)")
+    parser.add_argument("--gemeinden", type=int, default=1, help="copies of the 25 Gemeinden")
+    parser.add_argument("--years", type=int, default=5, help="number of yearly files")
+    parser.add_argument("--gebiete", type=int, default=1, help="rows per Gebiet/Jahrgang, Kreise and PLZ factor")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    generate(args.root, args.gemeinden, args.years, args.gebiete, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import pandas as pd
+
+from common.age_matrix import AgeMatrix
+
+YEARS = [2023, 2024]
+
+
+def test_mixed_gemeinde_column():
+    # Unmapped Gebiete keep their name, mapped ones carry the int Schlüssel
+    df = pd.DataFrame({
+        "Gemeinde": [6440008, "Neubaugebiet Unbekannt", 6440002, 6440008],
+        "Jahrgang": [2000, 2000, 1950, 2024],
+        "EW gesamt": [10, 5, 7, 3],
+    })
+    matrix = AgeMatrix.from_birth_years(df, YEARS)
+    assert matrix.gemeinden == [6440002, 6440008, "Neubaugebiet Unbekannt"]
+    assert matrix.count(6440008, 2024, 0) == 13
+    assert matrix.count(6440008, 2023, 0) == 10
+    assert matrix.count("Neubaugebiet Unbekannt", 2024, 20, 30) == 5
+
+
+def test_load_or_build_rebuilds_after_code_change(tmp_path, monkeypatch):
+    from common import age_matrix
+
+    source = tmp_path / "dadigesamt.xlsx"
+    source.write_bytes(b"sheet")
+    df = pd.DataFrame({"Gemeinde": [6440008], "Jahrgang": [2000], "EW gesamt": [10]})
+    builds = []
+
+    def build(source_sha256):
+        builds.append(source_sha256)
+        return AgeMatrix.from_birth_years(df, YEARS, source_sha256=source_sha256)
+
+    def load(version):
+        monkeypatch.setattr(age_matrix, "code_version", lambda path: version)
+        return age_matrix.load_or_build(str(source), "m", YEARS, build, reuse=True, directory=str(tmp_path))
+
+    load("v1")
+    load("v1")
+    assert len(builds) == 1
+    assert load("v2").code_version == "v2"
+    assert len(builds) == 2
@@ -0,0 +1,29 @@
+import pandas as pd
+
+from common.merge import merge_tables
+
+BASE = pd.DataFrame({
+    "Gemeinde": ["Friedberg", "Frankfurt am Main", "Mainz"],
+    "Jahr": [2023, 2023, 2023],
+    "x": [1, 2, 3],
+})
+OTHER = pd.DataFrame({
+    "gemeinde": ["Friedberg (Hessen)", "Frankfurt  am main", "Köln"],
+    "year": [2023, 2023, 2023],
+    "y": [10, 20, 30],
+})
+
+
+def test_names_outside_the_mapping_join_on_the_name():
+    merged, report = merge_tables({"base": BASE, "other": OTHER})
+    assert merged["y"].tolist()[:2] == [10, 20]
+    assert pd.isna(merged["y"].iloc[2])
+    assert report["other"]["name_keys"] == 2
+    assert report["other"]["missing_keys"]["examples"] == [("mainz", 2023)]
+    assert report["other"]["extra_keys"]["examples"] == [("köln", 2023)]
+
+
+def test_inner_join_keeps_rows_matched_by_name():
+    merged, _ = merge_tables({"base": BASE, "other": OTHER}, how="inner")
+    assert merged["Gemeinde"].tolist() == ["Friedberg", "Frankfurt am Main"]
+    assert merged["y"].tolist() == [10, 20]
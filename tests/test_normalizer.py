@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+import normalizer
+from benchmark import legacy_normalize_file
+
+# Fields with quotes that csv.reader treats differently: stray quotes inside unquoted
+# fields, quoted fields with line breaks, delimiters and escaped quotes
+FIELDS = [
+    "Nidda", "Büdingen", "34920", 'Rohr 5" lang', '12"', '"Zeile 1\nZeile 2"""',
+    '"a;b"', '"q"x"y', "  Straße 3  ", "€ 5", "",
+]
+
+
+def write_export(path, rows: int, seed: int = 1):
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        for i in range(rows):
+            f.write(";".join(rng.choice(FIELDS) for _ in range(4)) + ("\r\n" if i % 3 else "\n"))
+
+
+@pytest.mark.parametrize("chunk_size", [7, 64, 4096, normalizer.CHUNK_SIZE])
+def test_stray_quotes_match_legacy(tmp_path, chunk_size):
+    source = tmp_path / "export.csv"
+    write_export(source, 20000)
+    legacy_normalize_file(source, tmp_path / "legacy.csv")
+    normalizer.normalize_file(str(source), str(tmp_path / "chunked.csv"), chunk_size=chunk_size)
+    assert (tmp_path / "chunked.csv").read_bytes() == (tmp_path / "legacy.csv").read_bytes()
+
+
+def test_record_end_ignores_stray_quotes():
+    data = b'Nidda;Rohr 5" lang\nNidda;34920;"Zeile 1\nZeile 2""";x\nrest'
+    assert normalizer.record_end(data) == (data.index(b"rest"), -1)
+
+
+def test_unclosed_quoted_field_is_an_error(tmp_path):
+    source = tmp_path / "open.csv"
+    source.write_bytes(b'a;"open\n' + b"x;y\n" * 100_000)
+    with pytest.raises(ValueError, match="not closed"):
+        normalizer.normalize_file(str(source), str(tmp_path / "out.csv"), chunk_size=4096)
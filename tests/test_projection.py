@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.age_matrix import AgeMatrix
+from common.projection import MAX_AGE
+from bevoelkerungsprojektion import projection_table
+
+BOUNDS = [0, 65]
+YEARS = [2021, 2022, 2023, 2024]
+
+
+def snapshot_matrix() -> AgeMatrix:
+    # One dadigesamt-like snapshot: 100 inhabitants per Jahrgang
+    jahrgaenge = np.arange(2024 - MAX_AGE - 5, 2025)
+    df = pd.DataFrame({"Gemeinde": 6440008, "Jahrgang": jahrgaenge, "EW gesamt": 100})
+    return AgeMatrix.from_birth_years(df, YEARS)
+
+
+def district_matrix(survival: float = 0.9) -> AgeMatrix:
+    # Yearly district files in which every cohort aged 65+ shrinks by 10 % per year
+    rows = []
+    for year in YEARS:
+        for age in range(MAX_AGE + 5):
+            count = 1000 * survival ** max(0, age - 64 - (2024 - year))
+            rows.append({"Gemeinde": 6440, "Jahr": year, "Jahrgang": year - age, "EW gesamt": count})
+    return AgeMatrix.from_birth_years(pd.DataFrame(rows), YEARS, year_column="Jahr")
+
+
+def test_stichtage():
+    assert snapshot_matrix().stichtage == [2024]
+    assert district_matrix().stichtage == YEARS
+
+
+def test_single_stichtag_needs_survival_rates():
+    with pytest.raises(ValueError, match="one Stichtag"):
+        projection_table(snapshot_matrix(), 3, BOUNDS, 1.0, 1.0, 1.0)
+
+
+def test_single_stichtag_uses_district_survival_without_migration():
+    table = projection_table(snapshot_matrix(), 3, BOUNDS, 1.0, 1.0, 1.0, district_matrix())
+    old = table["65+"].to_numpy()
+    # Without deaths the 65+ would grow by the 100 people turning 65 every year
+    assert (np.diff(old) < 100).all()
+    assert table["raten_basis"].iloc[0] == "Stichtag 2024, Überleben Kreis 2021-2024, Migration 0"
+
+
+def test_survival_factor_changes_the_projection():
+    low, high = (projection_table(snapshot_matrix(), 3, BOUNDS, factor, 1.0, 1.0, district_matrix())
+                 for factor in (0.95, 1.0))
+    assert low["gesamt"].iloc[-1] < high["gesamt"].iloc[-1]
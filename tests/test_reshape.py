@@ -0,0 +1,34 @@
+import io
+
+import pandas as pd
+import pytest
+
+from common.reshape import melt_chunks, write_long
+
+# Integer columns whose later rows have a gap (read as float in that chunk only)
+WIDE = "gemeinde,jahr,a,b\n" + "".join(f"G{i},{2020 + i},{i},{i * 10}\n" for i in range(6)) + "G6,2026,,5\nG7,2027,8,9\n"
+
+
+def chunks(text: str = WIDE):
+    return pd.read_csv(io.StringIO(text), chunksize=4)
+
+
+def test_gap_in_later_chunk_stays_missing():
+    long = pd.concat(melt_chunks(chunks(), ["gemeinde", "jahr"]), ignore_index=True)
+    long = long.astype({"gemeinde": object, "variable": object, "value": "float64"})
+    expected = pd.read_csv(io.StringIO(WIDE)).melt(["gemeinde", "jahr"])
+    merged = expected.merge(long, on=["gemeinde", "jahr", "variable"], suffixes=("", "_chunked"))
+    assert len(merged) == len(expected) == len(long)
+    assert merged["value_chunked"].tolist() == pytest.approx(merged["value"].tolist(), nan_ok=True)
+
+
+def test_gap_keeps_integer_output(tmp_path):
+    write_long(melt_chunks(chunks(), ["gemeinde", "jahr"]), str(tmp_path / "long.csv"))
+    values = (tmp_path / "long.csv").read_text().splitlines()
+    assert "G6,2026,a," in values and "G7,2027,a,8" in values
+
+
+def test_fraction_in_later_chunk_widens_to_float():
+    parts = list(melt_chunks(chunks(WIDE.replace("G7,2027,8,9", "G7,2027,8.5,9")), ["gemeinde", "jahr"]))
+    assert parts[-1]["value"].dtype.kind == "f"
+    assert 8.5 in parts[-1]["value"].tolist()
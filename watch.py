@@ -0,0 +1,213 @@
+"""
+Watch mode: reruns the affected scripts when input files change.
+
+One long-running process polls the input folders under data/ and, once a new,
+modified or removed input file has settled, runs the scripts that read it. The
+scripts are imported once and stay loaded, so pandas, the Gemeinde mappings and the
+polygon and geometry stores are only loaded at startup. Every run uses --incremental
+and --memo with memoized results kept in memory: only the year files that changed
+are read again, unchanged workbooks come from memory. With DATEN_METRICS=1 every run
+writes its own metrics report (see common/instrumentation.py).
+
+A file counts as settled when its size and modification time did not change for
+--debounce seconds, so files that are still being copied are not read half-written.
+Excel lock files (~$...) and files written by the scripts themselves do not match the
+watched patterns.
+
+Usage (from the data root, like the scripts):
+    python3 watch.py [--interval 1] [--debounce 2] [--once] [-- <script options, e.g. --formats=parquet>]
+"""
+
+import argparse
+import importlib.util
+import logging
+import os
+import re
+import sys
+import time
+
+from common import memo
+from common.geometry import gemeinde_geometry
+from common.instrumentation import run_instrumented
+from common.memo import code_version, memo_stats
+from common.polygons import polygon_store
+from common.population import population_index
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# (input folder or file, file name pattern, scripts reading it)
+WATCHES = [
+    ("data/arbeitsortbeschäftigung", r"Arbeitsmarkt-kommunal.*\.xlsx$",
+     ["arbeitsortbeschäftigung", "arbeitslose-wetterau", "gender_distribution", "arbeitsmarkt-gesamt", "arbeitsmarkt-gesamt-2"]),
+    ("data/gemband", r"[^~].*\.(xlsx|xlsb)$", ["arbeitsmarkt-gesamt", "arbeitsmarkt-gesamt-2"]),
+    ("data/altersverteilung", r"\d{4} GjS Wetteraukreis mit GKZ\.XLSX$", ["altersverteilung"]),
+    ("data/kriminalstatistik", r"kriminalstatistik_\d{4}\.xlsx$", ["kriminalstatistik"]),
+    ("data", r"geburtsjahrgangsstatistik\.xlsx$", ["geburtsjahrgangsstatistik"]),
+    ("data", r"Altersplanung_Anbieterverzeichnis\.xlsx$", ["altersplanung"]),
+    ("data", r"WK_Planungsraeume\.xlsx$", ["planning-areas-matching", "altersplanung"]),
+]
+
+# Scripts that read the results of another script (population index from the age matrix)
+DEPENDENTS = {
+    "geburtsjahrgangsstatistik": ["arbeitslose-wetterau", "kriminalstatistik", "altersplanung", "bevoelkerungsprojektion"],
+}
+
+# Entry point per script, in the order they run within one batch
+ENTRY_POINTS = {
+    "geburtsjahrgangsstatistik": "parse_excel",
+    "altersverteilung": "main",
+    "arbeitsortbeschäftigung": "parse_arbeitsmarkt",
+    "arbeitslose-wetterau": "main",
+    "gender_distribution": "main",
+    "arbeitsmarkt-gesamt": "main",
+    "arbeitsmarkt-gesamt-2": "main",
+    "kriminalstatistik": "main",
+    "planning-areas-matching": "main",
+    "altersplanung": "parse_adressen",
+    "bevoelkerungsprojektion": "main",
+}
+
+DEFAULT_INTERVAL = 1.0
+DEFAULT_DEBOUNCE = 2.0
+
+
+def snapshot() -> dict[str, tuple[int, int]]:
+    """(size, mtime) of every watched input file."""
+    files = {}
+    for folder, pattern, _ in WATCHES:
+        if not os.path.isdir(folder):
+            continue
+        for entry in os.scandir(folder):
+            if entry.is_file() and re.match(pattern, entry.name):
+                stat = entry.stat()
+                files[entry.path] = (stat.st_size, stat.st_mtime_ns)
+    return files
+
+
+def affected_scripts(paths) -> list[str]:
+    """Scripts reading any of `paths` plus their dependents, in ENTRY_POINTS order."""
+    scripts = set()
+    for path in paths:
+        folder, name = os.path.split(path)
+        for watched, pattern, readers in WATCHES:
+            if os.path.normpath(folder) == os.path.normpath(watched) and re.match(pattern, name):
+                scripts.update(readers)
+    for script in list(scripts):
+        scripts.update(DEPENDENTS.get(script, []))
+    return [s for s in ENTRY_POINTS if s in scripts]
+
+
+class Watcher:
+    """Settles file changes between polls: a change is reported once it is `debounce` seconds old."""
+
+    def __init__(self, debounce: float = DEFAULT_DEBOUNCE):
+        self.debounce = debounce
+        self.known = snapshot()
+        self.pending = {}   # path -> (state, first seen unchanged); state None = removed
+
+    def poll(self) -> list[str]:
+        """Paths whose change has settled since the last poll."""
+        now = time.monotonic()
+        current = snapshot()
+        for path in set(current) | set(self.known) | set(self.pending):
+            state = current.get(path)
+            if state == self.known.get(path):
+                self.pending.pop(path, None)
+            elif path not in self.pending or self.pending[path][0] != state:
+                self.pending[path] = (state, now)
+
+        settled = [p for p, (state, since) in self.pending.items() if state is None or now - since >= self.debounce]
+        for path in settled:
+            state, _ = self.pending.pop(path)
+            if state is None:
+                self.known.pop(path, None)
+            else:
+                self.known[path] = state
+        return sorted(settled)
+
+
+class ScriptRunner:
+    """Keeps the scripts imported and calls their entry points with the watch options."""
+
+    def __init__(self, script_args: list[str]):
+        self.script_args = script_args
+        self.modules = {}   # name -> (mtime of the script file, module)
+
+    def module(self, name: str):
+        path = os.path.join(REPO_DIR, f"{name}.py")
+        mtime = os.stat(path).st_mtime_ns
+        if name not in self.modules or self.modules[name][0] != mtime:
+            module_name = "watch_" + "".join(c if c.isalnum() else "_" for c in name)
+            spec = importlib.util.spec_from_file_location(module_name, path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self.modules[name] = (mtime, module)
+        return self.modules[name][1]
+
+    def run(self, name: str) -> bool:
+        """Runs one script; errors are reported and do not stop the watch."""
+        # Results of earlier runs (age matrix) and edited scripts must not be served from caches
+        population_index.cache_clear()
+        code_version.cache_clear()
+        before = memo_stats()
+        argv = sys.argv
+        sys.argv = [os.path.join(REPO_DIR, f"{name}.py"), "--incremental", "--memo", *self.script_args]
+        started = time.perf_counter()
+        try:
+            run_instrumented(getattr(self.module(name), ENTRY_POINTS[name]), name)
+            ok = True
+        except (Exception, SystemExit) as e:
+            logging.exception(f"[watch] {name} failed: {e}")
+            ok = False
+        finally:
+            sys.argv = argv
+
+        hits = sum(v["hits"] - before.get(k, {}).get("hits", 0) for k, v in memo_stats().items())
+        misses = sum(v["misses"] - before.get(k, {}).get("misses", 0) for k, v in memo_stats().items())
+        print(f"[watch] {name} {'done' if ok else 'FAILED'} in {time.perf_counter() - started:.1f} s "
+              f"(memo: {hits} hit(s), {misses} miss(es))")
+        return ok
+
+
+def warm_up():
+    """Loads the shared stores once, so the first run after a file change is fast as well."""
+    polygon_store()
+    gemeinde_geometry()
+    import common.mapping  # noqa: F401  (Gemeinde aliases and mapping tables)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rerun the affected scripts when input files under data/ change.")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="seconds between polls (default: 1)")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE,
+                        help="seconds a changed file must stay unchanged before it is read (default: 2)")
+    parser.add_argument("--once", action="store_true", help="run all watched scripts once, then exit")
+    parser.add_argument("script_args", nargs=argparse.REMAINDER, help="options passed to the scripts (after --)")
+    args = parser.parse_args()
+    script_args = [a for a in args.script_args if a != "--"]
+
+    memo.KEEP_IN_MEMORY = True
+    warm_up()
+    runner = ScriptRunner(script_args)
+
+    if args.once:
+        for name in affected_scripts(snapshot()):
+            runner.run(name)
+        return
+
+    watcher = Watcher(args.debounce)
+    print(f"[watch] watching {len(watcher.known)} input file(s), Ctrl+C to stop")
+    try:
+        while True:
+            changed = watcher.poll()
+            if changed:
+                print(f"[watch] changed: {', '.join(changed)}")
+                for name in affected_scripts(changed):
+                    runner.run(name)
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        print("[watch] stopped")
+
+
+if __name__ == "__main__":
+    main()